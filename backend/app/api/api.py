@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import articles, analyze, consensus
+from app.api.endpoints import articles, analyze, consensus, metrics
 
 # Create main API router
 api_router = APIRouter()
@@ -24,4 +24,11 @@ api_router.include_router(
     consensus.router,
     prefix="/consensus",
     tags=["consensus"]
-) 
\ No newline at end of file
+)
+
+# Include operational metrics endpoints
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
\ No newline at end of file
@@ -1,11 +1,13 @@
-from typing import List, Optional
+import json
+from typing import Iterator, List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
 
-from app.db.session import get_db
-from app.models.stance import Classification, PoliticalStance
-from app.models.database import ArticleModel, ClassificationModel
+from app.db.session import SessionLocal, get_db
+from app.models.stance import Classification
+from app.services.classification_service import ClassificationService
 
 router = APIRouter()
 
@@ -13,71 +15,54 @@ router = APIRouter()
 async def analyze_articles(
     topic: Optional[str] = Query(None, description="Topic to analyze articles about"),
     days_back: int = Query(7, description="Number of days to look back for articles"),
+    stream: bool = Query(False, description="Stream newline-delimited JSON progress instead of returning classifications"),
     db: Session = Depends(get_db)
 ) -> List[Classification]:
     """
     Analyze political alignment of articles.
+
+    Unclassified articles in the window are classified in fixed-size chunks,
+    each committed separately. With stream=true the response is a stream of
+    {"processed", "total"} progress lines; otherwise the classifications of
+    every article in the window are returned once all chunks are done.
     """
-    try:
-        # Get articles to analyze
-        query = db.query(ArticleModel)
-        if topic:
-            query = query.filter(ArticleModel.title.ilike(f"%{topic}%"))
-        query = query.filter(
-            ArticleModel.published_at >= datetime.utcnow() - timedelta(days=days_back)
+    if stream:
+        return StreamingResponse(
+            stream_analysis_progress(topic, days_back),
+            media_type="application/x-ndjson"
         )
-        articles = query.all()
-        
-        # Analyze each article
-        classifications = []
-        for article in articles:
-            # Skip if already classified
-            if article.classification:
-                classifications.append(article.classification)
-                continue
-                
-            # Analyze article content
-            stance = analyze_article(article)
-            
-            # Create classification
-            classification = Classification(
-                article_id=article.id,
-                stance=stance,
-                confidence=0.8  # Placeholder confidence score
-            )
-            
-            # Save to database
-            db_classification = ClassificationModel(
-                article_id=classification.article_id,
-                stance=classification.stance,
-                confidence=classification.confidence
-            )
-            db.add(db_classification)
-            classifications.append(classification)
-            
-        db.commit()
-        return classifications
-        
+
+    try:
+        # Run the blocking pipeline off the event loop so other requests keep being served
+        return await run_in_threadpool(classify_window, db, topic, days_back)
+
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Error analyzing articles: {str(e)}"
         )
 
-def analyze_article(article: ArticleModel) -> PoliticalStance:
-    """Analyze an article's political stance."""
-    # Simple implementation using keyword matching
-    left_keywords = ["democrat", "progressive", "liberal", "left", "socialist"]
-    right_keywords = ["republican", "conservative", "right", "trump", "gop"]
-    
-    content = (article.title + " " + (article.description or "") + " " + (article.content or "")).lower()
-    
-    left_count = sum(1 for word in left_keywords if word in content)
-    right_count = sum(1 for word in right_keywords if word in content)
-    
-    if left_count > right_count:
-        return PoliticalStance.LEFT
-    elif right_count > left_count:
-        return PoliticalStance.RIGHT
-    else:
-        return PoliticalStance.CENTER 
\ No newline at end of file
+def classify_window(db: Session, topic: Optional[str], days_back: int) -> List[Classification]:
+    """Classify the window to completion and return its classifications."""
+    for _ in ClassificationService.classify_unclassified(db, topic, days_back):
+        pass
+    return ClassificationService.get_classifications(db, topic, days_back)
+
+def stream_analysis_progress(topic: Optional[str], days_back: int) -> Iterator[str]:
+    """
+    Yield one JSON progress line per classified chunk.
+
+    Runs on its own session because the request session is closed before a
+    streaming body is sent.
+    """
+    session = SessionLocal()
+    try:
+        for progress in ClassificationService.classify_unclassified(session, topic, days_back):
+            yield json.dumps(progress) + "\n"
+        yield json.dumps({"done": True}) + "\n"
+    except Exception as e:
+        session.rollback()
+        yield json.dumps({"error": f"Error analyzing articles: {str(e)}"}) + "\n"
+    finally:
+        session.close()
@@ -1,90 +1,68 @@
-from typing import List, Optional
+from typing import Iterator, List, Literal, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from datetime import date, datetime
 import io
 import csv
-import time
 import re
 
-from app.db.session import get_db
+from app.core.data_cleaner import DataCleaner
+from app.core.datetimes import parse_datetime, to_naive_utc
+from app.core.urls import url_hash
+from app.db.session import SessionLocal, get_async_db, get_db
 from app.models import Article, PoliticalStance
-from app.models.database import ArticleModel, ClassificationModel
+from app.models.database import ArticleMinHashBandModel, ArticleModel, ClassificationModel
 from app.services.news_client import NewsClient
 from app.services.article_service import ArticleService
+from app.services.search import ArticleSearch
+from app.services.pagination import KeysetPagination
 
 router = APIRouter()
 
-def parse_datetime(date_str: str) -> datetime:
-    """
-    Parse different datetime formats and return a datetime object.
-    """
-    if not date_str:
-        return datetime.utcnow()
-    
-    # Try different formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%SZ",  # Standard ISO format with Z
-        "%Y-%m-%dT%H:%M:%S.%fZ", # ISO format with milliseconds and Z
-        "%Y-%m-%dT%H:%M:%S", # ISO format without Z
-        "%Y-%m-%dT%H:%M:%S.%f", # ISO format with milliseconds without Z
-        "%Y-%m-%d %H:%M:%S", # Simple format
-        "%Y-%m-%d", # Just date
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    
-    # If all formats fail, try to parse ISO format with timezone offset
-    try:
-        # Replace Z with +00:00 (UTC) if present
-        if date_str.endswith('Z'):
-            date_str = date_str[:-1] + '+00:00'
-        
-        # Parse ISO format with timezone info
-        return datetime.fromisoformat(date_str)
-    except ValueError:
-        pass
-    
-    # If all parsing attempts fail, return current time
-    print(f"Could not parse datetime: {date_str}, using current time")
-    return datetime.utcnow()
+# Number of rows fetched per round trip and written per chunk by the CSV export
+EXPORT_BATCH_SIZE = 1000
 
 @router.get("/", response_model=List[Article])
 async def get_articles(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     stance: Optional[PoliticalStance] = Query(None, description="Filter articles by political stance"),
-    search: Optional[str] = Query(None, description="Search query to filter articles"),
+    search: Optional[str] = Query(None, description="Full-text search query (supports \"phrases\", prefix* and -exclusions)"),
     source: Optional[str] = Query(None, description="Filter by news source"),
     start_date: Optional[date] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date for filtering (YYYY-MM-DD)"),
     skip: int = Query(0, ge=0, description="Number of items to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    order: Optional[Literal["newest", "relevance"]] = Query(None, description="Sort order (default: relevance when searching, otherwise newest)")
 ) -> List[Article]:
     """
     Get articles with optional filtering by various criteria.
+
+    Newest-first pages carry an X-Next-Cursor header; pass it back as `cursor`
+    to fetch the next page at constant cost. `skip` remains supported.
     """
+    order = order or ("relevance" if search and not cursor else "newest")
+    if cursor and order == "relevance":
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is only available with order=newest"
+        )
+
     try:
         # Start with base query
-        query = db.query(ArticleModel)
+        query = select(ArticleModel)
         
         # Apply filters
         if stance:
             query = query.join(ClassificationModel).filter(ClassificationModel.stance == stance)
             
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    ArticleModel.title.ilike(search_term),
-                    ArticleModel.description.ilike(search_term),
-                    ArticleModel.content.ilike(search_term)
-                )
-            )
+            query = ArticleSearch.apply(query, search, db.bind.dialect.name, rank=order == "relevance")
             
         if source:
             query = query.filter(ArticleModel.source_name.ilike(f"%{source}%"))
@@ -96,10 +74,20 @@ async def get_articles(
             query = query.filter(ArticleModel.published_at <= end_date)
         
         # Apply pagination
-        articles = query.offset(skip).limit(limit).all()
+        if order == "newest":
+            query = KeysetPagination.apply(query, cursor)
+        result = await db.execute(query.offset(skip).limit(limit))
+        articles = result.scalars().all()
+
+        if order == "newest":
+            next_cursor = KeysetPagination.next_cursor(articles, limit)
+            if next_cursor:
+                response.headers[KeysetPagination.HEADER] = next_cursor
         
         return articles
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -109,11 +97,15 @@ async def get_articles(
 @router.post("/save")
 async def save_articles(
     articles: List[Article],
+    bulk: bool = Query(False, description="Use the set-based bulk ingestion path (one dedup query and one INSERT per chunk)"),
     db: Session = Depends(get_db)
 ) -> dict:
     """
     Save articles to the database.
     """
+    if bulk:
+        return save_articles_bulk(articles, db)
+
     try:
         saved_count = 0
         skipped_count = 0
@@ -134,8 +126,9 @@ async def save_articles(
                 
                 print(f"URL: {article_url}")
                 
-                # Check if article already exists by URL
-                existing_article = db.query(ArticleModel).filter(ArticleModel.url == article_url).first()
+                # Check if article already exists by canonical URL (one indexed probe on the fixed-width hash)
+                article_hash = url_hash(article_url)
+                existing_article = db.query(ArticleModel).filter(ArticleModel.url_hash == article_hash).first()
                 
                 if existing_article:
                     print(f"Article with URL {article_url} already exists")
@@ -150,12 +143,12 @@ async def save_articles(
                     continue
                 
                 # Generate a unique ID if not present
-                article_id = article.id if hasattr(article, 'id') and article.id else f"article_{saved_count}_{int(time.time())}"
+                article_id = article.id if hasattr(article, 'id') and article.id else article_hash.hex()
                 print(f"Using ID: {article_id}")
                 
                 # Ensure published_at is a valid datetime
                 try:
-                    published_at = parse_datetime(article.published_at)
+                    published_at = to_naive_utc(parse_datetime(article.published_at))
                     print(f"Parsed date: {published_at}")
                 except Exception as e:
                     print(f"Error parsing date '{article.published_at}': {str(e)}")
@@ -169,6 +162,7 @@ async def save_articles(
                     description=article.description,
                     content=article.content if hasattr(article, 'content') else None,
                     url=article_url,
+                    url_hash=article_hash,
                     source_id=article.source_id if hasattr(article, 'source_id') else None,
                     source_name=article.source_name,
                     author=article.author if hasattr(article, 'author') else None,
@@ -223,34 +217,78 @@ async def save_articles(
             detail=error_msg
         )
 
+def save_articles_bulk(articles: List[Article], db: Session) -> dict:
+    """
+    Save articles through the set-based bulk path of ArticleService.
+    """
+    try:
+        print(f"Received {len(articles)} articles to bulk save")
+        summary = ArticleService.bulk_save_articles(db, articles)
+
+        result = {
+            "message": f"Successfully saved {summary['saved']} articles to the database",
+            "saved": summary["saved"],
+            "skipped": summary["skipped"],
+            "errored": summary["errored"],
+            "results": summary["results"]
+        }
+
+        if summary["skipped"] > 0:
+            result["message"] += f" (skipped {summary['skipped']} duplicates)"
+
+        errors = [
+            f"Error with article '{articles[r['index']].title}': {r['detail']}"
+            for r in summary["results"] if r["status"] == "error"
+        ]
+        if errors:
+            result["errors"] = errors
+
+        return result
+
+    except Exception as e:
+        db.rollback()
+        error_msg = f"Error saving articles: {str(e)}"
+        print(error_msg)
+        raise HTTPException(
+            status_code=500,
+            detail=error_msg
+        )
+
 @router.get("/export")
 async def export_articles(
     db: Session = Depends(get_db),
     stance: Optional[PoliticalStance] = Query(None, description="Filter articles by political stance"),
-    search: Optional[str] = Query(None, description="Search query to filter articles"),
+    search: Optional[str] = Query(None, description="Full-text search query (supports \"phrases\", prefix* and -exclusions)"),
     source: Optional[str] = Query(None, description="Filter by news source"),
     start_date: Optional[date] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date for filtering (YYYY-MM-DD)")
 ):
     """
     Export articles to CSV with optional filtering.
+
+    Rows are streamed in batches through a server-side cursor, so memory use
+    stays constant regardless of how many articles match.
     """
     try:
-        # Build query
-        query = db.query(ArticleModel)
+        # Build query selecting only the exported columns, with the
+        # classification joined in the same query instead of loaded per row
+        query = db.query(
+            ArticleModel.id,
+            ArticleModel.title,
+            ArticleModel.description,
+            ArticleModel.source_name,
+            ArticleModel.author,
+            ArticleModel.published_at,
+            ArticleModel.url,
+            ClassificationModel.stance,
+            ClassificationModel.confidence
+        ).outerjoin(ClassificationModel)
         
         if stance:
-            query = query.join(ClassificationModel).filter(ClassificationModel.stance == stance)
+            query = query.filter(ClassificationModel.stance == stance)
             
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    ArticleModel.title.ilike(search_term),
-                    ArticleModel.description.ilike(search_term),
-                    ArticleModel.content.ilike(search_term)
-                )
-            )
+            query = ArticleSearch.apply(query, search, db.get_bind().dialect.name, rank=False)
             
         if source:
             query = query.filter(ArticleModel.source_name.ilike(f"%{source}%"))
@@ -261,23 +299,47 @@ async def export_articles(
         if end_date:
             query = query.filter(ArticleModel.published_at <= end_date)
         
-        # Get articles
-        articles = query.all()
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return StreamingResponse(
+            stream_articles_csv(query),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": "attachment; filename=articles.csv"
+            }
+        )
         
-        # Write header
-        writer.writerow([
-            "ID", "Title", "Description", "Source", "Author",
-            "Published At", "URL", "Political Stance", "Confidence"
-        ])
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error exporting articles: {str(e)}"
+        )
+
+def stream_articles_csv(query) -> Iterator[str]:
+    """
+    Yield CSV text for the articles of a query, one batch of rows at a time.
+
+    The request session is closed before a streaming body is sent, so the
+    query runs on its own session for the lifetime of the stream.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    
+    # Write header
+    writer.writerow([
+        "ID", "Title", "Description", "Source", "Author",
+        "Published At", "URL", "Political Stance", "Confidence"
+    ])
+    
+    session = SessionLocal()
+    try:
+        articles = query.with_session(session).execution_options(
+            stream_results=True,
+            yield_per=EXPORT_BATCH_SIZE
+        )
         
         # Write data
-        for article in articles:
-            stance = article.classification.stance if article.classification else "Unknown"
-            confidence = article.classification.confidence if article.classification else 0.0
+        for count, article in enumerate(articles, start=1):
+            stance = article.stance if article.stance else "Unknown"
+            confidence = article.confidence if article.stance else 0.0
             
             writer.writerow([
                 article.id,
@@ -290,27 +352,20 @@ async def export_articles(
                 stance,
                 confidence
             ])
+            
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
         
-        # Create response
-        content = output.getvalue()
+        yield output.getvalue()
+    finally:
         output.close()
-        
-        return Response(
-            content=content,
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": "attachment; filename=articles.csv"
-            }
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error exporting articles: {str(e)}"
-        )
+        session.close()
 
 @router.post("/collect")
 async def collect_articles(
+    response: Response,
     topic: Optional[str] = Query(None, description="Topic to collect articles about"),
     category: Optional[str] = Query(None, description="Category for top headlines"),
     language: str = Query("en", description="Language code (e.g., 'en' for English, 'es' for Spanish)"),
@@ -318,18 +373,44 @@ async def collect_articles(
     page_size: int = Query(100, description="Number of articles per page"),
     page: int = Query(1, description="Page number"),
     country: Optional[str] = Query(None, description="Country code for top headlines (e.g., 'us')"),
+    all_pages: bool = Query(False, description="Fetch every page concurrently instead of only `page`"),
+    max_results: Optional[int] = Query(None, ge=1, description="Maximum number of results when all_pages is set"),
+    save: bool = Query(False, description="Also clean the collected articles and save them to the database"),
     db: Session = Depends(get_db)
 ) -> List[Article]:
     """
     Collect articles using either topic search or top headlines.
+
+    With save=true the articles are cleaned, bulk-saved and returned as cleaned;
+    the X-Saved-Count and X-Skipped-Count headers report the outcome.
     """
     # Initialize NewsClient
     news_client = NewsClient()
     
     # Get articles based on provided parameters
-    if topic:
-        # Use get_articles_by_topic
-        articles = news_client.get_articles_by_topic(
+    if all_pages and topic:
+        articles = [
+            article async for article in news_client.iter_articles_by_topic(
+                topic=topic,
+                language=language,
+                days_back=days_back,
+                page_size=page_size,
+                max_results=max_results
+            )
+        ]
+    elif all_pages and category:
+        articles = [
+            article async for article in news_client.iter_top_headlines(
+                category=category,
+                country=country,
+                page_size=page_size,
+                max_results=max_results
+            )
+        ]
+    elif topic:
+        # Use get_articles_by_topic; the sync client (and its rate limiter) blocks, so run it off the event loop
+        articles = await run_in_threadpool(
+            news_client.get_articles_by_topic,
             topic=topic,
             language=language,
             days_back=days_back,
@@ -337,8 +418,9 @@ async def collect_articles(
             page=page
         )
     elif category:
-        # Use get_top_headlines
-        articles = news_client.get_top_headlines(
+        # Use get_top_headlines, also off the event loop
+        articles = await run_in_threadpool(
+            news_client.get_top_headlines,
             category=category,
             country=country,
             page_size=page_size,
@@ -350,23 +432,40 @@ async def collect_articles(
             detail="Either 'topic' or 'category' must be provided"
         )
     
+    if save:
+        # Cleaning and saving block on the cleaning pool and the database, so run them off the event loop
+        articles = await run_in_threadpool(DataCleaner().clean_articles, articles)
+        result = await run_in_threadpool(save_articles_bulk, articles, db)
+        response.headers["X-Saved-Count"] = str(result["saved"])
+        response.headers["X-Skipped-Count"] = str(result["skipped"])
+    
     return articles 
 
 @router.get("/saved", response_model=List[Article])
 async def get_saved_articles(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of articles to return"),
-    offset: int = Query(0, ge=0, description="Number of articles to skip")
+    offset: int = Query(0, ge=0, description="Number of articles to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page")
 ) -> List[Article]:
     """
     Get articles that have been saved to the database.
     """
     try:
         # Get saved articles with pagination, ordered by published_at descending
-        articles = db.query(ArticleModel).order_by(ArticleModel.published_at.desc()).offset(offset).limit(limit).all()
+        query = KeysetPagination.apply(select(ArticleModel), cursor)
+        result = await db.execute(query.offset(offset).limit(limit))
+        articles = result.scalars().all()
+
+        next_cursor = KeysetPagination.next_cursor(articles, limit)
+        if next_cursor:
+            response.headers[KeysetPagination.HEADER] = next_cursor
         
         return articles
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         error_msg = f"Error retrieving saved articles: {str(e)}"
         print(error_msg)
@@ -386,7 +485,9 @@ async def clear_database(
         # Count articles before deletion
         article_count = db.query(ArticleModel).count()
         
-        # Delete all articles
+        # Delete all articles, after their near-duplicate band rows (tables created
+        # before the foreign key cascaded, and SQLite without foreign keys, keep them otherwise)
+        db.query(ArticleMinHashBandModel).delete()
         db.query(ArticleModel).delete()
         db.commit()
         
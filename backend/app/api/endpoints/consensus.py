@@ -1,33 +1,38 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
-from datetime import datetime
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+import uuid
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.stance import Consensus, PoliticalStance
-from app.models.database import ArticleModel, ConsensusModel
+from app.models.database import ArticleModel, ClassificationModel, ConsensusModel
+from app.services.search import ArticleSearch
 
 router = APIRouter()
 
+# Maximum number of articles read per stance; extract_key_points keeps at most
+# 10 points, so only the newest few articles of each stance are ever needed
+STANCE_ARTICLE_CAP = 25
+
 @router.get("/", response_model=List[Consensus])
 async def get_consensus(
     topic: str = Query(..., description="Topic to find consensus about"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     days_back: int = Query(7, description="Number of days to look back for articles")
 ) -> List[Consensus]:
     """
     Find consensus points among different political viewpoints for a given topic.
     """
     try:
-        # Get articles about the topic
-        articles = db.query(ArticleModel).filter(
-            ArticleModel.published_at >= datetime.utcnow() - timedelta(days=days_back)
-        ).all()
+        # Get the newest topic-matching articles per stance in one windowed query
+        articles = await fetch_stance_articles(db, topic, days_back)
         
         # Group articles by stance
-        left_articles = [a for a in articles if a.classification and a.classification.stance == PoliticalStance.LEFT]
-        center_articles = [a for a in articles if a.classification and a.classification.stance == PoliticalStance.CENTER]
-        right_articles = [a for a in articles if a.classification and a.classification.stance == PoliticalStance.RIGHT]
+        left_articles = articles[PoliticalStance.LEFT]
+        center_articles = articles[PoliticalStance.CENTER]
+        right_articles = articles[PoliticalStance.RIGHT]
         
         # Extract key points from each stance
         left_points = extract_key_points(left_articles)
@@ -59,7 +64,7 @@ async def get_consensus(
             common_ground=consensus.common_ground
         )
         db.add(db_consensus)
-        db.commit()
+        await db.commit()
         
         return [consensus]
         
@@ -69,6 +74,44 @@ async def get_consensus(
             detail=f"Error finding consensus: {str(e)}"
         )
 
+async def fetch_stance_articles(db: AsyncSession, topic: str, days_back: int, cap: int = STANCE_ARTICLE_CAP) -> Dict[PoliticalStance, list]:
+    """
+    Fetch the content of the newest topic-matching articles for each stance.
+
+    Uses ROW_NUMBER() partitioned by stance so the database returns at most
+    `cap` rows per stance, selecting only the content column.
+
+    Returns:
+        Dict mapping LEFT/CENTER/RIGHT to rows with a `content` attribute
+    """
+    ranked = select(
+        ClassificationModel.stance,
+        ArticleModel.content,
+        func.row_number().over(
+            partition_by=ClassificationModel.stance,
+            order_by=(ArticleModel.published_at.desc(), ArticleModel.id.desc())
+        ).label("position")
+    ).join(
+        ClassificationModel, ClassificationModel.article_id == ArticleModel.id
+    ).where(
+        ArticleModel.published_at >= datetime.utcnow() - timedelta(days=days_back),
+        ArticleModel.content.isnot(None),
+        ClassificationModel.stance.in_([PoliticalStance.LEFT, PoliticalStance.CENTER, PoliticalStance.RIGHT])
+    )
+    ranked = ArticleSearch.apply(ranked, topic, db.bind.dialect.name, rank=False).subquery()
+    
+    result = await db.execute(
+        select(ranked.c.stance, ranked.c.content)
+        .where(ranked.c.position <= cap)
+        .order_by(ranked.c.stance, ranked.c.position)
+    )
+    rows = result.all()
+    
+    articles = {PoliticalStance.LEFT: [], PoliticalStance.CENTER: [], PoliticalStance.RIGHT: []}
+    for row in rows:
+        articles[row.stance].append(row)
+    return articles
+
 def extract_key_points(articles: List[ArticleModel]) -> List[str]:
     """Extract key points from articles."""
     # Simple implementation - extract sentences containing key terms
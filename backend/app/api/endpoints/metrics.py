@@ -0,0 +1,34 @@
+from typing import Dict, Optional
+from fastapi import APIRouter
+
+from app.db import session
+from app.db.pool_metrics import async_pool_metrics, sync_pool_metrics
+from app.services.ingestion import get_ingestion_scheduler
+
+router = APIRouter()
+
+@router.get("/db-pool")
+async def get_db_pool_metrics() -> Dict[str, Optional[dict]]:
+    """
+    Get connection pool saturation and checkout timings.
+
+    Reports checked-out and overflow connections, queue wait time and
+    checkout latency (wait plus pre-ping) for the sync and async engines.
+    An entry is null until its engine has been created.
+    """
+    engine = session._engine
+    async_engine = session._async_engine
+    return {
+        "sync": sync_pool_metrics.snapshot(engine.pool) if engine else None,
+        "async": async_pool_metrics.snapshot(async_engine.sync_engine.pool) if async_engine else None
+    }
+
+@router.get("/ingestion")
+async def get_ingestion_metrics() -> dict:
+    """
+    Get background ingestion status and per-source counters.
+
+    Counters (polls, fetched, saved, skipped, errored) accumulate since startup.
+    """
+    scheduler = get_ingestion_scheduler()
+    return {"running": scheduler.running, "sources": scheduler.stats}
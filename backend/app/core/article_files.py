@@ -0,0 +1,174 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Union
+
+from ..models.article import Article
+
+# Characters read per chunk when streaming a JSON array
+READ_CHUNK_SIZE = 64 * 1024
+
+def is_gzip_path(path: Union[str, Path]) -> bool:
+    """Whether a file name calls for gzip compression (".gz" suffix)."""
+    return str(path).endswith(".gz")
+
+def is_jsonl_path(path: Union[str, Path]) -> bool:
+    """Whether a file name is JSON Lines (".jsonl" or ".jsonl.gz")."""
+    return str(path).removesuffix(".gz").endswith((".jsonl", ".ndjson"))
+
+def open_text(path: Union[str, Path], mode: str = "r", compress: Optional[bool] = None) -> IO[str]:
+    """
+    Open a UTF-8 text file, transparently gzip-compressed.
+
+    Args:
+        path: File path
+        mode: "r", "w" or "a" (appending to a gzip file adds a new gzip member)
+        compress: Use gzip (default: when the path ends in ".gz")
+    """
+    if compress is None:
+        compress = is_gzip_path(path)
+    if compress:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+def article_to_record(article: Article) -> Dict[str, Any]:
+    """Convert an Article to a JSON-ready dict (datetimes and URLs as strings) in one pass."""
+    return article.model_dump(mode="json")
+
+class JsonlWriter:
+    """Streaming JSON Lines writer: one compact JSON object per line, written as it arrives.
+
+    Use as a context manager; memory use does not depend on the number of records.
+    """
+
+    def __init__(self, path: Union[str, Path], append: bool = False, compress: Optional[bool] = None):
+        """
+        Open the output file.
+
+        Args:
+            path: Output file path
+            append: Append to the file instead of overwriting it
+            compress: Gzip the output (default: when the path ends in ".gz")
+        """
+        self.path = Path(path)
+        self.count = 0
+        self._file = open_text(self.path, "a" if append else "w", compress)
+
+    def write(self, record: Union[Article, Dict[str, Any]]) -> None:
+        """Write one article (or already-converted dict) as a line."""
+        if isinstance(record, Article):
+            record = article_to_record(record)
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+        self.count += 1
+
+    def write_all(self, records: Iterable[Union[Article, Dict[str, Any]]]) -> int:
+        """Write every record of an iterable, returning how many were written."""
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+def iter_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the article dicts of a collection file one at a time.
+
+    Reads JSON Lines (".jsonl", one object per line, blank lines ignored) and
+    JSON arrays such as articles.json, either optionally gzip-compressed. Both
+    are parsed incrementally, so memory use is bounded by the largest record.
+
+    Args:
+        path: Collection file path
+
+    Yields:
+        One dict per article
+    """
+    with open_text(path, "r") as f:
+        if is_jsonl_path(path):
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+        else:
+            yield from _iter_json_array(f)
+
+def iter_articles(path: Union[str, Path]) -> Iterator[Article]:
+    """Stream a collection file as validated Article objects."""
+    for record in iter_records(path):
+        yield Article.model_validate(record)
+
+def _iter_json_array(f: IO[str]) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        """Read the next chunk into the buffer, dropping what was consumed."""
+        nonlocal buffer, position, eof
+        chunk = f.read(READ_CHUNK_SIZE)
+        buffer = buffer[position:] + chunk
+        position = 0
+        eof = not chunk
+        return bool(chunk)
+
+    def next_char() -> str:
+        """Skip whitespace and return the next character ("" at end of file)."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array")
+    position += 1
+
+    expect_item = True
+    while True:
+        char = next_char()
+        if char == "]":
+            return
+        if char == "":
+            raise ValueError("Unexpected end of file in JSON array")
+        if char == ",":
+            if expect_item:
+                raise ValueError("Unexpected ',' in JSON array")
+            position += 1
+            expect_item = True
+            continue
+        if not expect_item:
+            raise ValueError("Expected ',' or ']' in JSON array")
+
+        # Decode the next item, reading more until it is complete
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof or not fill():
+                    raise
+                continue
+            if end == len(buffer) and not eof and fill():
+                # A number may continue in the next chunk; decode again with more input
+                continue
+            break
+        position = end
+        expect_item = False
+        yield item
@@ -0,0 +1,141 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Free-text query parameters: whitespace is collapsed, case is kept (NewsAPI's AND/OR/NOT are case-sensitive)
+QUERY_PARAMETERS = frozenset({"q", "qInTitle"})
+
+# Parameters whose values NewsAPI treats case-insensitively
+CASE_INSENSITIVE_PARAMETERS = frozenset({"country", "category", "language"})
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed time-to-live.
+
+    Entries live in memory by default. With a path, they are kept in a SQLite
+    file instead, so they survive restarts and are shared by every worker
+    process pointing at the same file; values must then be JSON-serializable.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 900, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid
+            path: Optional SQLite file for an on-disk cache
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        if path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_accessed_at ON cache (accessed_at)")
+
+    @staticmethod
+    def make_key(namespace: str, params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from query parameters, normalized so equivalent queries share it.
+
+        Whitespace is collapsed in free-text queries (QUERY_PARAMETERS) and
+        values of CASE_INSENSITIVE_PARAMETERS are lowercased; other values are
+        kept as given. None values are dropped and parameters are sorted by name.
+
+        Args:
+            namespace: Name of the call being cached (e.g. the API endpoint)
+            params: Query parameters
+
+        Returns:
+            Cache key string
+        """
+        normalized = {}
+        for name, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, str):
+                if name in QUERY_PARAMETERS:
+                    value = " ".join(value.split())
+                elif name in CASE_INSENSITIVE_PARAMETERS:
+                    value = value.strip().lower()
+            normalized[name] = value
+        return f"{namespace}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if it is missing or expired."""
+        now = time.time()
+        if self.path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] <= now:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+                return json.loads(row[0])
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond max_entries."""
+        now = time.time()
+        if self.path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now + self.ttl, now)
+                )
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    "SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            return
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        if self.path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM cache")
+            return
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the on-disk cache for one write-locked transaction, committed on success."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level="IMMEDIATE")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
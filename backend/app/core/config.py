@@ -12,6 +12,26 @@ class Settings(BaseSettings):
     
     # News API Keys
     NEWS_API_KEY: str = os.getenv("NEWS_API_KEY", "")
+    # Base URL of the NewsAPI v2 REST API (override to point at a local stub server)
+    NEWS_API_BASE_URL: str = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
+    # Maximum concurrent page requests of a multi-page fetch
+    NEWS_API_MAX_CONCURRENCY: int = int(os.getenv("NEWS_API_MAX_CONCURRENCY", "4"))
+    # Seconds before a NewsAPI request times out
+    NEWS_API_TIMEOUT: float = float(os.getenv("NEWS_API_TIMEOUT", "10"))
+    # How much of each raw NewsAPI article to store in raw_data: "full", "compact" (unmapped fields only) or "none"
+    NEWS_API_RAW_DATA: str = os.getenv("NEWS_API_RAW_DATA", "full")
+    # Seconds a NewsAPI response is served from cache (0 = no caching)
+    NEWS_API_CACHE_TTL: float = float(os.getenv("NEWS_API_CACHE_TTL", "900"))
+    # Maximum cached responses before the least recently used is evicted
+    NEWS_API_CACHE_SIZE: int = int(os.getenv("NEWS_API_CACHE_SIZE", "256"))
+    # Optional SQLite file for the cache, shared by all workers (empty = in-memory, per process)
+    NEWS_API_CACHE_PATH: str = os.getenv("NEWS_API_CACHE_PATH", "")
+    # Maximum NewsAPI requests per second, smoothed by a token bucket (0 = unlimited)
+    NEWS_API_RATE_LIMIT: float = float(os.getenv("NEWS_API_RATE_LIMIT", "0"))
+    # Requests allowed in a burst before the rate limit applies (0 = one second's worth)
+    NEWS_API_RATE_BURST: float = float(os.getenv("NEWS_API_RATE_BURST", "0"))
+    # Optional SQLite file holding the token bucket, shared by all workers (empty = per process)
+    NEWS_API_RATE_LIMIT_PATH: str = os.getenv("NEWS_API_RATE_LIMIT_PATH", "")
     
     # Database
     DATABASE_URL: str = os.getenv(
@@ -19,6 +39,50 @@ class Settings(BaseSettings):
         f"postgresql://{os.getenv('USER', os.getenv('USERNAME', 'postgres'))}@localhost:5432/political_content"
     )
     
+    # Connection pool (per engine, per worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds before a pooled connection is replaced (-1 = never)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Seconds to wait for a free connection before failing
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Ping connections on checkout (costs a round trip per checkout; recycle covers most stale connections)
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    
+    # Stance classification: optional JSON lexicon {"left": {term: weight}, "right": {...}}
+    STANCE_LEXICON_PATH: str = os.getenv("STANCE_LEXICON_PATH", "")
+    # Where CPU-bound classification runs: "process", "thread" or "inline"
+    CLASSIFICATION_EXECUTOR: str = os.getenv("CLASSIFICATION_EXECUTOR", "process")
+    # Worker count for the classification pool (0 = number of CPUs)
+    CLASSIFICATION_WORKERS: int = int(os.getenv("CLASSIFICATION_WORKERS", "0"))
+    # Number of articles read, classified and inserted per transaction
+    CLASSIFICATION_CHUNK_SIZE: int = int(os.getenv("CLASSIFICATION_CHUNK_SIZE", "1000"))
+
+    # Where batch text cleaning runs: "process", "thread" or "inline"
+    CLEANING_EXECUTOR: str = os.getenv("CLEANING_EXECUTOR", "process")
+    # Worker count for the cleaning pool (0 = number of CPUs)
+    CLEANING_WORKERS: int = int(os.getenv("CLEANING_WORKERS", "0"))
+    # Articles cleaned per pool task
+    CLEANING_CHUNK_SIZE: int = int(os.getenv("CLEANING_CHUNK_SIZE", "2000"))
+    # Estimated Jaccard similarity (MinHash) at which articles count as near duplicates (0 = disabled)
+    NEAR_DUPLICATE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.7"))
+    # Also drop near duplicates while cleaning, not only when saving (fingerprinting makes cleaning ~10x slower)
+    CLEANING_NEAR_DUPLICATES: bool = os.getenv("CLEANING_NEAR_DUPLICATES", "false").lower() in ("1", "true", "yes")
+    # Also drop articles repeating an earlier cleaned title while cleaning (by id only by default)
+    CLEANING_DUPLICATE_TITLES: bool = os.getenv("CLEANING_DUPLICATE_TITLES", "false").lower() in ("1", "true", "yes")
+
+    # Background ingestion: poll these comma-separated topics and NewsAPI categories on an interval
+    INGESTION_ENABLED: bool = os.getenv("INGESTION_ENABLED", "false").lower() in ("1", "true", "yes")
+    INGESTION_TOPICS: str = os.getenv("INGESTION_TOPICS", "")
+    INGESTION_CATEGORIES: str = os.getenv("INGESTION_CATEGORIES", "politics")
+    INGESTION_COUNTRY: str = os.getenv("INGESTION_COUNTRY", "us")
+    # Seconds between polls of each source
+    INGESTION_INTERVAL: float = float(os.getenv("INGESTION_INTERVAL", "900"))
+    # Maximum results requested per poll of a source
+    INGESTION_MAX_RESULTS: int = int(os.getenv("INGESTION_MAX_RESULTS", "500"))
+    # Fetched batches waiting to be saved before pollers pause (backpressure)
+    INGESTION_QUEUE_SIZE: int = int(os.getenv("INGESTION_QUEUE_SIZE", "8"))
+    
     # CORS
     BACKEND_CORS_ORIGINS: list = ["http://localhost:4200"] #automatic type conversion to real python list
 
@@ -1,86 +1,282 @@
+import html
+import os
 import re
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple
 from datetime import datetime
 
+from .config import settings
+from .near_duplicates import MinHashIndex, minhash, signature_from_bytes, signature_to_bytes
 from ..models.article import Article
 
+# Any HTML tag, including ones spanning lines
+TAG_PATTERN = re.compile(r'<[^>]*>')
+
+# Entities common in news feeds, replaced directly when present. &amp; is left to
+# ENTITY_PATTERN so its "&" is not decoded again; &nbsp; becomes a plain space, as
+# whitespace is collapsed afterwards anyway
+COMMON_ENTITIES = (
+    ('&quot;', '"'),
+    ('&#39;', "'"),
+    ('&nbsp;', ' '),
+    ('&#8212;', '\u2014'),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+)
+
+# Any named, decimal or hex entity terminated by a semicolon
+ENTITY_PATTERN = re.compile(r'&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);')
+
+class CleanedText(NamedTuple):
+    """Cleaned text fields of one article, keyed by its position in the input list."""
+    index: int
+    title: str
+    description: str
+    content: str
+    # Packed MinHash signature of the cleaned text (None unless requested)
+    minhash: Optional[bytes] = None
+
+def clean_text(text: Optional[str]) -> str:
+    """
+    Clean article text: strip HTML tags, decode entities and collapse whitespace.
+
+    Each entity is decoded once, so "&amp;lt;" becomes "&lt;". Entities
+    outside COMMON_ENTITIES are decoded by html.unescape, one match at a time.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Cleaned text
+    """
+    if not text:
+        return ""
+
+    # Remove HTML tags (before decoding, so an escaped "&lt;b&gt;" stays as text)
+    if '<' in text:
+        text = TAG_PATTERN.sub('', text)
+
+    if '&' in text:
+        for entity, character in COMMON_ENTITIES:
+            if entity in text:
+                text = text.replace(entity, character)
+        # Decode &amp; and the rarer entities in one pass, so nothing is decoded twice
+        if '&' in text:
+            text = ENTITY_PATTERN.sub(_decode_entity, text)
+
+    # Collapse whitespace runs (including decoded &nbsp;) to single spaces and strip the ends.
+    # Every whitespace character but the space is unprintable, so most texts skip the split
+    text = text.strip()
+    if text.isprintable() and '  ' not in text:
+        return text
+    return ' '.join(text.split())
+
+def _decode_entity(match: re.Match) -> str:
+    """Decode one entity matched by ENTITY_PATTERN."""
+    return html.unescape(match[0])
+
+def clean_batch(
+    items: Sequence[Tuple[int, Optional[str], Optional[str], Optional[str]]],
+    fingerprint: bool = False
+) -> List[CleanedText]:
+    """
+    Clean a batch of articles given as plain tuples.
+
+    Module-level and free of Pydantic objects so it can be shipped to a
+    ProcessPoolExecutor worker. Articles whose title is empty after cleaning
+    are dropped.
+
+    Args:
+        items: Sequence of (index, title, description, content)
+        fingerprint: Also compute the MinHash signature of each cleaned article
+
+    Returns:
+        List of CleanedText in input order
+    """
+    results = []
+    append = results.append
+    for index, title, description, content in items:
+        title = clean_text(title)
+        if not title:
+            continue
+        description = clean_text(description)
+        content = clean_text(content)
+        signature = minhash(title, description, content) if fingerprint else None
+        # _make skips the generated __new__, a measurable share of the per-article cost
+        append(CleanedText._make((
+            index, title, description, content, signature_to_bytes(signature) if signature else None
+        )))
+    return results
+
 class DataCleaner:
     """Class for cleaning and preprocessing article data."""
-    
+
+    # Batches smaller than this are cleaned inline; shipping them to the pool costs more than it saves
+    MIN_PARALLEL_BATCH = 5000
+
+    _executor: Optional[Executor] = None
+
     def __init__(self):
         """Initialize data cleaner."""
         self.logger = logging.getLogger(__name__)
-    
-    def clean_articles(self, articles: List[Article]) -> List[Article]:
+
+    @staticmethod
+    def get_executor() -> Optional[Executor]:
+        """
+        Get the shared cleaning pool, creating it on first use.
+
+        Returns None (clean inline) when settings.CLEANING_EXECUTOR is "inline"
+        or the pool would have a single worker: on one CPU, shipping articles
+        to a worker process halves the throughput instead of raising it.
+        """
+        kind = settings.CLEANING_EXECUTOR.lower()
+        workers = settings.CLEANING_WORKERS or os.cpu_count() or 1
+        if kind == "inline" or workers == 1:
+            return None
+        if DataCleaner._executor is None:
+            if kind == "thread":
+                DataCleaner._executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                DataCleaner._executor = ProcessPoolExecutor(max_workers=workers)
+        return DataCleaner._executor
+
+    @staticmethod
+    def shutdown_executor() -> None:
+        """Shut down the cleaning pool, if one was started."""
+        if DataCleaner._executor is not None:
+            DataCleaner._executor.shutdown(wait=True, cancel_futures=True)
+            DataCleaner._executor = None
+
+    def clean_articles(
+        self,
+        articles: List[Article],
+        near_duplicates: Optional[bool] = None,
+        duplicate_titles: Optional[bool] = None
+    ) -> List[Article]:
         """
         Clean a list of articles.
-        
+
+        The text is cleaned by clean_article_batch and written back to the
+        kept articles with plain attribute assignment (no re-validation).
+
         Args:
             articles: List of Article objects
-            
+            near_duplicates: Also drop near duplicates (default: settings.CLEANING_NEAR_DUPLICATES)
+            duplicate_titles: Also drop repeated cleaned titles (default: settings.CLEANING_DUPLICATE_TITLES)
+
         Returns:
             Cleaned list of Article objects
         """
         cleaned_articles = []
+        batch = self.clean_article_batch(
+            articles, near_duplicates=near_duplicates, duplicate_titles=duplicate_titles
+        )
+        for cleaned in batch:
+            article = articles[cleaned.index]
+            article.title = cleaned.title
+            article.description = cleaned.description
+            article.content = cleaned.content
+            if cleaned.minhash is not None:
+                article.minhash = cleaned.minhash
+            cleaned_articles.append(article)
+
+        self.logger.info(f"Cleaned {len(articles)} articles, resulting in {len(cleaned_articles)} valid articles")
+        return cleaned_articles
+
+    def clean_article_batch(
+        self,
+        articles: Sequence[Article],
+        chunk_size: Optional[int] = None,
+        near_duplicates: Optional[bool] = None,
+        duplicate_titles: Optional[bool] = None
+    ) -> List[CleanedText]:
+        """
+        Clean the text fields of a large list of articles, spread over the cleaning pool.
+
+        Articles repeating an earlier article's id are dropped before any text
+        is cleaned; NewsClient derives ids from the canonical URL
+        (app.core.urls.article_id_for_url), so this also drops every variant
+        of a link already seen. The rest are sent to the pool (see
+        get_executor) as plain tuples in chunks of chunk_size; batches below
+        MIN_PARALLEL_BATCH are cleaned inline.
+
+        With duplicate_titles on, articles repeating an earlier cleaned title
+        are dropped after cleaning. ArticleService.bulk_save_articles applies
+        the same rule when saving, so this only matters to callers that use
+        the cleaned batch directly.
+
+        With near_duplicates on, the pool also computes MinHash signatures and
+        articles at least settings.NEAR_DUPLICATE_THRESHOLD similar to an
+        earlier kept article are dropped, so the first article of each
+        near-duplicate cluster is kept as its canonical copy. Fingerprinting
+        makes cleaning about ten times slower per article, and
+        ArticleService.bulk_save_articles checks near duplicates when saving
+        anyway, so it is off unless settings.CLEANING_NEAR_DUPLICATES is set.
+        This is blocking code: call it from a worker thread, not the event loop.
+
+        Args:
+            articles: Sequence of Article objects
+            chunk_size: Articles per pool task (default: settings.CLEANING_CHUNK_SIZE)
+            near_duplicates: Also drop near duplicates (default: settings.CLEANING_NEAR_DUPLICATES)
+            duplicate_titles: Also drop repeated cleaned titles (default: settings.CLEANING_DUPLICATE_TITLES)
+
+        Returns:
+            List of CleanedText in input order, each referring to its article by index
+        """
+        if duplicate_titles is None:
+            duplicate_titles = settings.CLEANING_DUPLICATE_TITLES
+        items = []
         seen_ids = set()
-        
-        for article in articles:
-            # Skip if ID already seen (duplicate)
+        for index, article in enumerate(articles):
             if article.id in seen_ids:
                 continue
-                
-            # Clean title and content
-            cleaned_title = self.clean_text(article.title)
-            cleaned_description = self.clean_text(article.description or '')
-            cleaned_content = self.clean_text(article.content or '')
-            
-            # Skip if title is empty after cleaning
-            if not cleaned_title:
-                continue
-                
-            # Update article with cleaned text
-            article.title = cleaned_title
-            article.description = cleaned_description
-            article.content = cleaned_content
-            
-            # Add to result and mark as seen
-            cleaned_articles.append(article)
             seen_ids.add(article.id)
-        
-        self.logger.info(f"Cleaned {len(articles)} articles, resulting in {len(cleaned_articles)} valid articles")
-        return cleaned_articles
-    
+            items.append((index, article.title, article.description, article.content))
+
+        if near_duplicates is None:
+            near_duplicates = settings.CLEANING_NEAR_DUPLICATES
+        threshold = settings.NEAR_DUPLICATE_THRESHOLD if near_duplicates else 0
+        clean = partial(clean_batch, fingerprint=threshold > 0)
+        executor = self.get_executor()
+        if executor is None or len(items) < self.MIN_PARALLEL_BATCH:
+            results = clean(items)
+        else:
+            chunk_size = chunk_size or settings.CLEANING_CHUNK_SIZE
+            chunks = (items[start:start + chunk_size] for start in range(0, len(items), chunk_size))
+            results = [cleaned for part in executor.map(clean, chunks) for cleaned in part]
+
+        if not duplicate_titles and threshold <= 0:
+            return results
+
+        unique = []
+        seen_titles = set()
+        index = MinHashIndex(threshold) if threshold > 0 else None
+        for cleaned in results:
+            # Same title rule as ArticleService.bulk_save_articles, applied before anything is saved
+            if duplicate_titles and cleaned.title in seen_titles:
+                continue
+            if index is not None and cleaned.minhash:
+                signature = signature_from_bytes(cleaned.minhash)
+                if index.find(signature) is not None:
+                    continue
+                index.add(cleaned.index, signature)
+            seen_titles.add(cleaned.title)
+            unique.append(cleaned)
+        return unique
+
     def clean_text(self, text: str) -> str:
         """
         Clean article text.
-        
+
         Args:
             text: Raw text
-            
+
         Returns:
             Cleaned text
         """
-        if not text:
-            return ""
-            
-        # Remove HTML tags
-        text = re.sub(r'<.*?>', '', text)
-        
-        # Handle common encoding issues
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        
-        # Remove extra whitespace
-        text = re.sub(r'\\s+', ' ', text)
-        
-        # Strip whitespace
-        text = text.strip()
-        
-        return text
+        return clean_text(text)
 
     # def format_date(self, date_str: str) -> str:
     #     """Format date string to consistent format"""
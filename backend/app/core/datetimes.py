@@ -0,0 +1,67 @@
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Union
+
+def parse_datetime(value: Union[str, datetime]) -> datetime:
+    """
+    Parse a timestamp into a timezone-aware UTC datetime.
+
+    Strings are dispatched on their shape instead of trying every format:
+    all-digit strings are Unix seconds, strings starting with a digit are
+    tried as ISO 8601 in any common form ("2024-04-20T05:56:56Z", fractional
+    seconds, offsets, "2024-04-20 05:56:56", "2024-04-20") with
+    datetime.fromisoformat, and anything else, including ISO misses such as
+    "20 Apr 2024 05:56:56 GMT", is tried as RFC 2822
+    ("Sat, 20 Apr 2024 05:56:56 GMT").
+    Naive values are taken as UTC. String results are cached, since a batch
+    of articles repeats the same timestamps.
+
+    Args:
+        value: Timestamp string or datetime
+
+    Returns:
+        Aware datetime in UTC
+
+    Raises:
+        ValueError: If the string is empty or not a recognized timestamp
+    """
+    if isinstance(value, datetime):
+        return _as_utc(value)
+    return _parse_string(value.strip())
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC, the form stored in DateTime columns (naive values are kept)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to a naive datetime, or convert an aware one to UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+@lru_cache(maxsize=4096)
+def _parse_string(value: str) -> datetime:
+    """Parse a stripped timestamp string by its shape (see parse_datetime)."""
+    if not value:
+        raise ValueError("Empty timestamp")
+
+    if value.isdigit():
+        if len(value) != 8:
+            return datetime.fromtimestamp(int(value), UTC)
+        # Eight digits is a basic-format ISO date ("20240420"), not a 1970s timestamp
+        return _as_utc(datetime.fromisoformat(value))
+
+    if value[0].isdigit():
+        try:
+            return _as_utc(datetime.fromisoformat(value))
+        except ValueError:
+            # RFC 2822 dates may start with the day of the month
+            pass
+
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"Unrecognized timestamp: {value!r}") from None
@@ -0,0 +1,165 @@
+import re
+import struct
+import zlib
+from typing import Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+# MinHash signature size: shingle hashes are spread over this many bins (one-permutation hashing)
+SIGNATURE_SIZE = 64
+
+# LSH banding: two signatures become candidates when all rows of any band match.
+# With 16 bands of 4 rows a pair with Jaccard similarity 0.7 is a candidate with
+# probability 1 - (1 - 0.7**4)**16 ~ 0.99, and one with similarity 0.2 with ~0.03.
+LSH_BANDS = 16
+ROWS_PER_BAND = SIGNATURE_SIZE // LSH_BANDS
+
+# Words per shingle (feature)
+SHINGLE_SIZE = 3
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# NewsAPI truncates content with a trailing "[+1234 chars]" marker that differs between copies
+TRUNCATION_PATTERN = re.compile(r'\s*\[\+\d+ chars\]$')
+
+# Low bits of a shingle hash pick its bin, the rest is the value minimized per bin
+_BIN_BITS = (SIGNATURE_SIZE - 1).bit_length()
+_EMPTY = 1 << (32 - _BIN_BITS)
+
+_SIGNATURE_FORMAT = struct.Struct(f"<{SIGNATURE_SIZE}I")
+_BAND_FORMAT = struct.Struct(f"<{ROWS_PER_BAND}I")
+
+def shingles(text: str) -> set:
+    """Lower-cased word SHINGLE_SIZE-grams of a text (the whole text when it is shorter)."""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[start:start + SHINGLE_SIZE]) for start in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+def minhash(*texts: Optional[str]) -> Optional[Tuple[int, ...]]:
+    """
+    Compute the MinHash signature of one or more texts.
+
+    Uses one-permutation hashing: each distinct word shingle is hashed once
+    with CRC-32 (stable across processes, unlike hash()), the low bits pick one
+    of SIGNATURE_SIZE bins and each bin keeps the smallest remaining value.
+    Empty bins are filled from the next non-empty bin to their right, offset by
+    the distance (rotation densification), so every position is comparable.
+    The fraction of equal positions of two signatures estimates the Jaccard
+    similarity of their shingle sets.
+
+    Args:
+        texts: Texts fingerprinted together, e.g. title, description and content
+
+    Returns:
+        Tuple of SIGNATURE_SIZE unsigned 32-bit values, or None when there is no text
+    """
+    text = " ".join(TRUNCATION_PATTERN.sub("", part) for part in texts if part)
+    features = shingles(text)
+    if not features:
+        return None
+
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    mask = SIGNATURE_SIZE - 1
+    for feature in features:
+        value = zlib.crc32(feature.encode())
+        position = value & mask
+        value >>= _BIN_BITS
+        if value < bins[position]:
+            bins[position] = value
+
+    signature = list(bins)
+    for position, value in enumerate(bins):
+        if value != _EMPTY:
+            continue
+        for distance in range(1, SIGNATURE_SIZE):
+            donor = bins[(position + distance) & mask]
+            if donor != _EMPTY:
+                signature[position] = donor + distance * _EMPTY
+                break
+    return tuple(signature)
+
+def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures (fraction of equal positions)."""
+    return sum(a == b for a, b in zip(first, second)) / SIGNATURE_SIZE
+
+def band_keys(signature: Sequence[int]) -> List[int]:
+    """
+    LSH bucket keys of a signature: one per band, tagged with the band number.
+
+    Args:
+        signature: MinHash signature
+
+    Returns:
+        LSH_BANDS keys of the form (band << 32) | crc32(band rows), which fit a BIGINT column
+    """
+    return [
+        (band << 32) | zlib.crc32(_BAND_FORMAT.pack(*signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]))
+        for band in range(LSH_BANDS)
+    ]
+
+def signature_to_bytes(signature: Sequence[int]) -> bytes:
+    """Pack a signature into SIGNATURE_SIZE * 4 little-endian bytes for storage."""
+    return _SIGNATURE_FORMAT.pack(*signature)
+
+def signature_from_bytes(data: bytes) -> Tuple[int, ...]:
+    """Inverse of signature_to_bytes."""
+    return _SIGNATURE_FORMAT.unpack(data)
+
+K = TypeVar("K", bound=Hashable)
+
+class MinHashIndex(Generic[K]):
+    """In-memory LSH index of MinHash signatures.
+
+    Signatures are bucketed by band_keys, so a lookup compares the query only
+    with signatures sharing one of its bands instead of with every entry.
+    """
+
+    def __init__(self, threshold: float):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Smallest estimated Jaccard similarity counted as a near duplicate
+        """
+        self.threshold = threshold
+        self._buckets: Dict[int, List[Tuple[K, Tuple[int, ...]]]] = {}
+        self._signatures: Dict[K, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def add(self, key: K, signature: Sequence[int]) -> None:
+        """Add a signature under a key (e.g. an article id)."""
+        entry = (key, tuple(signature))
+        for band_key in band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(entry)
+        self._signatures[key] = entry[1]
+
+    def remove(self, key: K) -> None:
+        """Remove the signature added under a key, if any."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in band_keys(signature):
+            bucket = [entry for entry in self._buckets.get(band_key, ()) if entry[0] != key]
+            if bucket:
+                self._buckets[band_key] = bucket
+            else:
+                self._buckets.pop(band_key, None)
+
+    def find(self, signature: Sequence[int]) -> Optional[K]:
+        """Return the key of the most similar indexed signature at or above the threshold, if any."""
+        best_key = None
+        best_similarity = self.threshold
+        checked = set()
+        for band_key in band_keys(signature):
+            for key, candidate in self._buckets.get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                score = similarity(signature, candidate)
+                if score >= best_similarity and (best_key is None or score > best_similarity):
+                    best_key, best_similarity = key, score
+        return best_key
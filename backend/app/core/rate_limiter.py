@@ -0,0 +1,102 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+class TokenBucket:
+    """Token-bucket rate limiter that delays callers instead of rejecting them.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens per
+    second; each call takes one token, waiting for the refill when the bucket
+    is empty, so bursts are smoothed to the configured rate. State is kept in
+    memory by default. With a path, it lives in a SQLite file updated under a
+    write lock, so every worker process using that file shares one budget.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, path: Optional[str] = None):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second of tokens, at least 1)
+            path: Optional SQLite file holding state shared across processes
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.path = path
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = time.time()
+
+        if path:
+            conn = sqlite3.connect(path, timeout=30, isolation_level="IMMEDIATE")
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS token_bucket ("
+                        "id INTEGER PRIMARY KEY CHECK (id = 1), tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "INSERT OR IGNORE INTO token_bucket (id, tokens, updated_at) VALUES (1, ?, ?)",
+                        (self.capacity, self._updated_at)
+                    )
+            finally:
+                conn.close()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds to wait before retrying
+        """
+        if self.path:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level="IMMEDIATE")
+            try:
+                with conn:
+                    # Take the write lock before reading so concurrent workers serialize here
+                    conn.execute("BEGIN IMMEDIATE")
+                    available, updated_at = conn.execute(
+                        "SELECT tokens, updated_at FROM token_bucket WHERE id = 1"
+                    ).fetchone()
+                    now = time.time()
+                    available, wait = self._take(available, updated_at, now, tokens)
+                    conn.execute(
+                        "UPDATE token_bucket SET tokens = ?, updated_at = ? WHERE id = 1", (available, now)
+                    )
+                    return wait
+            finally:
+                conn.close()
+
+        with self._lock:
+            now = time.time()
+            self._tokens, wait = self._take(self._tokens, self._updated_at, now, tokens)
+            self._updated_at = now
+            return wait
+
+    def _take(self, available: float, updated_at: float, now: float, tokens: float):
+        """Refill from updated_at to now and take tokens, returning (tokens left, seconds to wait)."""
+        available = min(self.capacity, available + max(0.0, now - updated_at) * self.rate)
+        if available >= tokens:
+            return available - tokens, 0.0
+        return available, (tokens - available) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens, sleeping until the bucket has refilled enough."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Take tokens, yielding to the event loop until the bucket has refilled enough."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
@@ -0,0 +1,242 @@
+import json
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.models.stance import PoliticalStance
+
+# Default lexicon: keyword -> weight for each stance ("*" suffix = prefix match)
+DEFAULT_LEXICON: Dict[str, Dict[str, float]] = {
+    "left": {"democrat*": 1.0, "progressive*": 1.0, "liberal*": 1.0, "left": 1.0, "socialis*": 1.0},
+    "right": {"republican*": 1.0, "conservative*": 1.0, "right": 1.0, "trump": 1.0, "gop": 1.0},
+}
+
+# Words of a text or keyword; texts are tokenized once and matched word by word
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Trie node key holding the entry of a prefix keyword ending at that node
+TRIE_ENTRY = ""
+
+# Distinct words whose single-word match is remembered before the memo starts over
+WORD_CACHE_SIZE = 100_000
+
+class StanceClassifier:
+    """Keyword-based political stance classifier.
+
+    Each text is lowercased and split into words once, and keywords are then
+    looked up per word, so the cost of a text does not depend on the size of
+    the lexicon. Single words are dict lookups, multi-word phrases are looked
+    up by their word tuple (one lookup per distinct phrase length) only where
+    a phrase's first word occurs, and keywords ending in "*" are found by
+    walking the word through a character trie ("democrat*" matches
+    "Democrats"). Single-word results are memoized per distinct word.
+    Matching whole words means "right" no longer matches inside "copyright".
+    Each keyword carries a weight; the stance is the side with the larger
+    weighted score.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Initialize the classifier.
+
+        Args:
+            lexicon: Mapping of "left"/"right" to {keyword: weight}.
+                     Multi-word keywords are matched as phrases.
+        """
+        self.lexicon = lexicon or DEFAULT_LEXICON
+        # word -> (keyword, stance, weight), and the same keyed by word tuple for phrases
+        self.words: Dict[str, Tuple[str, PoliticalStance, float]] = {}
+        self.phrases: Dict[Tuple[str, ...], Tuple[str, PoliticalStance, float]] = {}
+        # Character trie of single-word prefix keywords, and one per leading words of prefix phrases
+        self.prefixes: dict = {}
+        self.prefix_phrases: Dict[Tuple[str, ...], dict] = {}
+
+        for side, stance in (("left", PoliticalStance.LEFT), ("right", PoliticalStance.RIGHT)):
+            for keyword, weight in self.lexicon.get(side, {}).items():
+                words = tuple(TOKEN_PATTERN.findall(keyword.lower()))
+                if not words:
+                    continue
+                entry = (keyword, stance, float(weight))
+                if not keyword.rstrip().endswith("*"):
+                    if len(words) == 1:
+                        self.words[words[0]] = entry
+                    else:
+                        self.phrases[words] = entry
+                    continue
+                node = self.prefix_phrases.setdefault(words[:-1], {}) if len(words) > 1 else self.prefixes
+                for char in words[-1]:
+                    node = node.setdefault(char, {})
+                node[TRIE_ENTRY] = entry
+
+        # Words that may start a phrase; any other word can only match on its own
+        self.phrase_starts = {words[0] for words in self.phrases} | {words[0] for words in self.prefix_phrases}
+        # Longest phrases first so phrases win over their own words
+        self.phrase_lengths = sorted({len(words) for words in self.phrases}, reverse=True)
+        self.prefix_phrase_lengths = sorted({len(words) + 1 for words in self.prefix_phrases}, reverse=True)
+        # word -> single-word entry or None; news text keeps reusing the same vocabulary
+        self.word_cache: Dict[str, Optional[Tuple[str, PoliticalStance, float]]] = {}
+
+    def score(self, *texts: Optional[str]) -> Tuple[float, float]:
+        """
+        Compute weighted left and right scores over one or more texts.
+
+        Each lexicon keyword counts once, however often it repeats across the
+        texts and whichever words it matched ("democrat*" scores once for
+        "Democrats" and "democratic").
+
+        Returns:
+            Tuple of (left_score, right_score)
+        """
+        entries = {}
+        cache = self.word_cache
+        if len(cache) > WORD_CACHE_SIZE:
+            # Replaced rather than cleared so a concurrent score() keeps its own reference
+            cache = self.word_cache = {}
+
+        for text in texts:
+            if not text:
+                continue
+            words = TOKEN_PATTERN.findall(text.lower())
+            distinct = set(words)
+            for word in distinct.difference(cache):
+                cache[word] = self._match_word(word)
+
+            if self.phrase_starts.isdisjoint(distinct):
+                # No phrase can start here, so every word matches on its own
+                for entry in filter(None, map(cache.get, distinct)):
+                    entries[entry[0]] = entry
+                continue
+
+            position = 0
+            count = len(words)
+            while position < count:
+                word = words[position]
+                if word in self.phrase_starts:
+                    entry, length = self._match_phrase(words, position)
+                else:
+                    entry, length = cache[word], 1
+                if entry is not None:
+                    entries[entry[0]] = entry
+                position += length
+
+        left_score = 0.0
+        right_score = 0.0
+        for _, stance, weight in entries.values():
+            if stance == PoliticalStance.LEFT:
+                left_score += weight
+            else:
+                right_score += weight
+        return left_score, right_score
+
+    def _match_word(self, word: str, trie: Optional[dict] = None) -> Optional[Tuple[str, PoliticalStance, float]]:
+        """Find the entry for a single word: an exact keyword, else the longest prefix keyword in the trie."""
+        if trie is None:
+            entry = self.words.get(word)
+            if entry is not None:
+                return entry
+            trie = self.prefixes
+        entry = None
+        node = trie
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                break
+            entry = node.get(TRIE_ENTRY, entry)
+        return entry
+
+    def _match_phrase(self, words: List[str], position: int) -> Tuple[Optional[tuple], int]:
+        """Find the longest keyword starting at a phrase's first word: (entry, words consumed)."""
+        remaining = len(words) - position
+        best = (None, 1)
+        for length in self.phrase_lengths:
+            if length <= remaining:
+                entry = self.phrases.get(tuple(words[position:position + length]))
+                if entry is not None:
+                    best = (entry, length)
+                    break
+
+        for length in self.prefix_phrase_lengths:
+            if length > remaining or length <= best[1] and best[0] is not None:
+                continue
+            trie = self.prefix_phrases.get(tuple(words[position:position + length - 1]))
+            if trie is not None:
+                entry = self._match_word(words[position + length - 1], trie)
+                if entry is not None:
+                    return entry, length
+
+        if best[0] is None:
+            return self._match_word(words[position]), 1
+        return best
+
+    def classify(self, *texts: Optional[str]) -> Tuple[PoliticalStance, float]:
+        """
+        Classify the stance of one or more texts.
+
+        The confidence is the winning side's share of the total score, shrunk
+        toward zero when little evidence was found: score / (total + 1).
+        Texts with no keyword hits are CENTER with confidence 0.0; ties are
+        CENTER with confidence reflecting how much evidence was balanced.
+
+        Returns:
+            Tuple of (stance, confidence in [0, 1))
+        """
+        left_score, right_score = self.score(*texts)
+        total = left_score + right_score
+        if total <= 0:
+            return PoliticalStance.CENTER, 0.0
+
+        if left_score > right_score:
+            stance, winning = PoliticalStance.LEFT, left_score
+        elif right_score > left_score:
+            stance, winning = PoliticalStance.RIGHT, right_score
+        else:
+            stance, winning = PoliticalStance.CENTER, total / 2
+
+        return stance, round(winning / (total + 1), 4)
+
+    @classmethod
+    def from_file(cls, path: str) -> "StanceClassifier":
+        """
+        Load a classifier from a JSON lexicon file.
+
+        The file maps "left" and "right" either to {keyword: weight} objects or
+        to plain keyword lists (weight 1.0). Keywords may end in "*".
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        lexicon = {
+            side: terms if isinstance(terms, dict) else {term: 1.0 for term in terms}
+            for side, terms in data.items()
+        }
+        return cls(lexicon)
+
+@lru_cache(maxsize=None)
+def get_stance_classifier(lexicon_path: Optional[str] = None) -> StanceClassifier:
+    """Get a cached classifier for a lexicon file, or the default lexicon."""
+    if lexicon_path:
+        return StanceClassifier.from_file(lexicon_path)
+    return StanceClassifier()
+
+def classify_batch(
+    items: Sequence[Tuple[str, Optional[str], Optional[str], Optional[str]]],
+    lexicon_path: Optional[str] = None
+) -> List[Tuple[str, PoliticalStance, float]]:
+    """
+    Classify a batch of articles given as plain tuples.
+
+    Module-level and free of ORM objects so it can be shipped to a
+    ProcessPoolExecutor worker; each worker builds its classifier once.
+
+    Args:
+        items: Sequence of (article_id, title, description, content)
+        lexicon_path: Optional JSON lexicon file
+
+    Returns:
+        List of (article_id, stance, confidence) in input order
+    """
+    classifier = get_stance_classifier(lexicon_path)
+    results = []
+    for article_id, title, description, content in items:
+        stance, confidence = classifier.classify(title, description, content)
+        results.append((article_id, stance, confidence))
+    return results
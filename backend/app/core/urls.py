@@ -0,0 +1,127 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Width in bytes of the URL hash stored in ArticleModel.url_hash
+URL_HASH_SIZE = 16
+
+# Query parameters that only track the click, never select the content (plus every "utm_*")
+TRACKING_PARAMETERS = frozenset({
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "cmpid", "ocid", "smid",
+})
+
+# Ports dropped from the host (every canonical URL is https)
+DEFAULT_PORTS = {80, 443}
+
+PERCENT_ESCAPE_PATTERN = re.compile(r'%[0-9a-fA-F]{2}')
+REPEATED_SLASH_PATTERN = re.compile(r'/{2,}')
+
+# An http(s) URL urlsplit would split the same way: (netloc, path, query), then an
+# ignored fragment. URLs with user info, IPv6 literals, zone ids or characters
+# urlsplit removes (tab, CR, LF) do not match and take the general path.
+SIMPLE_URL_PATTERN = re.compile(
+    r'https?://([^/?#@\[%\\\t\r\n]*)((?:/[^?#\\\t\r\n]*)?)(?:\?([^#\\\t\r\n]*))?(?:#.*)?',
+    re.IGNORECASE | re.DOTALL
+)
+
+# A query that decoding and re-encoding leaves unchanged: name=value pairs of
+# characters urlencode never escapes, so it can be filtered and sorted as text
+PLAIN_QUERY_PATTERN = re.compile(r'[A-Za-z0-9_.~-]+=[A-Za-z0-9_.~-]*(?:&[A-Za-z0-9_.~-]+=[A-Za-z0-9_.~-]*)*')
+
+def is_tracking_parameter(name: str) -> bool:
+    """Whether a query parameter is a tracking parameter (utm_* or a known click id)."""
+    name = name.lower()
+    return name.startswith("utm_") or name in TRACKING_PARAMETERS
+
+@lru_cache(maxsize=8192)
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so that links to the same page compare equal.
+
+    The scheme becomes https, the host is lower-cased without "www.", a
+    trailing dot or a default port, repeated and trailing slashes are removed
+    from the path and its percent-escapes upper-cased, tracking parameters
+    (utm_* and click ids) are dropped and the rest sorted, and the fragment is
+    removed. A URL without a scheme is taken as https. A URL that cannot be
+    parsed (e.g. an invalid port) is only stripped and lower-cased.
+
+    Plain ASCII http(s) URLs are split with one regex match and queries of
+    plain name=value pairs are sorted as text; anything else goes through
+    urllib.parse, with the same result. Results are cached, since a
+    collected article's URL is canonicalized by the client, the cleaner and
+    the save path in turn.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Canonical URL string
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+
+    match = SIMPLE_URL_PATTERN.fullmatch(url) if url.isascii() else None
+    try:
+        if match:
+            netloc, path, query = match.groups()
+            host, _, port = netloc.lower().partition(":")
+            host = _canonical_host(host, _parse_port(port))
+        else:
+            parts = urlsplit(url)
+            path, query = parts.path, parts.query
+            # hostname drops user info and IPv6 brackets; port validates the port
+            host = _canonical_host(parts.hostname or "", parts.port)
+    except ValueError:
+        return url.lower()
+
+    if "//" in path:
+        path = REPEATED_SLASH_PATTERN.sub("/", path)
+    if "%" in path:
+        path = PERCENT_ESCAPE_PATTERN.sub(lambda match: match.group().upper(), path)
+    path = path.rstrip("/")
+
+    if query:
+        if PLAIN_QUERY_PATTERN.fullmatch(query):
+            pairs = query.split("&")
+            if len(pairs) > 1:
+                # By (name, value), as sorting the decoded pairs would
+                pairs.sort(key=lambda pair: pair.split("=", 1))
+            query = "&".join(pair for pair in pairs if not is_tracking_parameter(pair[:pair.index("=")]))
+        else:
+            query = urlencode(sorted(
+                (name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+                if not is_tracking_parameter(name)
+            ))
+
+    if match:
+        return f"https://{host}{path}?{query}" if query else f"https://{host}{path}"
+    return urlunsplit(("https", host, path, query, ""))
+
+def _canonical_host(host: str, port: Optional[int]) -> str:
+    """Strip "www.", a trailing dot and a default port from a lower-cased host name."""
+    host = host.rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and port not in DEFAULT_PORTS:
+        host = f"{host}:{port}"
+    return host
+
+def _parse_port(port: str) -> Optional[int]:
+    """Parse the port of a netloc as urlsplit does (None when empty; ValueError outside 0-65535)."""
+    if not port:
+        return None
+    if not (port.isdigit() and int(port) <= 65535):
+        raise ValueError(f"Port out of range or invalid: {port!r}")
+    return int(port)
+
+def url_hash(url: str) -> bytes:
+    """Fixed-width (URL_HASH_SIZE bytes) BLAKE2b hash of the canonical form of a URL."""
+    return hashlib.blake2b(canonicalize_url(url).encode(), digest_size=URL_HASH_SIZE).digest()
+
+def article_id_for_url(url: str) -> str:
+    """Article id derived from the canonical URL (hex of url_hash), the same for every variant of a link."""
+    return url_hash(url).hex()
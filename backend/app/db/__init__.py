@@ -1,3 +1,3 @@
-from .session import SessionLocal, engine, get_db
+from .session import SessionLocal, get_engine, get_db, get_async_db, get_async_engine
 
-__all__ = ["SessionLocal", "engine", "get_db"] 
\ No newline at end of file
+__all__ = ["SessionLocal", "get_engine", "get_db", "get_async_db", "get_async_engine"] 
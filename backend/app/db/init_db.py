@@ -1,10 +1,14 @@
 import logging
 from typing import Optional
 
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
-from app.db.session import engine
-from app.models import Base
+from app.db.session import check_database_connection, get_engine
+from app.core.urls import url_hash
+from app.models import ArticleModel, Base
+from app.models.database import SEARCH_DOCUMENT_DDL
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +18,108 @@ def init_db(db: Optional[Session] = None) -> None:
     Args:
         db: Optional database session. If not provided, a new session will be created.
     """
+    check_database_connection()
+    engine = get_engine()
     try:
         logger.info("Creating database tables")
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
+        upgrade_schema(engine)
+        backfill_url_hashes(engine)
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+def upgrade_schema(bind: Engine) -> None:
+    """Bring tables created by an older version of the models up to date.
+
+    create_all() only creates missing tables, so nullable columns and indexes
+    added to existing models later are created here (indexes limited to
+    another dialect with ddl_if are skipped), as is the PostgreSQL full-text
+    search_document column. Index creation failures (e.g. a unique index on a
+    column that already holds duplicates) are logged and skipped so the
+    application can still start.
+
+    Args:
+        bind: Engine connected to the database to upgrade
+    """
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns or not column.nullable:
+                continue
+            logger.info(f"Adding missing column {column.name} to {table.name}")
+            column_type = column.type.compile(dialect=bind.dialect)
+            with bind.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        existing.update(
+            constraint["name"] for constraint in inspector.get_unique_constraints(table.name)
+        )
+
+        for index in table.indexes:
+            if index.name in existing or not _applies_to_dialect(index, bind):
+                continue
+            try:
+                logger.info(f"Creating missing index {index.name} on {table.name}")
+                index.create(bind=bind)
+            except Exception as e:
+                logger.warning(
+                    f"Could not create index {index.name} on {table.name}: {str(e)}. "
+                    "Remove conflicting rows and restart to apply it."
+                )
+
+    if bind.dialect.name == "postgresql":
+        # Idempotent; adds the stored full-text column and its index to older tables
+        with bind.begin() as connection:
+            for statement in SEARCH_DOCUMENT_DDL:
+                connection.exec_driver_sql(statement)
+
+def _applies_to_dialect(index, bind: Engine) -> bool:
+    """Whether an index restricted with ddl_if(dialect=...) is created on this database."""
+    ddl_if = getattr(index, "_ddl_if", None)
+    if ddl_if is None or ddl_if.dialect is None:
+        return True
+    dialects = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+    return bind.dialect.name in dialects
+
+def backfill_url_hashes(bind: Engine, chunk_size: int = 1000) -> int:
+    """Fill in url_hash for articles stored before the column existed.
+
+    Runs one committed chunk at a time and costs a single indexed query when
+    every article already has a hash.
+
+    Args:
+        bind: Engine connected to the database to upgrade
+        chunk_size: Articles updated per transaction
+
+    Returns:
+        Number of articles updated
+    """
+    updated = 0
+    while True:
+        with bind.begin() as connection:
+            rows = connection.execute(
+                select(ArticleModel.id, ArticleModel.url)
+                .where(ArticleModel.url_hash.is_(None))
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            if not updated:
+                logger.info("Computing url_hash for existing articles")
+            connection.execute(
+                update(ArticleModel.__table__)
+                .where(ArticleModel.__table__.c.id == bindparam("article_id"))
+                .values(url_hash=bindparam("hash")),
+                [{"article_id": row.id, "hash": url_hash(row.url)} for row in rows]
+            )
+        updated += len(rows)
+    if updated:
+        logger.info(f"Computed url_hash for {updated} articles")
+    return updated
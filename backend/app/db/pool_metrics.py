@@ -0,0 +1,156 @@
+"""
+Connection pool instrumentation.
+
+Wraps SQLAlchemy's queue pools so each engine records how long callers wait
+for a connection and how long a full checkout takes (wait plus pre-ping),
+alongside the pool's own checked-out / overflow counts. Snapshots are served
+by the /metrics/db-pool endpoint to size pools per worker count.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Key in ConnectionPoolEntry.info holding the start time of the current checkout
+_CHECKOUT_STARTED = "pool_metrics_checkout_started"
+
+class PoolMetrics:
+    """Counters and timings for one connection pool."""
+
+    def __init__(self, name: str):
+        """Initialize empty metrics for the pool called `name`."""
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters and timings."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_time_total = 0.0
+            self.wait_time_max = 0.0
+            self.checkout_latency_total = 0.0
+            self.checkout_latency_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record time spent waiting for a connection from the pool queue."""
+        with self._lock:
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, latency: float) -> None:
+        """Record a completed checkout and its end-to-end latency."""
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_latency_total += latency
+            self.checkout_latency_max = max(self.checkout_latency_max, latency)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """
+        Get current pool state and accumulated metrics.
+
+        Args:
+            pool: The pool these metrics belong to
+
+        Returns:
+            Dict of pool gauges, counters and timings (milliseconds)
+        """
+        with self._lock:
+            checkouts = self.checkouts or 1
+            return {
+                "pool": self.name,
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": getattr(pool, "_max_overflow", 0),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_time_total / checkouts * 1000, 3),
+                "wait_ms_max": round(self.wait_time_max * 1000, 3),
+                "checkout_ms_avg": round(self.checkout_latency_total / checkouts * 1000, 3),
+                "checkout_ms_max": round(self.checkout_latency_max * 1000, 3),
+            }
+
+def instrumented_pool_class(base: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    Create a subclass of a queue pool that reports into `metrics`.
+
+    The metrics object lives on the class, so it survives pool.recreate()
+    (used by engine.dispose()), which builds a new pool of the same class.
+
+    Args:
+        base: QueuePool or AsyncAdaptedQueuePool
+        metrics: Metrics to report into
+
+    Returns:
+        Pool class to pass as create_engine(poolclass=...)
+    """
+    class InstrumentedPool(base):
+        pool_metrics = metrics
+
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                record = super()._do_get()
+            except PoolTimeoutError:
+                self.pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            self.pool_metrics.record_wait(time.perf_counter() - started)
+            record.info[_CHECKOUT_STARTED] = started
+            return record
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+def attach_pool_metrics(engine: Engine) -> None:
+    """
+    Count connects, checkouts, checkins and invalidations of an engine's pool.
+
+    The engine must use a pool class from instrumented_pool_class(). For an
+    AsyncEngine, pass engine.sync_engine.
+
+    Args:
+        engine: Engine whose pool to listen to
+    """
+    metrics = engine.pool.pool_metrics
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        with metrics._lock:
+            metrics.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        started = connection_record.info.pop(_CHECKOUT_STARTED, None)
+        metrics.record_checkout(time.perf_counter() - started if started else 0.0)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        with metrics._lock:
+            metrics.checkins += 1
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        with metrics._lock:
+            metrics.invalidations += 1
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+InstrumentedQueuePool = instrumented_pool_class(QueuePool, sync_pool_metrics)
+InstrumentedAsyncQueuePool = instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_metrics)
@@ -1,10 +1,12 @@
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 import os
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, attach_pool_metrics
 
 def get_database_url():
     """Get database URL with appropriate user configuration."""
@@ -18,45 +20,65 @@ def get_database_url():
     if os.getenv('DATABASE_URL'):
         db_url = os.getenv('DATABASE_URL')
     
-    print(f"Using database URL: {db_url}")
     return db_url
 
-# Create SQLAlchemy engine with error handling
-try:
-    db_url = get_database_url().replace('postgresql://', 'postgresql+psycopg://')
-    print(f"Creating engine with URL: {db_url}")
-    
-    engine = create_engine(
-        db_url,
-        # Enable connection pooling
-        pool_pre_ping=True,
-        # Set pool size
-        pool_size=5,
-        # Set max overflow
-        max_overflow=10
-    )
-    
-    # Test the connection
-    with engine.connect() as conn:
-        print("✅ Database connection successful")
-        
-except SQLAlchemyError as e:
-    print(f"❌ Database connection error: {str(e)}")
-    print("\nTo fix this, ensure:")
-    print("1. PostgreSQL is installed and running")
-    print("2. The database 'political_content' exists")
-    print("3. Your user has access to the database")
-    print("\nYou can create the database with:")
-    print("createdb political_content")
-    raise
-
-# Create session factory
-# This is used to create new database sessions
-SessionLocal = sessionmaker(
-    autocommit=False,  # Don't automatically commit changes
-    autoflush=False,   # Don't automatically flush changes
-    bind=engine        # Use our engine for connections
-)
+def get_pool_options() -> dict:
+    """Get connection pool options from settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING
+    }
+
+# Engine and session factory, created on first use (or by the startup hook)
+# so that importing this module never touches the database
+_engine = None
+_SessionLocal = None
+
+def get_engine() -> Engine:
+    """Get the shared engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            get_database_url().replace('postgresql://', 'postgresql+psycopg://'),
+            # Instrumented queue pool (see pool_metrics)
+            poolclass=InstrumentedQueuePool,
+            **get_pool_options()
+        )
+        attach_pool_metrics(_engine)
+    return _engine
+
+def get_sessionmaker() -> sessionmaker:
+    """Get the session factory, creating it on first use."""
+    global _SessionLocal
+    if _SessionLocal is None:
+        _SessionLocal = sessionmaker(
+            autocommit=False,   # Don't automatically commit changes
+            autoflush=False,    # Don't automatically flush changes
+            bind=get_engine()   # Use our engine for connections
+        )
+    return _SessionLocal
+
+def SessionLocal() -> Session:
+    """Create a new database session (the session factory is built on first call)."""
+    return get_sessionmaker()()
+
+def check_database_connection() -> None:
+    """Open one connection to verify the database is reachable, with setup hints on failure."""
+    try:
+        with get_engine().connect():
+            print("✅ Database connection successful")
+    except SQLAlchemyError as e:
+        print(f"❌ Database connection error: {str(e)}")
+        print("\nTo fix this, ensure:")
+        print("1. PostgreSQL is installed and running")
+        print("2. The database 'political_content' exists")
+        print("3. Your user has access to the database")
+        print("\nYou can create the database with:")
+        print("createdb political_content")
+        raise
 
 # Dependency to get database session
 # This is used by FastAPI to manage database sessions
@@ -72,7 +94,68 @@ def get_db():
     finally:
         db.close()
 
-# Create or update .env file
-#below caused error sh: backend/.env: No such file or directory when running run.sh
-#os.system("echo \"DATABASE_URL=postgresql://$(whoami)@localhost:5432/political_content\" > backend/.env")
-os.system(f"echo \"DATABASE_URL=postgresql://$(whoami)@localhost:5432/political_content\" > {os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../.env'))}")
\ No newline at end of file
+# Async engine and session factory, also created on first use; this keeps an
+# async driver optional for every database URL
+_async_engine = None
+_AsyncSessionLocal = None
+
+def get_async_database_url() -> str:
+    """Get the database URL with an async driver."""
+    db_url = get_database_url()
+    if db_url.startswith(('postgresql://', 'postgresql+psycopg://')):
+        # psycopg 3 provides both sync and async drivers under the same name
+        return db_url.replace('postgresql://', 'postgresql+psycopg://', 1)
+    if db_url.startswith('sqlite://'):
+        return db_url.replace('sqlite://', 'sqlite+aiosqlite://', 1)
+    return db_url
+
+def get_async_engine() -> AsyncEngine:
+    """Get the shared async engine, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            get_async_database_url(),
+            poolclass=InstrumentedAsyncQueuePool,
+            **get_pool_options()
+        )
+        attach_pool_metrics(_async_engine.sync_engine)
+    return _async_engine
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Get the async session factory, creating it on first use."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False  # Objects stay readable after commit without an awaited refresh
+        )
+    return _AsyncSessionLocal
+
+def dispose_engine() -> None:
+    """Close all pooled connections, if the engine was created."""
+    global _engine, _SessionLocal
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+        _SessionLocal = None
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections, if the async engine was created."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+# Async dependency to get database session
+# Used by endpoints that await their queries so concurrent requests overlap database I/O
+async def get_async_db():
+    """Get async database session with error handling."""
+    async with get_async_sessionmaker()() as db:
+        try:
+            yield db
+        except SQLAlchemyError as e:
+            print(f"❌ Database error during request: {str(e)}")
+            await db.rollback()
+            raise
@@ -2,8 +2,12 @@ from fastapi import FastAPI #core application class
 from fastapi.middleware.cors import CORSMiddleware #middleware for cross-origin resource sharing
 
 from app.core.config import settings
+from app.core.data_cleaner import DataCleaner
 from app.db.init_db import init_db
+from app.db.session import dispose_async_engine, dispose_engine
 from app.api import api_router
+from app.services.classification_service import ClassificationService
+from app.services.ingestion import get_ingestion_scheduler
 """
 Entry point of the app -> main script for running the FastAPI application
 Data flow: User Command → collect_articles.py → NewsClient → NewsAPI → Article Model → JSON Output
@@ -45,15 +49,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Saved-Count", "X-Skipped-Count"],
 )
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
-# Initialize database tables on startup
+# Connect and initialize database tables on startup (importing the app never touches the database)
 @app.on_event("startup")
 async def startup():
     init_db()
+    # Poll NewsAPI in the background; enable in a single process when running several workers
+    if settings.INGESTION_ENABLED:
+        get_ingestion_scheduler().start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await get_ingestion_scheduler().stop()
+    ClassificationService.shutdown_executor()
+    DataCleaner.shutdown_executor()
+    dispose_engine()
+    await dispose_async_engine()
 
 @app.get("/")
 async def root(): #async for concurrent operations -> FastAPI runs it in its event loop
@@ -1,10 +1,13 @@
 from .article import Article
 from .stance import PoliticalStance, Classification, Consensus
-from .database import Base, ArticleModel, ClassificationModel, ConsensusModel
+from .database import (
+    Base, ArticleModel, ClassificationModel, ConsensusModel, IngestionWatermarkModel, ArticleMinHashBandModel
+)
 
 __all__ = [
     "Article", "PoliticalStance", "Classification", "Consensus",
-    "Base", "ArticleModel", "ClassificationModel", "ConsensusModel"
+    "Base", "ArticleModel", "ClassificationModel", "ConsensusModel", "IngestionWatermarkModel",
+    "ArticleMinHashBandModel"
 ]
 
 """
@@ -20,6 +20,8 @@ class Article(BaseModel):
     published_at: datetime
     url_to_image: Optional[HttpUrl] = None
     raw_data: Dict[str, Any] = Field(default_factory=dict)
+    # Packed MinHash signature set by DataCleaner (internal; never serialized)
+    minhash: Optional[bytes] = Field(default=None, exclude=True)
     
     class Config:
         from_attributes = True
@@ -5,11 +5,13 @@ This module defines the SQLAlchemy models for the PostgreSQL database, including
 - ArticleModel: Stores news articles with metadata and content
 - ClassificationModel: Tracks political stance classifications for articles
 - ConsensusModel: Stores identified consensus points between political viewpoints
+- IngestionWatermarkModel: Tracks the newest article ingested per polled topic or category
+- ArticleMinHashBandModel: LSH band index of article MinHash signatures for near-duplicate lookups
 
 The models use SQLAlchemy's declarative base and include:
 - Column definitions with appropriate data types
 - Relationships between models (e.g., article-classification)
-- Table names and constraints
+- Table names, constraints and indexes on the columns used for lookups and filtering
 - Default values and nullable settings
 
 These models serve as the foundation for:
@@ -21,7 +23,8 @@ These models serve as the foundation for:
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Enum, JSON, Text
+from sqlalchemy import DDL, BigInteger, Column, String, Integer, Float, DateTime, ForeignKey, Enum, JSON, LargeBinary, Text, Index, event, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -41,6 +44,11 @@ class ArticleModel(Base):
     Uses datetime type for timestamp fields (published_at)
     Uses enum type for political stance classification
     Uses JSON type for storing raw data from news API
+    Uses binary type for the packed MinHash signature (see ArticleMinHashBandModel)
+    and the fixed-width hash of the canonical URL
+    Indexes url (unique), url_hash, title, source_name and (published_at, id) for dedup
+    lookups, date-window filters and newest-first keyset pagination
+    On PostgreSQL, a stored search_document tsvector with a GIN index backs full-text search
     
     Attributes:
         id: Unique identifier for the article
@@ -48,30 +56,58 @@ class ArticleModel(Base):
         description: Article summary/description
         content: Full article content
         url: Original article URL
+        url_hash: 16-byte hash of the canonical URL (app.core.urls.url_hash), the article's dedup key
         source_id: ID of the news source
         source_name: Name of the news source
         author: Article author
         published_at: Publication timestamp
         url_to_image: URL to article's featured image
         raw_data: Raw JSON data from news API
+        minhash: Packed MinHash signature of title, description and content (app.core.near_duplicates)
     """
     __tablename__ = "articles"
+    __table_args__ = (
+        # Serves date-window filters and newest-first keyset pagination
+        Index("ix_articles_published_at_id", "published_at", "id"),
+    )
 
     id = Column(String, primary_key=True)
-    title = Column(Text, nullable=False)
+    title = Column(Text, nullable=False, index=True)
     description = Column(Text, nullable=True)
     content = Column(Text, nullable=True)
-    url = Column(String, nullable=False)
+    url = Column(String, nullable=False, unique=True, index=True)
+    url_hash = Column(LargeBinary(16), nullable=True, index=True)
     source_id = Column(String, nullable=True)
-    source_name = Column(String, nullable=False)
+    source_name = Column(String, nullable=False, index=True)
     author = Column(String, nullable=True)
     published_at = Column(DateTime, nullable=False)
     url_to_image = Column(String, nullable=True)
     raw_data = Column(JSON, nullable=True)
+    minhash = Column(LargeBinary, nullable=True)
     
     # One-to-one relationship with classification
     classification = relationship("ClassificationModel", back_populates="article", uselist=False)
 
+# PostgreSQL full-text document for an article (title ranks above description above content),
+# stored as a generated column so ranking reads the stored vector instead of re-parsing the
+# text of every matching row. The column and its GIN index only exist on PostgreSQL, so they
+# are created with DDL rather than mapped (ORM loads never select the column).
+SEARCH_DOCUMENT_DDL = (
+    "ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(content, '')), 'C')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_document ON articles USING gin (search_document)",
+    # Expression index used before the stored column existed
+    "DROP INDEX IF EXISTS ix_articles_search_vector",
+)
+
+for statement in SEARCH_DOCUMENT_DDL:
+    event.listen(ArticleModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+article_search_document = literal_column("articles.search_document", TSVECTOR)
+
 class ClassificationModel(Base):
     """SQLAlchemy model for political stance classifications.
 
@@ -79,6 +115,7 @@ class ClassificationModel(Base):
     Uses enum type for political stance classification
     Uses float type for confidence score for classification
     Uses datetime type for timestamp of classification
+    Enforces one classification per article with a unique index on article_id
     
     Attributes:
         id: Auto-incrementing primary key
@@ -89,7 +126,7 @@ class ClassificationModel(Base):
     __tablename__ = "classifications"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(String, ForeignKey("articles.id"), nullable=False)
+    article_id = Column(String, ForeignKey("articles.id"), nullable=False, unique=True, index=True)
     stance = Column(Enum(PoliticalStance), nullable=False)
     confidence = Column(Float, nullable=False)
     
@@ -118,4 +155,39 @@ class ConsensusModel(Base):
     center_points = Column(JSON, default=list)
     right_points = Column(JSON, default=list)
     common_ground = Column(JSON, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class IngestionWatermarkModel(Base):
+    """SQLAlchemy model for per-source ingestion progress.
+
+    Records the newest publication time ingested for each polled topic or
+    category, so the ingestion scheduler only requests and stores newer articles
+    
+    Attributes:
+        source: Polled source key ("topic:<query>" or "category:<name>:<country>")
+        published_at: Newest published_at ingested from the source (naive UTC)
+        updated_at: Timestamp of the last successful poll
+    """
+    __tablename__ = "ingestion_watermarks"
+
+    source = Column(String, primary_key=True)
+    published_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ArticleMinHashBandModel(Base):
+    """SQLAlchemy model for the near-duplicate LSH index.
+
+    Holds one row per LSH band of each stored article's MinHash signature.
+    Articles sharing a band_key are near-duplicate candidates, so incoming
+    articles are checked with one indexed lookup of their band keys instead
+    of a comparison against every stored article
+
+    Attributes:
+        band_key: Band number and hash of the band's rows (app.core.near_duplicates.band_keys)
+        article_id: Foreign key to the article
+    """
+    __tablename__ = "article_minhash_bands"
+
+    band_key = Column(BigInteger, primary_key=True)
+    # Band rows go with their article
+    article_id = Column(String, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,221 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.datetimes import parse_datetime, to_naive_utc
+from app.core.urls import url_hash
+from app.models.database import ArticleModel
+from app.services.article_service import ArticleService
+
+logger = logging.getLogger(__name__)
+
+class ArticleImporter:
+    """Service for loading collected article files straight into the articles table."""
+
+    # Rows staged and committed per batch
+    BATCH_SIZE = 5000
+
+    # Columns written, in COPY order
+    COLUMNS = (
+        "id", "title", "description", "content", "url", "url_hash", "source_id",
+        "source_name", "author", "published_at", "url_to_image", "raw_data"
+    )
+
+    # Temporary staging table COPY writes into on PostgreSQL (emptied on every commit)
+    STAGING_TABLE = "articles_import"
+
+    @staticmethod
+    def record_to_row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a collected article dict (as written by collect_articles.py) to an articles row.
+
+        Only the checks the table needs are made (no Pydantic validation): url,
+        title and published_at are required, and a missing id is derived from
+        the canonical URL hash the same way NewsClient does.
+
+        Args:
+            record: Article dict
+
+        Returns:
+            Row dict keyed by COLUMNS
+
+        Raises:
+            ValueError: If a required field is missing or published_at is not a recognized timestamp
+        """
+        url = record.get("url")
+        title = record.get("title")
+        published_at = record.get("published_at")
+        if not url or not title or not published_at:
+            raise ValueError("url, title and published_at are required")
+        if not url.startswith(("http://", "https://")):
+            url = f"https://{url}"
+        # Store naive UTC so COPY and parameterized inserts agree regardless of the session time zone
+        published_at = to_naive_utc(parse_datetime(published_at))
+
+        article_hash = url_hash(url)
+        return {
+            "id": record.get("id") or article_hash.hex(),
+            "title": title,
+            "description": record.get("description"),
+            "content": record.get("content"),
+            "url": url,
+            "url_hash": article_hash,
+            "source_id": record.get("source_id"),
+            "source_name": record.get("source_name") or "Unknown",
+            "author": record.get("author"),
+            "published_at": published_at,
+            "url_to_image": record.get("url_to_image"),
+            "raw_data": record.get("raw_data") or {},
+        }
+
+    @staticmethod
+    def import_records(
+        db: Session,
+        records: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_batch: Optional[Callable[[Dict[str, int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Import a stream of article dicts, committing one batch at a time.
+
+        Articles whose canonical URL hash (or id) is already stored, or repeats
+        within a batch, are skipped. On PostgreSQL each batch is loaded with
+        COPY into a temporary staging table and moved over with one
+        INSERT ... SELECT ... WHERE NOT EXISTS ... ON CONFLICT DO NOTHING;
+        elsewhere existing hashes are looked up with one query per batch and
+        new rows are inserted with executemany. Either way a batch that fails
+        is retried row by row, so a bad row is counted as errored instead of
+        aborting its batch. Records are consumed lazily, so memory use is
+        bounded by batch_size. Near duplicates are not checked and no MinHash signatures
+        are written; run ArticleService.index_near_duplicates afterwards.
+
+        Args:
+            db: Database session
+            records: Article dicts, e.g. from app.core.article_files.iter_records
+            batch_size: Rows per batch (default: BATCH_SIZE)
+            on_batch: Optional callback receiving the running totals after each batch
+
+        Returns:
+            Dict with saved, skipped and errored counts
+        """
+        batch_size = batch_size or ArticleImporter.BATCH_SIZE
+        is_postgres = db.get_bind().dialect.name == "postgresql"
+        totals = {"saved": 0, "skipped": 0, "errored": 0}
+
+        for batch in ArticleImporter._batches(records, batch_size):
+            rows: List[Dict[str, Any]] = []
+            seen_hashes = set()
+            for record in batch:
+                try:
+                    row = ArticleImporter.record_to_row(record)
+                except (ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"Skipping invalid article {record.get('id') if isinstance(record, dict) else record!r}: {e}")
+                    totals["errored"] += 1
+                    continue
+                if row["url_hash"] in seen_hashes:
+                    totals["skipped"] += 1
+                    continue
+                seen_hashes.add(row["url_hash"])
+                rows.append(row)
+
+            if rows:
+                try:
+                    if is_postgres:
+                        counts = ArticleImporter._copy_batch(db, rows)
+                    else:
+                        counts = ArticleImporter._insert_batch(db, rows)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                for status in totals:
+                    totals[status] += counts[status]
+
+            if on_batch:
+                on_batch(dict(totals))
+        return totals
+
+    @staticmethod
+    def _copy_batch(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Load a batch with COPY into the staging table and insert the rows that are not stored yet.
+
+        The COPY runs in a savepoint. If any row makes it fail, the savepoint is
+        rolled back and the batch goes through _insert_batch instead, which
+        isolates and counts the failing rows like the non-PostgreSQL path.
+        """
+        try:
+            with db.begin_nested():
+                return ArticleImporter._copy_rows(db, rows)
+        except Exception as e:
+            logger.warning(f"COPY of {len(rows)} articles failed, inserting them row by row: {e}")
+        return ArticleImporter._insert_batch(db, rows, is_postgres=True)
+
+    @staticmethod
+    def _copy_rows(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """COPY a batch into the staging table and move the new rows into articles in one statement."""
+        columns = ", ".join(ArticleImporter.COLUMNS)
+        staging = ArticleImporter.STAGING_TABLE
+        # Raw psycopg connection of the session's current transaction
+        dbapi_connection = db.connection().connection.dbapi_connection
+
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                f"(LIKE {ArticleModel.__tablename__} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+            with cursor.copy(f"COPY {staging} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row([
+                        json.dumps(row["raw_data"]) if column == "raw_data" else row[column]
+                        for column in ArticleImporter.COLUMNS
+                    ])
+            # url_hash is not unique, so canonical URL matches are excluded explicitly
+            cursor.execute(
+                f"INSERT INTO {ArticleModel.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {staging} AS s WHERE NOT EXISTS ("
+                f"SELECT 1 FROM {ArticleModel.__tablename__} AS a WHERE a.url_hash = s.url_hash"
+                f") ON CONFLICT DO NOTHING"
+            )
+            saved = cursor.rowcount
+
+        return {"saved": saved, "skipped": len(rows) - saved, "errored": 0}
+
+    @staticmethod
+    def _insert_batch(db: Session, rows: List[Dict[str, Any]], is_postgres: bool = False) -> Dict[str, int]:
+        """Skip rows whose URL hash or id is stored, then insert the rest, isolating rows that fail."""
+        existing = db.execute(
+            select(ArticleModel.id, ArticleModel.url_hash).where(
+                ArticleModel.url_hash.in_([row["url_hash"] for row in rows])
+                | ArticleModel.id.in_([row["id"] for row in rows])
+            )
+        ).all()
+        existing_hashes = {row.url_hash for row in existing}
+        existing_ids = {row.id for row in existing}
+
+        items = [
+            {"row": row, "result": {"status": "saved"}}
+            for row in rows
+            if row["url_hash"] not in existing_hashes and row["id"] not in existing_ids
+        ]
+        if items:
+            ArticleService._insert_chunk(db, items, is_postgres)
+
+        saved = sum(1 for item in items if item["result"]["status"] == "saved")
+        errored = sum(1 for item in items if item["result"]["status"] == "error")
+        return {"saved": saved, "skipped": len(rows) - saved - errored, "errored": errored}
+
+    @staticmethod
+    def _batches(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+        """Yield successive batches from an iterable without materializing it."""
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
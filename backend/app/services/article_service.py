@@ -1,10 +1,19 @@
-from typing import List
+from typing import List, Dict, Any, Iterator, Optional
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.datetimes import to_naive_utc
+from app.core.near_duplicates import MinHashIndex, band_keys, minhash, signature_from_bytes, signature_to_bytes
+from app.core.urls import url_hash
 from app.models.article import Article
-from app.models.database import ArticleModel
+from app.models.database import ArticleMinHashBandModel, ArticleModel
 
 class ArticleService:
     """Service for managing articles in the database."""
+
+    # Maximum number of articles handled per dedup query / INSERT statement
+    BULK_CHUNK_SIZE = 1000
     
     @staticmethod
     def save_articles(db: Session, articles: List[Article]) -> List[ArticleModel]:
@@ -23,10 +32,11 @@ class ArticleService:
                 description=article.description,
                 content=article.content,
                 url=str(article.url),
+                url_hash=url_hash(str(article.url)),
                 source_id=article.source_id,
                 source_name=article.source_name,
                 author=article.author,
-                published_at=article.published_at,
+                published_at=to_naive_utc(article.published_at),
                 raw_data=article.raw_data
             )
             
@@ -34,4 +44,281 @@ class ArticleService:
             db_articles.append(db_article)
             
         db.commit()
-        return db_articles 
\ No newline at end of file
+        return db_articles
+
+    @staticmethod
+    def bulk_save_articles(db: Session, articles: List[Article]) -> Dict[str, Any]:
+        """
+        Save a batch of articles using set-based queries.
+
+        Duplicates (by canonical URL, then by title) are resolved with one lookup
+        query per chunk instead of two queries per article: URLs are compared by
+        their fixed-width url_hash (app.core.urls), so links differing only in
+        tracking parameters, scheme, "www." or a trailing slash match with an
+        indexed equality probe. New rows are written with a
+        single multi-row INSERT per chunk. On PostgreSQL the INSERT uses
+        ON CONFLICT DO NOTHING ... RETURNING so rows raced in by a concurrent
+        writer are reported as skipped rather than failing the batch.
+
+        Unless settings.NEAR_DUPLICATE_THRESHOLD is 0, articles are also
+        skipped as near duplicates (e.g. syndicated copies of a wire story)
+        when their MinHash signature is that similar to a stored article or to
+        an earlier article of the batch; the result's duplicate_of names the
+        kept article. Stored candidates are found through the LSH band index
+        (ArticleMinHashBandModel) with one lookup per chunk, and the bands of
+        saved articles are added to it.
+
+        Args:
+            db: Database session
+            articles: List of Article objects
+
+        Returns:
+            Dict with saved/skipped/errored counts and a per-article result list
+        """
+        results: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+        seen_hashes = set()
+        seen_titles = set()
+        threshold = settings.NEAR_DUPLICATE_THRESHOLD
+
+        for index, article in enumerate(articles):
+            article_url = str(article.url)
+            if not article_url.startswith(("http://", "https://")):
+                article_url = f"https://{article_url}"
+
+            result = {"index": index, "id": article.id, "url": article_url, "status": "saved"}
+            results.append(result)
+
+            # Deduplicate within the batch itself
+            article_hash = url_hash(article_url)
+            if article_hash in seen_hashes or article.title in seen_titles:
+                result["status"] = "skipped"
+                result["detail"] = "Duplicate within batch"
+                continue
+            seen_hashes.add(article_hash)
+            seen_titles.add(article.title)
+
+            article_id = article.id or article_hash.hex()
+            result["id"] = article_id
+            signature = None
+            if threshold > 0:
+                # DataCleaner has usually fingerprinted the article already
+                if article.minhash:
+                    signature = signature_from_bytes(article.minhash)
+                else:
+                    signature = minhash(article.title, article.description, article.content)
+            pending.append({
+                "result": result,
+                "signature": signature,
+                "row": {
+                    "id": article_id,
+                    "title": article.title,
+                    "description": article.description,
+                    "content": article.content,
+                    "url": article_url,
+                    "url_hash": article_hash,
+                    "source_id": article.source_id,
+                    "source_name": article.source_name,
+                    "author": article.author,
+                    "published_at": to_naive_utc(article.published_at),
+                    "url_to_image": str(article.url_to_image) if article.url_to_image else None,
+                    "raw_data": article.raw_data or {},
+                    "minhash": signature_to_bytes(signature) if signature else None,
+                },
+            })
+
+        near_duplicates = MinHashIndex(threshold) if threshold > 0 else None
+        is_postgres = db.get_bind().dialect.name == "postgresql"
+        for chunk in ArticleService._chunks(pending, ArticleService.BULK_CHUNK_SIZE):
+            # One query to find every URL hash or title in the chunk that is already stored
+            hashes = [item["row"]["url_hash"] for item in chunk]
+            titles = [item["row"]["title"] for item in chunk]
+            existing = db.execute(
+                select(ArticleModel.url_hash, ArticleModel.title).where(
+                    or_(ArticleModel.url_hash.in_(hashes), ArticleModel.title.in_(titles))
+                )
+            ).all()
+            existing_hashes = {row.url_hash for row in existing}
+            existing_titles = {row.title for row in existing}
+
+            to_insert = []
+            for item in chunk:
+                if item["row"]["url_hash"] in existing_hashes:
+                    item["result"]["status"] = "skipped"
+                    item["result"]["detail"] = "URL already exists"
+                elif item["row"]["title"] in existing_titles:
+                    item["result"]["status"] = "skipped"
+                    item["result"]["detail"] = "Title already exists"
+                else:
+                    to_insert.append(item)
+
+            if near_duplicates is None:
+                if to_insert:
+                    ArticleService._insert_chunk(db, to_insert, is_postgres)
+                continue
+
+            while to_insert:
+                to_insert = ArticleService._skip_near_duplicates(db, to_insert, near_duplicates)
+                if not to_insert:
+                    break
+                ArticleService._insert_chunk(db, to_insert, is_postgres)
+                ArticleService._insert_bands(db, [
+                    (item["row"]["id"], item["signature"]) for item in to_insert
+                    if item["signature"] and item["result"]["status"] == "saved"
+                ])
+                to_insert = ArticleService._unindex_failed(to_insert, chunk, near_duplicates)
+
+        db.commit()
+
+        counts = {"saved": 0, "skipped": 0, "errored": 0}
+        for result in results:
+            counts["errored" if result["status"] == "error" else result["status"]] += 1
+        return {**counts, "results": results}
+
+    @staticmethod
+    def _insert_chunk(db: Session, items: List[Dict[str, Any]], is_postgres: bool) -> None:
+        """Insert one chunk of rows, isolating failing rows if the chunk insert fails."""
+        rows = [item["row"] for item in items]
+        try:
+            with db.begin_nested():
+                if is_postgres:
+                    stmt = pg_insert(ArticleModel).values(rows).on_conflict_do_nothing()
+                    inserted_ids = set(db.execute(stmt.returning(ArticleModel.id)).scalars())
+                    for item in items:
+                        if item["row"]["id"] not in inserted_ids:
+                            item["result"]["status"] = "skipped"
+                            item["result"]["detail"] = "Conflicts with an existing article"
+                else:
+                    db.execute(insert(ArticleModel), rows)
+            return
+        except Exception as e:
+            if len(items) == 1:
+                items[0]["result"]["status"] = "error"
+                items[0]["result"]["detail"] = str(getattr(e, "orig", e))
+                return
+
+        # Retry row by row so a single bad article does not fail the whole chunk
+        for item in items:
+            ArticleService._insert_chunk(db, [item], is_postgres)
+
+    @staticmethod
+    def _skip_near_duplicates(db: Session, items: List[Dict[str, Any]], index: MinHashIndex) -> List[Dict[str, Any]]:
+        """Mark items near-duplicating a stored or earlier article as skipped and return the rest."""
+        keys = {key for item in items if item["signature"] for key in band_keys(item["signature"])}
+        ArticleService._load_candidates(db, keys, index)
+
+        kept = []
+        for item in items:
+            signature = item["signature"]
+            if signature:
+                match = index.find(signature)
+                if match is not None:
+                    item["result"]["status"] = "skipped"
+                    item["result"]["detail"] = f"Near-duplicate of article {match}"
+                    item["result"]["duplicate_of"] = match
+                    continue
+                index.add(item["row"]["id"], signature)
+            kept.append(item)
+        return kept
+
+    @staticmethod
+    def _unindex_failed(inserted: List[Dict[str, Any]], chunk: List[Dict[str, Any]], index: MinHashIndex) -> List[Dict[str, Any]]:
+        """
+        Drop the rows that were not inserted from the index and return the items skipped as their near duplicates.
+
+        _skip_near_duplicates indexes kept rows before they are inserted, so
+        later rows of the chunk are checked against them; a row that then
+        fails must not go on hiding its near duplicates. The returned items
+        are reset so they can be checked and inserted again.
+        """
+        failed = {item["row"]["id"] for item in inserted if item["result"]["status"] != "saved"}
+        if not failed:
+            return []
+        for article_id in failed:
+            index.remove(article_id)
+
+        retry = []
+        for item in chunk:
+            result = item["result"]
+            if result.get("duplicate_of") in failed:
+                result["status"] = "saved"
+                result.pop("detail", None)
+                result.pop("duplicate_of", None)
+                retry.append(item)
+        return retry
+
+    @staticmethod
+    def _load_candidates(db: Session, keys: set, index: MinHashIndex) -> None:
+        """Add the stored articles sharing any of the band keys to an in-memory index."""
+        keys = list(keys)
+        for start in range(0, len(keys), ArticleService.BULK_CHUNK_SIZE):
+            rows = db.execute(
+                select(ArticleModel.id, ArticleModel.minhash)
+                .join(ArticleMinHashBandModel, ArticleMinHashBandModel.article_id == ArticleModel.id)
+                .where(ArticleMinHashBandModel.band_key.in_(keys[start:start + ArticleService.BULK_CHUNK_SIZE]))
+            ).all()
+            for article_id, packed in rows:
+                if packed and article_id not in index:
+                    index.add(article_id, signature_from_bytes(packed))
+
+    @staticmethod
+    def _insert_bands(db: Session, signatures: List[tuple]) -> None:
+        """Insert the LSH band rows of newly fingerprinted (article_id, signature) pairs."""
+        rows = [
+            {"band_key": key, "article_id": article_id}
+            for article_id, signature in signatures
+            for key in band_keys(signature)
+        ]
+        if rows:
+            db.execute(insert(ArticleMinHashBandModel), rows)
+
+    @staticmethod
+    def index_near_duplicates(db: Session, chunk_size: Optional[int] = None) -> int:
+        """
+        Fingerprint stored articles that have no MinHash signature yet.
+
+        Articles written without one (by an older version, or by the bulk
+        importer, which skips fingerprinting to keep COPY fast) get their
+        signature and LSH band rows here, one committed chunk at a time, so
+        later batches are checked against them. Existing near duplicates among
+        them are left in place.
+
+        Args:
+            db: Database session
+            chunk_size: Articles per chunk (default: BULK_CHUNK_SIZE)
+
+        Returns:
+            Number of articles fingerprinted
+        """
+        chunk_size = chunk_size or ArticleService.BULK_CHUNK_SIZE
+        indexed = 0
+        last_id = ""
+        while True:
+            rows = db.execute(
+                select(ArticleModel.id, ArticleModel.title, ArticleModel.description, ArticleModel.content)
+                .where(ArticleModel.minhash.is_(None), ArticleModel.id > last_id)
+                .order_by(ArticleModel.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            signatures = [(row.id, minhash(row.title, row.description, row.content)) for row in rows]
+            signatures = [(article_id, signature) for article_id, signature in signatures if signature]
+            if signatures:
+                db.execute(update(ArticleModel), [
+                    {"id": article_id, "minhash": signature_to_bytes(signature)}
+                    for article_id, signature in signatures
+                ])
+                ArticleService._insert_bands(db, signatures)
+            db.commit()
+
+            indexed += len(signatures)
+            last_id = rows[-1].id
+        return indexed
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+        """Yield successive fixed-size chunks from a list."""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
@@ -0,0 +1,172 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import exists, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.stance_classifier import classify_batch
+from app.models.stance import Classification, PoliticalStance
+from app.models.database import ArticleModel, ClassificationModel
+
+class ClassificationService:
+    """Service for classifying the political stance of stored articles in batches."""
+
+    # Number of articles read, classified and inserted per transaction
+    CHUNK_SIZE = settings.CLASSIFICATION_CHUNK_SIZE
+
+    # Chunks smaller than this are classified inline; shipping them to the pool costs more than it saves
+    MIN_PARALLEL_BATCH = 200
+
+    _executor: Optional[Executor] = None
+
+    @staticmethod
+    def get_executor() -> Optional[Executor]:
+        """Get the shared classification pool, creating it on first use (None when inline)."""
+        kind = settings.CLASSIFICATION_EXECUTOR.lower()
+        if kind == "inline":
+            return None
+        if ClassificationService._executor is None:
+            workers = settings.CLASSIFICATION_WORKERS or os.cpu_count() or 1
+            if kind == "thread":
+                ClassificationService._executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                ClassificationService._executor = ProcessPoolExecutor(max_workers=workers)
+        return ClassificationService._executor
+
+    @staticmethod
+    def shutdown_executor() -> None:
+        """Shut down the classification pool, if one was started."""
+        if ClassificationService._executor is not None:
+            ClassificationService._executor.shutdown(wait=True, cancel_futures=True)
+            ClassificationService._executor = None
+
+    @staticmethod
+    def _window_filter(stmt, topic: Optional[str], days_back: int):
+        """Restrict a statement to articles in the analysis window."""
+        if topic:
+            stmt = stmt.where(ArticleModel.title.ilike(f"%{topic}%"))
+        return stmt.where(
+            ArticleModel.published_at >= datetime.utcnow() - timedelta(days=days_back)
+        )
+
+    @staticmethod
+    def classify_unclassified(
+        db: Session,
+        topic: Optional[str] = None,
+        days_back: int = 7,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Classify every unclassified article in the window, one chunk at a time.
+
+        Unclassified articles are selected with a NOT EXISTS anti-join, only the
+        text columns are read, and each chunk's classifications are written
+        with one bulk INSERT and committed before the next chunk is read, so
+        neither memory nor transaction size grows with the window. Scoring of
+        each chunk is spread over the classification pool (see get_executor).
+        This is blocking code: call it from a worker thread, not the event loop.
+
+        Args:
+            db: Database session
+            topic: Optional topic the article title must contain
+            days_back: Number of days to look back for articles
+            chunk_size: Number of articles per chunk (default: CHUNK_SIZE)
+
+        Yields:
+            Progress dicts with processed and total counts after each chunk
+        """
+        chunk_size = chunk_size or ClassificationService.CHUNK_SIZE
+        unclassified = ~exists().where(ClassificationModel.article_id == ArticleModel.id)
+
+        total = db.execute(
+            ClassificationService._window_filter(
+                select(func.count()).select_from(ArticleModel).where(unclassified), topic, days_back
+            )
+        ).scalar_one()
+        yield {"processed": 0, "total": total}
+
+        processed = 0
+        last_id = ""
+        is_postgres = db.get_bind().dialect.name == "postgresql"
+        while True:
+            rows = db.execute(
+                ClassificationService._window_filter(
+                    select(
+                        ArticleModel.id,
+                        ArticleModel.title,
+                        ArticleModel.description,
+                        ArticleModel.content
+                    ).where(unclassified, ArticleModel.id > last_id),
+                    topic,
+                    days_back
+                ).order_by(ArticleModel.id).limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            results = [
+                {"article_id": article_id, "stance": stance, "confidence": confidence}
+                for article_id, stance, confidence in ClassificationService._classify_rows(rows)
+            ]
+            ClassificationService._insert_classifications(db, results, is_postgres)
+            db.commit()
+
+            processed += len(rows)
+            last_id = rows[-1].id
+            yield {"processed": processed, "total": total}
+
+    @staticmethod
+    def _classify_rows(rows) -> List[Tuple[str, PoliticalStance, float]]:
+        """Classify rows of (id, title, description, content), splitting them across the pool."""
+        items = [(row.id, row.title, row.description, row.content) for row in rows]
+        lexicon_path = settings.STANCE_LEXICON_PATH or None
+        executor = ClassificationService.get_executor()
+        if executor is None or len(items) < ClassificationService.MIN_PARALLEL_BATCH:
+            return classify_batch(items, lexicon_path)
+
+        workers = settings.CLASSIFICATION_WORKERS or os.cpu_count() or 1
+        part_size = max(ClassificationService.MIN_PARALLEL_BATCH // 2, -(-len(items) // workers))
+        futures = [
+            executor.submit(classify_batch, items[start:start + part_size], lexicon_path)
+            for start in range(0, len(items), part_size)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    @staticmethod
+    def _insert_classifications(db: Session, results: List[Dict[str, Any]], is_postgres: bool) -> None:
+        """Bulk insert classifications, ignoring articles classified concurrently."""
+        if is_postgres:
+            db.execute(pg_insert(ClassificationModel).values(results).on_conflict_do_nothing())
+        else:
+            db.execute(insert(ClassificationModel), results)
+
+    @staticmethod
+    def get_classifications(db: Session, topic: Optional[str] = None, days_back: int = 7) -> List[Classification]:
+        """
+        Get the classifications of all articles in the window with one joined query.
+
+        Args:
+            db: Database session
+            topic: Optional topic the article title must contain
+            days_back: Number of days to look back for articles
+
+        Returns:
+            List of Classification objects
+        """
+        rows = db.execute(
+            ClassificationService._window_filter(
+                select(
+                    ClassificationModel.article_id,
+                    ClassificationModel.stance,
+                    ClassificationModel.confidence
+                ).join(ArticleModel, ClassificationModel.article_id == ArticleModel.id),
+                topic,
+                days_back
+            )
+        ).all()
+        return [
+            Classification(article_id=row.article_id, stance=row.stance, confidence=row.confidence)
+            for row in rows
+        ]
@@ -0,0 +1,301 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.data_cleaner import DataCleaner
+from app.core.datetimes import to_naive_utc
+from app.db.session import SessionLocal
+from app.models.article import Article
+from app.models.database import IngestionWatermarkModel
+from app.services.article_service import ArticleService
+from app.services.news_client import FetchReport, NewsClient
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class IngestionSource:
+    """A topic query or a headline category polled by the scheduler."""
+    kind: str  # "topic" or "category"
+    query: str
+    country: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Watermark key of the source."""
+        if self.kind == "category":
+            return f"category:{self.query}:{self.country or ''}"
+        return f"topic:{self.query}"
+
+class IngestionScheduler:
+    """Background worker that keeps the article table up to date.
+
+    One poller task per source fetches articles newer than the source's
+    watermark every `interval` seconds and puts them on a bounded queue. A
+    single writer task cleans each batch with DataCleaner, saves it with
+    ArticleService.bulk_save_articles in a worker thread and only then advances
+    the watermark. When the writer falls behind, the full queue blocks the
+    pollers (backpressure) instead of letting fetched batches pile up in memory.
+
+    The watermark only moves past articles that were all fetched and saved.
+    A poll with failed pages or errored rows keeps it, so the same window is
+    retried. Topic polls are newest first, so when one is truncated (by
+    max_results or the plan's result limit) the articles between the
+    watermark and the oldest one fetched are still missing: the following
+    polls fetch only that gap, up to the oldest article fetched so far, and
+    once a poll covers the rest of it the watermark jumps to the newest
+    article seen.
+    """
+
+    def __init__(
+        self,
+        sources: List[IngestionSource],
+        interval: Optional[float] = None,
+        max_results: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        news_client: Optional[NewsClient] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            sources: Topics and categories to poll
+            interval: Seconds between polls of each source (default: settings.INGESTION_INTERVAL)
+            max_results: Maximum results requested per poll (default: settings.INGESTION_MAX_RESULTS)
+            queue_size: Batches that may wait for the writer (default: settings.INGESTION_QUEUE_SIZE)
+            news_client: NewsAPI client (default: a new NewsClient without the response
+                         cache, since polls repeat the same request and must see new pages)
+        """
+        self.sources = sources
+        self.interval = interval or settings.INGESTION_INTERVAL
+        self.max_results = max_results or settings.INGESTION_MAX_RESULTS
+        self.queue_size = queue_size or settings.INGESTION_QUEUE_SIZE
+        self.news_client = news_client
+        self.cleaner = DataCleaner()
+        self.stats: Dict[str, Dict[str, int]] = {
+            source.key: {"polls": 0, "incomplete": 0, "fetched": 0, "saved": 0, "skipped": 0, "errored": 0}
+            for source in sources
+        }
+        self._watermarks: Dict[str, Optional[datetime]] = {}
+        # Sources with a gap below a truncated poll: (newest missing at most, newest seen)
+        self._backfills: Dict[str, Tuple[datetime, datetime]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def from_settings(cls) -> "IngestionScheduler":
+        """Create a scheduler for the topics and categories listed in settings."""
+        sources = [
+            IngestionSource("topic", topic.strip())
+            for topic in settings.INGESTION_TOPICS.split(",") if topic.strip()
+        ]
+        sources += [
+            IngestionSource("category", category.strip(), settings.INGESTION_COUNTRY or None)
+            for category in settings.INGESTION_CATEGORIES.split(",") if category.strip()
+        ]
+        return cls(sources)
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler's tasks are running."""
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start the writer and one poller per source on the running event loop."""
+        if self.running:
+            return
+        if self.news_client is None:
+            self.news_client = NewsClient(use_cache=False)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._write_batches(), name="ingestion-writer")]
+        self._tasks += [
+            asyncio.create_task(self._poll(source), name=f"ingestion-{source.key}")
+            for source in self.sources
+        ]
+        logger.info(f"Ingestion started for {len(self.sources)} sources every {self.interval}s")
+
+    async def stop(self) -> None:
+        """Cancel the pollers and the writer and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Ingestion stopped")
+
+    async def run_once(self) -> Dict[str, Dict[str, int]]:
+        """
+        Poll every source once and save everything fetched, then return the stats.
+
+        Used by the standalone runner and for manual backfills.
+        """
+        if self.news_client is None:
+            self.news_client = NewsClient(use_cache=False)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        writer = asyncio.create_task(self._write_batches())
+        try:
+            await asyncio.gather(*(self._poll_source(source) for source in self.sources))
+            await self._queue.join()
+        finally:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        return self.stats
+
+    async def _poll(self, source: IngestionSource) -> None:
+        """Poll one source forever, every `interval` seconds."""
+        while True:
+            try:
+                await self._poll_source(source)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error polling {source.key}: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def _poll_source(self, source: IngestionSource) -> None:
+        """Fetch one source's articles newer than its watermark (or in its gap) and queue them for saving."""
+        watermark = await self._get_watermark(source)
+        backfill = self._backfills.get(source.key)
+        until = backfill[0] if backfill else None
+        report = FetchReport()
+        if source.kind == "topic":
+            articles = self.news_client.iter_articles_by_topic(
+                source.query, max_results=self.max_results, since=watermark, until=until, report=report
+            )
+        else:
+            articles = self.news_client.iter_top_headlines(
+                source.query, source.country, max_results=self.max_results, report=report
+            )
+
+        # NewsAPI's "from" is inclusive and top headlines have no date filter, so filter here too
+        batch = []
+        async for article in articles:
+            published_at = to_naive_utc(article.published_at)
+            if (watermark is None or published_at > watermark) and (until is None or published_at <= until):
+                batch.append(article)
+        self.stats[source.key]["polls"] += 1
+        self.stats[source.key]["fetched"] += len(batch)
+        if not report.complete:
+            self.stats[source.key]["incomplete"] += 1
+            logger.warning(
+                f"Incomplete poll of {source.key}: truncated={report.truncated}, "
+                f"failed pages={report.failed_pages}"
+            )
+        # An empty poll still matters when it shows a gap is filled
+        if batch or backfill:
+            # Blocks while the writer is behind
+            await self._queue.put((source, batch, report, backfill))
+
+    async def _write_batches(self) -> None:
+        """Clean and save queued batches one at a time, advancing watermarks after each save."""
+        while True:
+            source, batch, report, backfill = await self._queue.get()
+            try:
+                result = await asyncio.to_thread(self._save_batch, source, batch, report, backfill)
+                for status in ("saved", "skipped", "errored"):
+                    self.stats[source.key][status] += result[status]
+                logger.info(
+                    f"Ingested {source.key}: {result['saved']} saved, "
+                    f"{result['skipped']} skipped, {result['errored']} errored"
+                )
+            except Exception as e:
+                logger.error(f"Error saving batch from {source.key}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _save_batch(
+        self,
+        source: IngestionSource,
+        batch: List[Article],
+        report: FetchReport,
+        backfill: Optional[Tuple[datetime, datetime]] = None
+    ) -> Dict[str, int]:
+        """Clean and bulk-save a batch and advance the source's progress (runs in a worker thread)."""
+        articles = self.cleaner.clean_articles(batch)
+
+        db = SessionLocal()
+        try:
+            result = ArticleService.bulk_save_articles(db, articles) if articles else {
+                "saved": 0, "skipped": 0, "errored": 0
+            }
+            watermark, backfill = self._next_progress(source, batch, report, backfill, result["errored"])
+            if watermark is not None:
+                self._store_watermark(db, source, watermark)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if watermark is not None:
+            current = self._watermarks.get(source.key)
+            self._watermarks[source.key] = watermark if current is None else max(current, watermark)
+        if backfill is None:
+            self._backfills.pop(source.key, None)
+        else:
+            self._backfills[source.key] = backfill
+        return result
+
+    @staticmethod
+    def _next_progress(
+        source: IngestionSource,
+        batch: List[Article],
+        report: FetchReport,
+        backfill: Optional[Tuple[datetime, datetime]],
+        errored: int
+    ) -> Tuple[Optional[datetime], Optional[Tuple[datetime, datetime]]]:
+        """
+        Decide how far a saved poll moves a source's progress.
+
+        Returns:
+            Tuple of (new watermark, or None to keep it; gap still to fill, or None)
+        """
+        if errored or report.failed_pages:
+            # Something in the window may be missing: poll the same window again
+            return None, backfill
+
+        published = [to_naive_utc(article.published_at) for article in batch]
+        newest = max(published + ([backfill[1]] if backfill else []), default=None)
+        if report.truncated:
+            if source.kind != "topic" or not published:
+                # Headlines have no date filter to page back with; keep polling from the watermark
+                return None, backfill
+            # Newest first: everything older than the oldest fetched article was cut off
+            return None, (min(published), newest)
+        return newest, None
+
+    async def _get_watermark(self, source: IngestionSource) -> Optional[datetime]:
+        """Get the newest published_at ingested from a source, loading it from the database once."""
+        if source.key not in self._watermarks:
+            self._watermarks[source.key] = await asyncio.to_thread(self._load_watermark, source)
+        return self._watermarks[source.key]
+
+    @staticmethod
+    def _load_watermark(source: IngestionSource) -> Optional[datetime]:
+        """Read a source's watermark from the database."""
+        db = SessionLocal()
+        try:
+            row = db.get(IngestionWatermarkModel, source.key)
+            return row.published_at if row else None
+        finally:
+            db.close()
+
+    @staticmethod
+    def _store_watermark(db: Session, source: IngestionSource, published_at: datetime) -> None:
+        """Advance a source's watermark (never moves it backwards)."""
+        row = db.get(IngestionWatermarkModel, source.key)
+        if row is None:
+            db.add(IngestionWatermarkModel(source=source.key, published_at=published_at))
+        else:
+            row.published_at = max(row.published_at, published_at)
+            row.updated_at = datetime.utcnow()
+
+@lru_cache(maxsize=None)
+def get_ingestion_scheduler() -> IngestionScheduler:
+    """Get the process-wide scheduler configured from settings."""
+    return IngestionScheduler.from_settings()
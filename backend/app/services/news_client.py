@@ -1,24 +1,116 @@
+import asyncio
 import logging
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, UTC
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional
+import httpx
 from newsapi import NewsApiClient
+from ..core.cache import TTLCache
 from ..core.config import settings
+from ..core.datetimes import parse_datetime
+from ..core.rate_limiter import TokenBucket
+from ..core.urls import article_id_for_url
 from ..models.article import Article
 
+# How much of each raw NewsAPI article to keep in Article.raw_data
+RAW_DATA_MODES = ("full", "compact", "none")
+
+# NewsAPI article fields already copied onto Article fields, dropped in "compact" mode
+MAPPED_FIELDS = frozenset(
+    ("title", "description", "content", "url", "source", "author", "publishedAt", "urlToImage")
+)
+
+def compact_raw_data(article_data: Dict[str, Any], mode: str) -> Dict[str, Any]:
+    """Get the raw_data to store for a raw NewsAPI article under a RAW_DATA_MODES mode."""
+    if mode == "full":
+        return article_data
+    if mode == "compact":
+        return {
+            name: value for name, value in article_data.items()
+            if name not in MAPPED_FIELDS and value is not None
+        }
+    return {}
+
+# NewsAPI error code for pages past the plan's result limit
+MAXIMUM_RESULTS_REACHED = "maximumResultsReached"
+
+@dataclass
+class FetchReport:
+    """How much of a multi-page query was fetched, filled in while its pages are read.
+
+    A fetch is truncated when matching results were left unfetched on purpose
+    (max_results, or NewsAPI's per-plan result limit); failed_pages lists the
+    pages that errored and were skipped.
+    """
+    total_results: int = 0
+    truncated: bool = False
+    failed_pages: List[int] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every matching result was fetched."""
+        return not self.truncated and not self.failed_pages
+
+@lru_cache(maxsize=None)
+def get_response_cache() -> Optional[TTLCache]:
+    """Get the process-wide NewsAPI response cache, or None if caching is disabled."""
+    if settings.NEWS_API_CACHE_TTL <= 0:
+        return None
+    return TTLCache(
+        max_entries=settings.NEWS_API_CACHE_SIZE,
+        ttl=settings.NEWS_API_CACHE_TTL,
+        path=settings.NEWS_API_CACHE_PATH or None
+    )
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """Get the process-wide NewsAPI rate limiter, or None if requests are unlimited."""
+    if settings.NEWS_API_RATE_LIMIT <= 0:
+        return None
+    return TokenBucket(
+        rate=settings.NEWS_API_RATE_LIMIT,
+        capacity=settings.NEWS_API_RATE_BURST or None,
+        path=settings.NEWS_API_RATE_LIMIT_PATH or None
+    )
+
 class NewsClient:
     """Client for interacting with NewsAPI."""
     
     def __init__(
         self, 
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[TTLCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        raw_data_mode: Optional[str] = None,
+        use_cache: bool = True,
     ):
-        """Initialize NewsAPI client with API credentials."""
+        """Initialize NewsAPI client with API credentials.
+        
+        Args:
+            api_key: NewsAPI key (default: settings.NEWS_API_KEY)
+            base_url: REST API base URL used by the multi-page fetchers
+                      (default: settings.NEWS_API_BASE_URL)
+            cache: Response cache (default: the shared cache from settings)
+            rate_limiter: Request rate limiter (default: the shared limiter from settings)
+            raw_data_mode: How much of each raw article to keep in raw_data, one of
+                           RAW_DATA_MODES (default: settings.NEWS_API_RAW_DATA)
+            use_cache: Serve responses from the cache; False always requests fresh pages
+        """
         self.api_key = api_key or settings.NEWS_API_KEY
         
         if not self.api_key:
             raise ValueError("News API Key is required")
         
+        self.base_url = (base_url or settings.NEWS_API_BASE_URL).rstrip('/')
         self.client = NewsApiClient(api_key=self.api_key)
+        self.cache = (cache or get_response_cache()) if use_cache else None
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.raw_data_mode = raw_data_mode or settings.NEWS_API_RAW_DATA
+        if self.raw_data_mode not in RAW_DATA_MODES:
+            raise ValueError(f"raw_data_mode must be one of {RAW_DATA_MODES}")
         self.logger = logging.getLogger(__name__)
     
     def get_articles_by_topic(
@@ -54,7 +146,16 @@ class NewsClient:
         
         try:
             # Use everything endpoint to get articles
-            response = self.client.get_everything(
+            params = {
+                'q': topic,
+                'language': language,
+                'from': from_date_str,
+                'to': to_date_str,
+                'sortBy': 'relevancy',
+                'pageSize': page_size,
+                'page': page
+            }
+            response = self._cached_call('/everything', params, lambda: self.client.get_everything(
                 q=topic,
                 language=language,
                 from_param=from_date_str,
@@ -62,7 +163,7 @@ class NewsClient:
                 sort_by='relevancy',
                 page_size=page_size,
                 page=page
-            )
+            ))
             
             # Log API response status and total results
             self.logger.info(f"NewsAPI Status: {response.get('status')}")
@@ -76,44 +177,7 @@ class NewsClient:
             self.logger.warning(f"No articles found for topic: {topic}")
             return []
         
-        # Convert to Article objects
-        articles = []
-        for article_data in response['articles']:
-            try:
-                # Generate a unique ID for the article (using URL hash) -> useful for db indexing, preventing duplicates, tracking articles across different API calls
-                import hashlib
-                url = article_data.get('url', '') #.get() returns the value of the key if it exists, otherwise returns the second argument
-                article_id = hashlib.md5(url.encode()).hexdigest() if url else None
-                
-                if not article_id:
-                    continue
-                
-                # Convert published_at string to datetime
-                published_at = datetime.fromisoformat(article_data.get('publishedAt', '').replace('Z', '+00:00'))
-                """
-                Replaces 'Z' (Zulu/UTC timezone indicator) with '+00:00'
-                This is because Python's fromisoformat() expects timezone in the format '+00:00'
-                Example: "2024-04-20T05:56:56Z" → "2024-04-20T05:56:56+00:00"
-                """
-                
-                # Create Article object
-                article = Article(
-                    id=article_id,
-                    title=article_data.get('title', ''),
-                    description=article_data.get('description'),
-                    content=article_data.get('content'),
-                    url=article_data.get('url'),
-                    source_id=article_data.get('source', {}).get('id'),
-                    source_name=article_data.get('source', {}).get('name', 'Unknown'),
-                    author=article_data.get('author'),
-                    published_at=published_at,
-                    url_to_image=article_data.get('urlToImage'),
-                    raw_data=article_data
-                )
-                articles.append(article)
-            except Exception as e:
-                self.logger.error(f"Error processing article: {e}")
-                continue
+        articles = self._convert_articles(response['articles'])
         
         self.logger.info(f"Retrieved {len(articles)} articles")
         return articles
@@ -140,12 +204,13 @@ class NewsClient:
         self.logger.info(f"Getting top headlines in {category} for {country}")
         
         try:
-            response = self.client.get_top_headlines(
+            params = {'category': category, 'country': country, 'pageSize': page_size, 'page': page}
+            response = self._cached_call('/top-headlines', params, lambda: self.client.get_top_headlines(
                 category=category,
                 country=country,
                 page_size=page_size,
                 page=page
-            )
+            ))
         except Exception as e:
             self.logger.error(f"Error fetching top headlines: {e}")
             return []
@@ -154,39 +219,305 @@ class NewsClient:
             self.logger.warning(f"No headlines found for category: {category} in country: {country}")
             return []
         
-        # Convert to Article objects (same as above)
+        articles = self._convert_articles(response['articles'])
+        
+        self.logger.info(f"Retrieved {len(articles)} headlines")
+        return articles
+
+    async def iter_articles_by_topic(
+        self,
+        topic: str,
+        language: str = 'en',
+        days_back: int = 7,
+        page_size: int = 100,
+        max_results: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        report: Optional[FetchReport] = None
+    ) -> AsyncIterator[Article]:
+        """
+        Get all articles related to a topic, fetching pages concurrently.
+        
+        The first page tells how many results exist; the remaining pages are
+        then requested concurrently and articles are yielded as each page arrives,
+        so their order across pages is not guaranteed.
+        
+        Args:
+            topic: Search query string
+            language: Language of articles (default: 'en')
+            days_back: Number of days back to search
+            page_size: Number of articles per page (max 100)
+            max_results: Optional cap on the number of results to fetch
+            max_concurrency: Maximum concurrent page requests (default: settings.NEWS_API_MAX_CONCURRENCY)
+            since: Only request articles published at or after this UTC time, newest
+                   first (overrides days_back)
+            until: With since, only request articles published at or before this UTC time
+            report: Optional FetchReport, filled in with truncation and failed pages
+            
+        Yields:
+            Article objects
+        """
+        self.logger.info(f"Searching for all articles related to: {topic}")
+        
+        if since is not None:
+            params = {
+                'q': topic,
+                'language': language,
+                'from': since.strftime('%Y-%m-%dT%H:%M:%S'),
+                'sortBy': 'publishedAt'
+            }
+            if until is not None:
+                params['to'] = until.strftime('%Y-%m-%dT%H:%M:%S')
+        else:
+            to_date = datetime.now(UTC)
+            from_date = to_date - timedelta(days=days_back)
+            params = {
+                'q': topic,
+                'language': language,
+                'from': from_date.strftime('%Y-%m-%d'),
+                'to': to_date.strftime('%Y-%m-%d'),
+                'sortBy': 'relevancy'
+            }
+        
+        async for raw_articles in self._iter_pages(
+            '/everything', params, page_size, max_results, max_concurrency, report
+        ):
+            for article in self._convert_articles(raw_articles):
+                yield article
+    
+    async def iter_top_headlines(
+        self,
+        category: str = 'politics',
+        country: str = 'us',
+        page_size: int = 100,
+        max_results: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        report: Optional[FetchReport] = None
+    ) -> AsyncIterator[Article]:
+        """
+        Get all top headlines in a category and country, fetching pages concurrently.
+        
+        Args:
+            category: News category (default: 'politics')
+            country: Country code (default: 'us')
+            page_size: Number of articles per page (max 100)
+            max_results: Optional cap on the number of results to fetch
+            max_concurrency: Maximum concurrent page requests (default: settings.NEWS_API_MAX_CONCURRENCY)
+            report: Optional FetchReport, filled in with truncation and failed pages
+            
+        Yields:
+            Article objects
+        """
+        self.logger.info(f"Getting all top headlines in {category} for {country}")
+        
+        params = {'category': category}
+        if country:
+            params['country'] = country
+        
+        async for raw_articles in self._iter_pages(
+            '/top-headlines', params, page_size, max_results, max_concurrency, report
+        ):
+            for article in self._convert_articles(raw_articles):
+                yield article
+    
+    async def _iter_pages(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        page_size: int,
+        max_results: Optional[int],
+        max_concurrency: Optional[int],
+        report: Optional[FetchReport] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Fetch every page of a NewsAPI query, yielding each page's raw articles as it arrives.
+        
+        Page 1 is fetched first to read totalResults. Pages 2..N are then
+        requested concurrently over one pooled HTTP client, at most
+        max_concurrency at a time. A page that fails is logged and skipped.
+        
+        The report, if given, records the totalResults, whether max_results or
+        the plan's result limit cut the query short, and which pages failed,
+        so callers that track progress can tell a complete fetch from a
+        partial one.
+        """
+        report = report if report is not None else FetchReport()
+        concurrency = max(1, max_concurrency or settings.NEWS_API_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(concurrency)
+        remaining = max_results
+        
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={'X-Api-Key': self.api_key},
+            timeout=settings.NEWS_API_TIMEOUT,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        ) as http_client:
+            
+            async def fetch(page: int) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_page(
+                        http_client, path, {**params, 'pageSize': page_size, 'page': page}, report
+                    )
+            
+            first = await fetch(1)
+            if not first or not first.get('articles'):
+                self.logger.warning(f"No articles found for {path} with {params}")
+                return
+            
+            total = first.get('totalResults') or 0
+            report.total_results = total
+            self.logger.info(f"Total Results: {total}")
+            if max_results is not None and total > max_results:
+                total = max_results
+                report.truncated = True
+            
+            tasks = [asyncio.create_task(fetch(page)) for page in range(2, math.ceil(total / page_size) + 1)]
+            try:
+                response = first
+                arrivals = iter(asyncio.as_completed(tasks))
+                while True:
+                    raw_articles = (response or {}).get('articles') or []
+                    if remaining is not None:
+                        raw_articles = raw_articles[:remaining]
+                        remaining -= len(raw_articles)
+                    if raw_articles:
+                        yield raw_articles
+                    if remaining == 0:
+                        break
+                    
+                    next_arrival = next(arrivals, None)
+                    if next_arrival is None:
+                        break
+                    response = await next_arrival
+            finally:
+                # Stop outstanding requests if the consumer stopped early
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_page(
+        self,
+        http_client: httpx.AsyncClient,
+        path: str,
+        params: Dict[str, Any],
+        report: Optional[FetchReport] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of a NewsAPI query.
+        
+        A failed page is added to the report's failed_pages, except a page
+        past the plan's result limit, which marks the report truncated.
+        
+        Returns:
+            The decoded response, or None if the request or the API reported an error
+        """
+        key = TTLCache.make_key(path, params)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+        try:
+            response = await http_client.get(path, params=params)
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.error(f"Error fetching page {params.get('page')} of {path}: {e}")
+            if report is not None:
+                report.failed_pages.append(params.get('page'))
+            return None
+        
+        if response.status_code != 200 or data.get('status') != 'ok':
+            self.logger.error(
+                f"NewsAPI error on page {params.get('page')} of {path}: "
+                f"{data.get('code')} {data.get('message')}"
+            )
+            if report is not None:
+                if data.get('code') == MAXIMUM_RESULTS_REACHED:
+                    report.truncated = True
+                else:
+                    report.failed_pages.append(params.get('page'))
+            return None
+        
+        if self.cache:
+            self.cache.set(key, data)
+        return data
+    
+    def _cached_call(self, path: str, params: Dict[str, Any], fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Serve a NewsAPI response from the cache, or fetch it within the rate limit and cache it.
+        
+        Args:
+            path: API endpoint path, part of the cache key
+            params: Query parameters in NewsAPI's REST names, the rest of the cache key
+            fetch: Performs the request when the response is not cached
+            
+        Returns:
+            The decoded response
+        """
+        key = TTLCache.make_key(path, params)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.logger.info(f"Serving {path} from cache")
+                return cached
+        
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        response = fetch()
+        if self.cache and response and response.get('status') == 'ok':
+            self.cache.set(key, response)
+        return response
+    
+    def _convert_articles(
+        self,
+        raw_articles: List[Dict[str, Any]],
+        raw_data_mode: Optional[str] = None
+    ) -> List[Article]:
+        """
+        Convert a NewsAPI response's raw article dicts to Article objects, skipping invalid ones.
+        
+        Each article is validated exactly once (the two HttpUrl fields are
+        most of the cost), and one that fails, e.g. on a malformed URL, is
+        skipped and logged on its own. URL hashes come from the cached
+        canonicalizer, publishedAt strings go through a cached parser (a page
+        often repeats timestamps), and raw_data is stored per raw_data_mode.
+        
+        Args:
+            raw_articles: The 'articles' list of a NewsAPI response
+            raw_data_mode: "full" keeps the whole raw dict, "compact" only the
+                           fields not already mapped onto Article, "none" nothing
+                           (default: the client's raw_data_mode)
+            
+        Returns:
+            List of Article objects
+        """
+        mode = raw_data_mode or self.raw_data_mode
+        
         articles = []
-        for article_data in response['articles']:
+        for article_data in raw_articles:
+            url = article_data.get('url') or ''
+            if not url:
+                continue
             try:
-                # Generate a unique ID for the article (using URL hash)
-                import hashlib
-                url = article_data.get('url', '')
-                article_id = hashlib.md5(url.encode()).hexdigest() if url else None
-                
-                if not article_id:
-                    continue
-                
-                # Convert published_at string to datetime
-                published_at = datetime.fromisoformat(article_data.get('publishedAt', '').replace('Z', '+00:00'))
-                
-                # Create Article object
-                article = Article(
-                    id=article_id,
-                    title=article_data.get('title', ''),
-                    description=article_data.get('description'),
-                    content=article_data.get('content'),
-                    url=article_data.get('url'),
-                    source_id=article_data.get('source', {}).get('id'),
-                    source_name=article_data.get('source', {}).get('name', 'Unknown'),
-                    author=article_data.get('author'),
-                    published_at=published_at,
-                    url_to_image=article_data.get('urlToImage'),
-                    raw_data=article_data
-                )
-                articles.append(article)
+                # Generate a unique ID for each article (using the canonical URL hash) -> useful for db indexing, preventing duplicates, tracking articles across different API calls
+                article_id = article_id_for_url(url)
+                source = article_data.get('source') or {}
+                articles.append(Article.model_validate({
+                    'id': article_id,
+                    'title': article_data.get('title', ''),
+                    'description': article_data.get('description'),
+                    'content': article_data.get('content'),
+                    'url': url,
+                    'source_id': source.get('id'),
+                    'source_name': source.get('name', 'Unknown'),
+                    'author': article_data.get('author'),
+                    'published_at': parse_datetime(article_data.get('publishedAt') or ''),
+                    'url_to_image': article_data.get('urlToImage'),
+                    'raw_data': compact_raw_data(article_data, mode)
+                }))
             except Exception as e:
                 self.logger.error(f"Error processing article: {e}")
-                continue
-        
-        self.logger.info(f"Retrieved {len(articles)} headlines")
-        return articles
\ No newline at end of file
+        return articles
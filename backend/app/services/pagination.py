@@ -0,0 +1,94 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+from app.models.database import ArticleModel
+
+class KeysetPagination:
+    """Keyset (cursor) pagination over articles ordered newest first.
+
+    Pages are ordered by (published_at DESC, id DESC) and a page is located by
+    filtering on the (published_at, id) of the last row of the previous page,
+    which the composite ix_articles_published_at_id index serves directly.
+    Every page therefore costs the same as the first, unlike OFFSET. The
+    cursor handed to clients is an opaque URL-safe token.
+    """
+
+    # Response header carrying the cursor of the next page
+    HEADER = "X-Next-Cursor"
+
+    @staticmethod
+    def encode(published_at: datetime, article_id: str) -> str:
+        """
+        Encode the position of an article as an opaque cursor.
+
+        Args:
+            published_at: Publication timestamp of the last article on a page
+            article_id: ID of the last article on a page
+
+        Returns:
+            URL-safe cursor string
+        """
+        payload = json.dumps([published_at.isoformat(), article_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> Tuple[datetime, str]:
+        """
+        Decode a cursor produced by encode().
+
+        Args:
+            cursor: Cursor string
+
+        Returns:
+            Tuple of (published_at, article_id)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            published_at, article_id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(published_at), str(article_id)
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    @staticmethod
+    def apply(query, cursor: Optional[str] = None):
+        """
+        Order a query newest first and, if a cursor is given, start after it.
+
+        Args:
+            query: Query (ORM Query or select()) selecting from ArticleModel
+            cursor: Cursor of the previous page, or None for the first page
+
+        Returns:
+            Ordered (and filtered) query
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if cursor:
+            published_at, article_id = KeysetPagination.decode(cursor)
+            query = query.filter(
+                tuple_(ArticleModel.published_at, ArticleModel.id) < tuple_(published_at, article_id)
+            )
+        return query.order_by(ArticleModel.published_at.desc(), ArticleModel.id.desc())
+
+    @staticmethod
+    def next_cursor(articles: Sequence[ArticleModel], limit: int) -> Optional[str]:
+        """
+        Build the cursor for the page after the given one.
+
+        Args:
+            articles: Articles of the current page, in keyset order
+            limit: Page size that was requested
+
+        Returns:
+            Cursor string, or None if this was the last page
+        """
+        if len(articles) < limit:
+            return None
+        last = articles[-1]
+        return KeysetPagination.encode(last.published_at, last.id)
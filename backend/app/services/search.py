@@ -0,0 +1,92 @@
+import re
+from typing import Optional
+from sqlalchemy import func, or_, text
+from app.models.database import ArticleModel, article_search_document
+
+# Quoted phrases or single whitespace-separated terms
+_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+_WORD_RE = re.compile(r'\w+')
+
+class ArticleSearch:
+    """Full-text search over articles.
+
+    On PostgreSQL the search string is turned into a tsquery matched against
+    the stored, GIN-indexed article_search_document and results can be ranked by
+    relevance. Supported syntax:
+        climate policy     -> both terms (stemmed)
+        "supreme court"    -> exact phrase
+        elect*             -> prefix match
+        -opinion           -> exclude term
+    Other databases (e.g. SQLite test databases) fall back to case-insensitive
+    substring matching on title, description and content.
+    """
+
+    @staticmethod
+    def build_tsquery(search: str) -> Optional[str]:
+        """
+        Convert a user search string into to_tsquery syntax.
+
+        Args:
+            search: Raw search string
+
+        Returns:
+            tsquery string, or None if the search has no searchable words
+        """
+        clauses = []
+        for match in _TOKEN_RE.finditer(search):
+            phrase, term = match.groups()
+            if phrase is not None:
+                words = _WORD_RE.findall(phrase)
+                if words:
+                    clauses.append(" <-> ".join(words))
+                continue
+
+            negate = term.startswith("-")
+            prefix = term.endswith("*")
+            words = _WORD_RE.findall(term)
+            if not words:
+                continue
+
+            clause = " <-> ".join(words)
+            if prefix:
+                clause += ":*"
+            if negate:
+                clause = f"!({clause})"
+            clauses.append(clause)
+
+        # A query made only of exclusions would match nothing useful
+        if not any(not clause.startswith("!") for clause in clauses):
+            return None
+        return " & ".join(f"({clause})" for clause in clauses)
+
+    @staticmethod
+    def apply(query, search: str, dialect_name: str, rank: bool = True):
+        """
+        Filter a query (ORM Query or select()) by a search string.
+
+        Args:
+            query: Query selecting from ArticleModel
+            search: Raw search string
+            dialect_name: Name of the database dialect (e.g. 'postgresql', 'sqlite')
+            rank: Order results by relevance (PostgreSQL only)
+
+        Returns:
+            Filtered query
+        """
+        tsquery = ArticleSearch.build_tsquery(search) if dialect_name == "postgresql" else None
+
+        if tsquery is None:
+            search_term = f"%{search}%"
+            return query.filter(
+                or_(
+                    ArticleModel.title.ilike(search_term),
+                    ArticleModel.description.ilike(search_term),
+                    ArticleModel.content.ilike(search_term)
+                )
+            )
+
+        ts_query = func.to_tsquery(text("'english'::regconfig"), tsquery)
+        query = query.filter(article_search_document.op("@@")(ts_query))
+        if rank:
+            query = query.order_by(func.ts_rank_cd(article_search_document, ts_query).desc())
+        return query
@@ -0,0 +1,15 @@
+from app.core.cache import TTLCache
+
+def test_query_whitespace_is_collapsed_but_case_is_kept():
+    key = TTLCache.make_key("everything", {"q": "  election   AND  policy "})
+    assert key == TTLCache.make_key("everything", {"q": "election AND policy"})
+    assert key != TTLCache.make_key("everything", {"q": "election and policy"})
+
+def test_case_insensitive_parameters_are_lowercased():
+    assert TTLCache.make_key("top-headlines", {"country": "US", "category": "Politics", "language": "EN"}) == \
+        TTLCache.make_key("top-headlines", {"language": "en", "category": "politics", "country": "us"})
+
+def test_other_parameters_are_kept_as_given():
+    assert TTLCache.make_key("everything", {"sources": "BBC-News", "page": 1, "from": None}) != \
+        TTLCache.make_key("everything", {"sources": "bbc-news", "page": 1})
+    assert TTLCache.make_key("everything", {"page": 1, "from": None}) == TTLCache.make_key("everything", {"page": 1})
@@ -0,0 +1,117 @@
+"""
+Tests for article text cleaning and the duplicate rules of DataCleaner.
+
+clean_text strips tags before decoding entities, decodes each entity once and
+collapses every kind of whitespace, including decoded &nbsp;, to single spaces.
+Batches drop repeated ids (derived from the canonical URL); repeated cleaned
+titles only with duplicate_titles, and near duplicates only with near_duplicates.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.core.config import settings
+from app.core.data_cleaner import DataCleaner, clean_text
+from app.core.urls import article_id_for_url
+from app.models.article import Article
+
+@pytest.mark.parametrize("text, cleaned", [
+    ("  Officials said\n\nno  ", "Officials said no"),
+    ("tabs\tand\r\nline\x0bbreaks\x0c", "tabs and line breaks"),
+    ("non\xa0breaking and　wide   spaces", "non breaking and wide spaces"),
+    ("a <b>bold</b>  <i>move</i>", "a bold move"),
+    ("\n \t", ""),
+    (None, ""),
+])
+def test_whitespace_is_collapsed(text, cleaned):
+    assert clean_text(text) == cleaned
+
+@pytest.mark.parametrize("text, cleaned", [
+    ("Q&amp;A: &quot;no&quot; &lt;again&gt; it&#39;s it&apos;s", "Q&A: \"no\" <again> it's it's"),
+    ("Officials&nbsp;said &nbsp; no", "Officials said no"),
+    ("2024 &#8211; 2025 &#8212; &#8220;quoted&#8221; &#8217;", "2024 – 2025 — “quoted” ’"),
+    ("caf&eacute; &copy; &hellip;", "café © …"),
+    ("&#233; &#xE9; &#XE9;", "é é é"),
+    ("&amp;lt;b&amp;gt; &#38;quot;", "&lt;b&gt; &quot;"),
+    ("AT&T, R&D; &unknown;", "AT&T, R&D; &unknown;"),
+])
+def test_entities_are_decoded_once(text, cleaned):
+    assert clean_text(text) == cleaned
+
+def test_escaped_tags_stay_as_text():
+    assert clean_text("Use <code>&lt;b&gt;</code> for bold") == "Use <b> for bold"
+
+def make_article(article_id: str, url: str, title: str, content: str = "Report on the city budget.") -> Article:
+    return Article(
+        id=article_id, title=title, content=content, url=url,
+        source_name="Source", published_at=datetime(2024, 4, 20)
+    )
+
+@pytest.fixture
+def cleaner(monkeypatch):
+    monkeypatch.setattr(settings, "CLEANING_EXECUTOR", "inline")
+    monkeypatch.setattr(settings, "CLEANING_DUPLICATE_TITLES", False)
+    monkeypatch.setattr(settings, "CLEANING_NEAR_DUPLICATES", False)
+    return DataCleaner()
+
+def test_repeated_ids_are_dropped(cleaner):
+    articles = [
+        make_article("a", "https://example.com/a", "First"),
+        make_article("a", "https://example.com/a?copy=2", "First again"),
+        make_article("b", "https://example.com/b", "<b> </b>"),
+    ]
+    assert [article.title for article in cleaner.clean_articles(articles)] == ["First"]
+
+def test_repeated_titles_are_kept_by_default(cleaner):
+    articles = [
+        make_article("a", "https://example.com/a", "Same title"),
+        make_article("b", "https://example.com/b", "Same title"),
+    ]
+    assert len(cleaner.clean_articles(articles)) == 2
+
+def test_variants_of_a_link_share_an_id_and_are_dropped(cleaner):
+    urls = ["https://example.com/story", "http://www.example.com/story/?utm_source=feed"]
+    articles = [
+        make_article(article_id_for_url(url), url, title)
+        for url, title in zip(urls, ["First", "Second"])
+    ]
+    assert [article.title for article in cleaner.clean_articles(articles)] == ["First"]
+
+def test_repeated_cleaned_titles_are_dropped_with_duplicate_titles(cleaner):
+    articles = [
+        make_article("a", "https://example.com/a", "Budget  approved"),
+        make_article("b", "https://example.com/b", "<p>Budget approved</p>"),
+    ]
+    assert [article.id for article in cleaner.clean_articles(articles, duplicate_titles=True)] == ["a"]
+
+def test_near_duplicates_are_dropped_when_requested(cleaner, monkeypatch):
+    monkeypatch.setattr(settings, "NEAR_DUPLICATE_THRESHOLD", 0.7)
+    story = (
+        "The city council approved the new transit budget on Tuesday after a long debate "
+        "over bus routes, fares and the timeline for extending the light rail line downtown."
+    )
+    articles = [
+        make_article("a", "https://example.com/a", "Council approves transit budget", story),
+        make_article("b", "https://example.com/b", "Council approves transit budget.", story + " Updated."),
+    ]
+    assert len(cleaner.clean_articles(articles)) == 2
+    kept = cleaner.clean_articles(articles, near_duplicates=True)
+    assert [article.id for article in kept] == ["a"] and kept[0].minhash
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_chunked_pool_matches_inline(cleaner, monkeypatch, executor):
+    articles = [
+        make_article(f"id-{number % 9}", f"https://example.com/{number}", f"<i>Story</i> &amp; {number % 7}")
+        for number in range(30)
+    ]
+    inline = cleaner.clean_article_batch(articles, duplicate_titles=True)
+
+    monkeypatch.setattr(settings, "CLEANING_EXECUTOR", executor)
+    monkeypatch.setattr(settings, "CLEANING_WORKERS", 2)
+    monkeypatch.setattr(DataCleaner, "MIN_PARALLEL_BATCH", 1)
+    try:
+        pooled = cleaner.clean_article_batch(articles, chunk_size=2, duplicate_titles=True)
+    finally:
+        DataCleaner.shutdown_executor()
+    assert pooled == inline
+    assert [cleaned.title for cleaned in pooled] == [f"Story & {number}" for number in range(7)]
@@ -0,0 +1,44 @@
+"""
+Tests for timestamp parsing.
+
+Every shape parses to the same aware UTC instant, including RFC 2822 dates
+that start with the day of the month and so look like ISO 8601 at first.
+"""
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core.datetimes import parse_datetime, to_naive_utc
+
+INSTANT = datetime(2024, 4, 20, 5, 56, 56, tzinfo=UTC)
+
+@pytest.mark.parametrize("value, parsed", [
+    ("2024-04-20T05:56:56Z", INSTANT),
+    ("2024-04-20T05:56:56+00:00", INSTANT),
+    ("2024-04-20T07:56:56+02:00", INSTANT),
+    ("2024-04-20T01:56:56-04:00", INSTANT),
+    ("2024-04-20T05:56:56.123Z", INSTANT.replace(microsecond=123000)),
+    ("2024-04-20T05:56:56.123456+00:00", INSTANT.replace(microsecond=123456)),
+    ("2024-04-20 05:56:56", INSTANT),
+    ("2024-04-20", datetime(2024, 4, 20, tzinfo=UTC)),
+    ("20240420", datetime(2024, 4, 20, tzinfo=UTC)),
+    ("1713592616", INSTANT),
+    ("Sat, 20 Apr 2024 05:56:56 GMT", INSTANT),
+    ("Sat, 20 Apr 2024 01:56:56 -0400", INSTANT),
+    ("20 Apr 2024 05:56:56 GMT", INSTANT),
+    ("20 Apr 2024 07:56:56 +0200", INSTANT),
+    ("  2024-04-20T05:56:56Z\n", INSTANT),
+])
+def test_parse_datetime(value, parsed):
+    result = parse_datetime(value)
+    assert result == parsed
+    assert result.tzinfo == UTC
+
+def test_datetimes_are_converted_to_utc():
+    assert parse_datetime(datetime(2024, 4, 20, 5, 56, 56)) == INSTANT
+    assert to_naive_utc(parse_datetime("2024-04-20T07:56:56+02:00")) == datetime(2024, 4, 20, 5, 56, 56)
+
+@pytest.mark.parametrize("value", ["", "   ", "yesterday", "2024-13-45", "20 Foo 2024"])
+def test_unrecognized_timestamps_raise(value):
+    with pytest.raises(ValueError):
+        parse_datetime(value)
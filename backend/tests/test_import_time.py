@@ -0,0 +1,75 @@
+"""
+Import-time budget for the API application.
+
+Each run imports app.main in a fresh interpreter with DATABASE_URL pointing at
+a port nothing listens on. Importing must not create an engine or open a
+connection, and the fastest of a few imports must stay under the budget.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds allowed for the fastest import (about 0.65s on a single core)
+IMPORT_BUDGET_SECONDS = 3.0
+IMPORT_RUNS = 3
+
+# Runs in the child interpreter: count engines and pool connections made while importing
+CHILD_CODE = """
+import json, time
+import sqlalchemy
+import sqlalchemy.ext.asyncio
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+created = {"engines": 0, "connections": 0}
+
+def counting(create):
+    def wrapper(*args, **kwargs):
+        created["engines"] += 1
+        return create(*args, **kwargs)
+    return wrapper
+
+sqlalchemy.create_engine = counting(sqlalchemy.create_engine)
+sqlalchemy.ext.asyncio.create_async_engine = counting(sqlalchemy.ext.asyncio.create_async_engine)
+
+@event.listens_for(Pool, "connect")
+def on_connect(*args):
+    created["connections"] += 1
+
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+
+from app.db import session
+created["engines"] += (session._engine is not None) + (session._async_engine is not None)
+print(json.dumps({"seconds": elapsed, **created}))
+"""
+
+def import_app() -> dict:
+    """Import app.main once in a fresh interpreter and return its report."""
+    env = dict(os.environ)
+    # Unreachable database: an import-time connection attempt would fail or stall
+    env["DATABASE_URL"] = "postgresql://nobody@127.0.0.1:1/unreachable"
+    env["PYTHONPATH"] = str(BACKEND_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_import_creates_no_engine_and_stays_within_budget():
+    reports = [import_app() for _ in range(IMPORT_RUNS)]
+    for report in reports:
+        assert report["engines"] == 0
+        assert report["connections"] == 0
+    fastest = min(report["seconds"] for report in reports)
+    assert fastest < IMPORT_BUDGET_SECONDS, f"import app.main took {fastest:.3f}s"
@@ -0,0 +1,136 @@
+"""
+Watermark tests for the ingestion scheduler, against a stub NewsAPI client.
+
+The stub serves topic results newest first, like /everything with
+sortBy=publishedAt, and can cut them short (max_results or a plan limit) or
+lose a page. No article may be skipped for good: after enough polls every
+published article is stored, and the watermark only reaches the newest one
+once everything below it was saved.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models.article import Article
+from app.models.database import ArticleModel, Base, IngestionWatermarkModel
+from app.services import ingestion
+from app.services.ingestion import IngestionScheduler, IngestionSource
+
+START = datetime(2024, 4, 20, 12, 0)
+SOURCE = IngestionSource("topic", "election")
+
+def make_articles(first: int, last: int) -> List[Article]:
+    """Articles number first..last, published a minute apart."""
+    return [
+        Article(
+            id=f"article-{number}",
+            title=f"Election story number {number}",
+            content=f"Report {number} on the election campaign and the policy debate.",
+            url=f"https://example.com/news/{number}",
+            source_name="Example",
+            published_at=START + timedelta(minutes=number),
+        )
+        for number in range(first, last + 1)
+    ]
+
+class StubNewsClient:
+    """Serves a fixed set of articles newest first, optionally truncated or with a failed page."""
+
+    def __init__(self, articles: List[Article], plan_limit: int = 0):
+        self.articles = articles
+        self.plan_limit = plan_limit
+        self.failing_page = None
+
+    async def iter_articles_by_topic(self, topic, max_results=None, since=None, until=None, report=None):
+        matching = sorted(
+            (
+                article for article in self.articles
+                if (since is None or article.published_at >= since)
+                and (until is None or article.published_at <= until)
+            ),
+            key=lambda article: article.published_at,
+            reverse=True,
+        )
+        report.total_results = len(matching)
+        for limit in (max_results, self.plan_limit):
+            if limit and len(matching) > limit:
+                matching = matching[:limit]
+                report.truncated = True
+        if self.failing_page is not None:
+            # Pages of 2: drop the failing page's articles
+            start = (self.failing_page - 1) * 2
+            matching = matching[:start] + matching[start + 2:]
+            report.failed_pages.append(self.failing_page)
+        for article in matching:
+            yield article
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "NEAR_DUPLICATE_THRESHOLD", 0)
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(ingestion, "SessionLocal", session_factory)
+    yield session_factory
+    engine.dispose()
+
+def stored(database) -> int:
+    with database() as db:
+        return db.scalar(select(func.count()).select_from(ArticleModel))
+
+def watermark(database) -> datetime:
+    with database() as db:
+        row = db.get(IngestionWatermarkModel, SOURCE.key)
+        return row.published_at if row else None
+
+def poll(scheduler: IngestionScheduler) -> None:
+    asyncio.run(scheduler.run_once())
+
+def test_truncated_polls_backfill_the_gap_before_advancing(database):
+    client = StubNewsClient(make_articles(1, 25))
+    scheduler = IngestionScheduler([SOURCE], max_results=10, news_client=client)
+
+    # 25 new articles, 10 per poll: the watermark waits until the gap below the newest is filled
+    poll(scheduler)
+    assert stored(database) == 10 and watermark(database) is None
+    poll(scheduler)
+    assert stored(database) == 19 and watermark(database) is None
+    poll(scheduler)
+    assert stored(database) == 25
+    assert watermark(database) == START + timedelta(minutes=25)
+
+    client.articles += make_articles(26, 28)
+    poll(scheduler)
+    assert stored(database) == 28
+    assert watermark(database) == START + timedelta(minutes=28)
+    assert scheduler.stats[SOURCE.key]["incomplete"] == 2
+
+def test_plan_result_limit_is_truncation(database):
+    client = StubNewsClient(make_articles(1, 12), plan_limit=5)
+    scheduler = IngestionScheduler([SOURCE], max_results=100, news_client=client)
+    for _ in range(3):
+        poll(scheduler)
+    assert stored(database) == 12
+    assert watermark(database) == START + timedelta(minutes=12)
+
+def test_failed_page_keeps_the_watermark(database):
+    client = StubNewsClient(make_articles(1, 3))
+    scheduler = IngestionScheduler([SOURCE], max_results=100, news_client=client)
+    poll(scheduler)
+    assert watermark(database) == START + timedelta(minutes=3)
+
+    client.articles += make_articles(4, 9)
+    client.failing_page = 2
+    poll(scheduler)
+    assert stored(database) == 7
+    assert watermark(database) == START + timedelta(minutes=3)
+
+    client.failing_page = None
+    poll(scheduler)
+    assert stored(database) == 9
+    assert watermark(database) == START + timedelta(minutes=9)
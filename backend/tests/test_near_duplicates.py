@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.near_duplicates import MinHashIndex, minhash
+from app.models.article import Article
+from app.models.database import ArticleModel, Base
+from app.services.article_service import ArticleService
+
+STORY = (
+    "The city council approved the new transit budget on Tuesday after a long debate "
+    "over bus routes, fares and the timeline for extending the light rail line downtown."
+)
+
+def make_article(article_id: str, url: str, title: str, content: str) -> Article:
+    return Article(
+        id=article_id, title=title, content=content, url=url,
+        source_name="Source", published_at=datetime(2024, 4, 20)
+    )
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "NEAR_DUPLICATE_THRESHOLD", 0.7)
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+def test_index_remove():
+    index = MinHashIndex(0.7)
+    signature = minhash(STORY)
+    index.add("a", signature)
+    assert index.find(signature) == "a"
+    index.remove("a")
+    assert "a" not in index and len(index) == 0
+    assert index.find(signature) is None
+    index.remove("a")
+
+def test_near_duplicate_of_a_failed_row_is_saved(db):
+    # Takes the id the first incoming article will use, under another URL and title
+    db.add(ArticleModel(
+        id="taken", title="Unrelated", url="https://example.com/other",
+        source_name="Source", published_at=datetime(2024, 4, 20)
+    ))
+    db.commit()
+
+    result = ArticleService.bulk_save_articles(db, [
+        make_article("taken", "https://example.com/a", "Council approves transit budget", STORY),
+        make_article("copy", "https://example.org/b", "Transit budget approved by council", STORY + " Reuters"),
+    ])
+
+    statuses = [item["status"] for item in result["results"]]
+    assert statuses == ["error", "saved"]
+    assert db.get(ArticleModel, "copy") is not None
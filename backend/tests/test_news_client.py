@@ -0,0 +1,93 @@
+"""
+Tests for NewsClient's conversion of raw NewsAPI articles under each raw_data
+mode, and for the FetchReport of multi-page fetches.
+"""
+import asyncio
+import logging
+from datetime import datetime
+
+import httpx
+import pytest
+
+from app.core.urls import article_id_for_url
+from app.services.news_client import FetchReport, NewsClient
+
+RAW_ARTICLE = {
+    "source": {"id": "example-news", "name": "Example News"},
+    "author": "A. Writer",
+    "title": "Lawmakers debate the election policy",
+    "description": "A debate.",
+    "url": "https://www.example.com/news/story?utm_source=feed",
+    "urlToImage": "https://example.com/image.jpg",
+    "publishedAt": "2024-04-20T05:56:56Z",
+    "content": "Lawmakers debated.",
+    "sentiment": "neutral",
+    "extra": None,
+}
+
+@pytest.fixture
+def client():
+    return NewsClient(api_key="test", use_cache=False)
+
+def test_full_mode_keeps_the_raw_article(client):
+    [article] = client._convert_articles([RAW_ARTICLE], raw_data_mode="full")
+    assert article.raw_data == RAW_ARTICLE
+    assert article.id == article_id_for_url("https://example.com/news/story")
+    assert article.source_name == "Example News"
+    assert article.published_at.isoformat() == "2024-04-20T05:56:56+00:00"
+
+def test_compact_mode_keeps_only_unmapped_fields(client):
+    [article] = client._convert_articles([RAW_ARTICLE], raw_data_mode="compact")
+    assert article.raw_data == {"sentiment": "neutral"}
+    assert article.title == RAW_ARTICLE["title"]
+    assert str(article.url_to_image) == RAW_ARTICLE["urlToImage"]
+
+def test_none_mode_keeps_no_raw_data(client):
+    [article] = client._convert_articles([RAW_ARTICLE], raw_data_mode="none")
+    assert article.raw_data == {}
+    assert article.author == "A. Writer"
+
+def test_client_raw_data_mode_is_the_default():
+    client = NewsClient(api_key="test", use_cache=False, raw_data_mode="none")
+    [article] = client._convert_articles([RAW_ARTICLE])
+    assert article.raw_data == {}
+    with pytest.raises(ValueError):
+        NewsClient(api_key="test", raw_data_mode="everything")
+
+def test_invalid_article_is_validated_and_skipped_once(client, caplog):
+    raw_articles = [RAW_ARTICLE, {**RAW_ARTICLE, "url": "https://example.com/other", "urlToImage": "not a url"}]
+    with caplog.at_level(logging.ERROR):
+        articles = client._convert_articles(raw_articles)
+    assert [str(article.url) for article in articles] == [RAW_ARTICLE["url"]]
+    assert len(caplog.records) == 1
+
+def test_fetch_report_records_truncation_and_failed_pages(client, monkeypatch):
+    def respond(request):
+        page = int(request.url.params["page"])
+        if page == 3:
+            return httpx.Response(500, json={"status": "error", "code": "unexpectedError"})
+        if page == 5:
+            return httpx.Response(426, json={"status": "error", "code": "maximumResultsReached"})
+        articles = [{**RAW_ARTICLE, "url": f"https://example.com/{page}/{number}"} for number in range(2)]
+        return httpx.Response(200, json={"status": "ok", "totalResults": 10, "articles": articles})
+
+    transport = httpx.MockTransport(respond)
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: async_client(transport=transport, **kwargs))
+
+    async def fetch(report, **kwargs):
+        return [
+            article async for article in client.iter_articles_by_topic(
+                "election", page_size=2, since=datetime(2024, 4, 20), report=report, **kwargs
+            )
+        ]
+
+    report = FetchReport()
+    articles = asyncio.run(fetch(report))
+    assert len(articles) == 6
+    assert report.total_results == 10
+    assert report.failed_pages == [3] and report.truncated and not report.complete
+
+    report = FetchReport()
+    assert len(asyncio.run(fetch(report, max_results=4))) == 4
+    assert report.truncated and report.failed_pages == []
@@ -0,0 +1,119 @@
+"""
+Query-count regression tests for the article read endpoints.
+
+Runs the app against a synthetic 10k-article SQLite database and counts the
+statements each endpoint executes. The count must not depend on how many
+articles the request touches, so any per-article (N+1) query shows up as a
+difference between a small and a large request.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.db.session import SessionLocal, dispose_engine, get_async_engine, get_engine
+from app.models.database import ArticleModel, ClassificationModel
+from app.models.stance import PoliticalStance
+
+ARTICLE_COUNT = 10_000
+STANCES = (PoliticalStance.LEFT, PoliticalStance.CENTER, PoliticalStance.RIGHT)
+
+class StatementCounter:
+    """Counts statements executed on the sync and async engines."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+    def measure(self, request) -> int:
+        """Run a request and return the number of statements it executed."""
+        self.count = 0
+        response = request()
+        assert response.status_code == 200, response.text
+        return self.count
+
+def seed_articles(count: int) -> None:
+    """Insert count classified articles, half published an hour ago and half three days ago."""
+    now = datetime.utcnow()
+    articles = []
+    classifications = []
+    for number in range(count):
+        article_id = f"article-{number:05d}"
+        articles.append({
+            "id": article_id,
+            "title": f"Election policy debate {number}",
+            "description": "Lawmakers debated the policy.",
+            "content": "Lawmakers from both parties debated the election policy at length this week. " * 3,
+            "url": f"https://example.com/news/{number}",
+            "source_name": f"Source {number % 20}",
+            "published_at": now - (timedelta(hours=1) if number % 2 else timedelta(days=3)),
+            "raw_data": {},
+        })
+        classifications.append({
+            "article_id": article_id,
+            "stance": STANCES[number % len(STANCES)],
+            "confidence": 0.5,
+        })
+    db = SessionLocal()
+    try:
+        db.execute(insert(ArticleModel), articles)
+        db.execute(insert(ClassificationModel), classifications)
+        db.commit()
+    finally:
+        db.close()
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """App client on a seeded SQLite database."""
+    monkeypatch = pytest.MonkeyPatch()
+    database_path = tmp_path_factory.mktemp("db") / "articles.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{database_path}")
+    dispose_engine()
+
+    from app.main import app
+    with TestClient(app) as client:
+        seed_articles(ARTICLE_COUNT)
+        yield client
+    monkeypatch.undo()
+
+@pytest.fixture
+def statements(client):
+    """Statement counter attached to both engines for the duration of a test."""
+    counter = StatementCounter()
+    engines = (get_engine(), get_async_engine().sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", counter)
+
+def test_list_articles_query_count_is_constant(client, statements):
+    small = statements.measure(lambda: client.get("/api/v1/articles/", params={"limit": 10}))
+    large = statements.measure(lambda: client.get("/api/v1/articles/", params={"limit": 1000}))
+    filtered = statements.measure(
+        lambda: client.get("/api/v1/articles/", params={"limit": 1000, "stance": "left"})
+    )
+    assert small == large == filtered
+
+def test_saved_articles_query_count_is_constant(client, statements):
+    small = statements.measure(lambda: client.get("/api/v1/articles/saved", params={"limit": 1}))
+    large = statements.measure(lambda: client.get("/api/v1/articles/saved", params={"limit": 100}))
+    assert small == large
+
+def test_export_query_count_is_constant(client, statements):
+    small = statements.measure(lambda: client.get("/api/v1/articles/export", params={"source": "Source 1"}))
+    large = statements.measure(lambda: client.get("/api/v1/articles/export"))
+    assert small == large
+
+def test_analyze_query_count_is_constant(client, statements):
+    small = statements.measure(lambda: client.post("/api/v1/analyze/", params={"days_back": 1}))
+    large = statements.measure(lambda: client.post("/api/v1/analyze/", params={"days_back": 7}))
+    assert small == large
+
+def test_consensus_query_count_is_constant(client, statements):
+    small = statements.measure(lambda: client.get("/api/v1/consensus/", params={"topic": "election", "days_back": 1}))
+    large = statements.measure(lambda: client.get("/api/v1/consensus/", params={"topic": "election", "days_back": 7}))
+    assert small == large
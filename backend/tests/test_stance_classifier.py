@@ -0,0 +1,43 @@
+import time
+
+from app.core.stance_classifier import DEFAULT_LEXICON, StanceClassifier
+from app.models.stance import PoliticalStance
+
+def test_prefix_keyword_counts_once_across_its_variants():
+    classifier = StanceClassifier()
+    assert classifier.score("Democrats and democratic democrat") == (1.0, 0.0)
+
+def test_each_lexicon_entry_counts_once():
+    classifier = StanceClassifier({"left": {"democrat*": 1.0, "progressive*": 2.0}, "right": {"gop": 1.5}})
+    assert classifier.score("Democrats, progressives and the progressive GOP", "democratic gop") == (3.0, 1.5)
+
+def test_word_boundaries():
+    classifier = StanceClassifier()
+    assert classifier.classify("All rights reserved, copyright 2024") == (PoliticalStance.CENTER, 0.0)
+
+def test_phrases_and_prefix_phrases_take_the_longest_match():
+    classifier = StanceClassifier({"left": {"new york*": 2.0, "new": 1.0}, "right": {"york": 1.0, "white house": 3.0}})
+    assert classifier.score("New Yorkers visited the White  House") == (2.0, 3.0)
+    assert classifier.score("new and old york") == (1.0, 1.0)
+
+def test_scoring_time_does_not_depend_on_lexicon_size():
+    text = " ".join(f"word{number % 700}" for number in range(2000)) + " Democrats and the GOP"
+    padding = {f"absent{number}" + ("*" if number % 3 else ""): 1.0 for number in range(20_000)}
+    small = StanceClassifier()
+    large = StanceClassifier({
+        "left": {**DEFAULT_LEXICON["left"], **padding},
+        "right": DEFAULT_LEXICON["right"],
+    })
+
+    def best_time(classifier):
+        best = float("inf")
+        for _ in range(5):
+            classifier.word_cache = {}
+            started = time.perf_counter()
+            classifier.score(text)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    assert small.score(text) == large.score(text) == (1.0, 1.0)
+    # A scan over every keyword would be thousands of times slower with 20k more keywords
+    assert best_time(large) < 3 * best_time(small)
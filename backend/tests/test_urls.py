@@ -0,0 +1,52 @@
+"""
+Tests for URL canonicalization and the article ids derived from it.
+
+Malformed URLs (a bad port, a broken IPv6 literal) must not raise: they fall
+back to the lowercased raw URL, and one bad article must not drop the rest of
+its page in NewsClient._convert_articles.
+"""
+import pytest
+
+from app.core.urls import article_id_for_url, canonicalize_url
+from app.services.news_client import NewsClient
+
+@pytest.mark.parametrize("url, canonical", [
+    ("http://www.Example.com/news/story/", "https://example.com/news/story"),
+    ("https://example.com:443//news//story", "https://example.com/news/story"),
+    ("https://example.com:8080/story", "https://example.com:8080/story"),
+    ("example.com/story#comments", "https://example.com/story"),
+    ("https://example.com/story?b=2&utm_source=feed&a=1&fbclid=x", "https://example.com/story?a=1&b=2"),
+    ("https://example.com/story?utm_medium=email", "https://example.com/story"),
+    ("https://example.com/caf%c3%a9", "https://example.com/caf%C3%A9"),
+])
+def test_canonicalize_url(url, canonical):
+    assert canonicalize_url(url) == canonical
+
+@pytest.mark.parametrize("url", [
+    "https://Example.com:abc/Story",
+    "https://example.com:99999/story",
+    "http://[::1/story",
+])
+def test_malformed_url_falls_back_to_raw_url(url):
+    assert canonicalize_url(url) == url.lower()
+    assert article_id_for_url(url) == article_id_for_url(url.upper())
+
+def test_malformed_url_does_not_drop_page():
+    client = NewsClient(api_key="test", use_cache=False)
+    raw_articles = [
+        {
+            "url": url,
+            "title": f"Story {number}",
+            "source": {"id": None, "name": "Example"},
+            "publishedAt": "2024-04-20T05:56:56Z",
+        }
+        for number, url in enumerate([
+            "https://example.com/one",
+            "https://example.com:abc/two",
+            "http://[::1/three",
+            "https://example.com/four",
+        ])
+    ]
+    # The malformed URLs are rejected on their own by Article validation
+    articles = client._convert_articles(raw_articles)
+    assert [article.title for article in articles] == ["Story 0", "Story 3"]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark app.core.urls.canonicalize_url against its original urllib.parse version.
+Usage: python scripts/benchmarks/canonicalize_url.py --copies 3000
+The URLs of the bundled articles.json are made distinct --copies times in three
+shapes: a plain path, a single query parameter (as the convert benchmark uses), and
+a shuffled query with tracking parameters. Each is canonicalized with the original
+implementation ("before"), the new one with its cache cleared per run ("uncached",
+every URL new, as in a fresh NewsAPI response), and the new one on URLs it has just
+seen ("cached", as when the cleaner and the save path canonicalize an article again).
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+from app.core.urls import (
+    DEFAULT_PORTS, PERCENT_ESCAPE_PATTERN, REPEATED_SLASH_PATTERN, canonicalize_url, is_tracking_parameter
+)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark canonicalize_url")
+    parser.add_argument("--input", default=str(ROOT_DIR / "articles.json"), help="Collected articles JSON file")
+    parser.add_argument("--copies", type=int, default=3000, help="Distinct variants of each URL")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported)")
+    return parser.parse_args()
+
+def canonicalize_url_before(url: str) -> str:
+    """The original canonicalize_url: urlsplit, hostname/port properties, parse_qsl/urlencode and urlunsplit."""
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+    parts = urlsplit(url)
+
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port
+    if port is not None and port not in DEFAULT_PORTS:
+        host = f"{host}:{port}"
+
+    path = parts.path
+    if "//" in path:
+        path = REPEATED_SLASH_PATTERN.sub("/", path)
+    if "%" in path:
+        path = PERCENT_ESCAPE_PATTERN.sub(lambda match: match.group().upper(), path)
+    path = path.rstrip("/")
+
+    query = parts.query
+    if query:
+        query = urlencode(sorted(
+            (name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+            if not is_tracking_parameter(name)
+        ))
+
+    return urlunsplit(("https", host, path, query, ""))
+
+def load_urls(path: str, copies: int):
+    """Load the collected URLs and build the three workloads of distinct URLs."""
+    with open(path, "r", encoding="utf-8") as f:
+        urls = [record["url"] for record in json.load(f) if record.get("url")]
+    return (
+        ("plain path", [f"{url}/{copy}" for copy in range(copies) for url in urls]),
+        ("one parameter", [f"{url}?copy={copy}" for copy in range(copies) for url in urls]),
+        ("tracking", [
+            f"{url}?utm_source=newsapi&page={copy}&fbclid=abc{copy}&id=7#comments"
+            for copy in range(copies) for url in urls
+        ]),
+    )
+
+def best_time(canonicalize, urls, repeat: int, clear_cache: bool = False) -> float:
+    """Canonicalize every URL several times and return the best run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if clear_cache:
+            canonicalize_url.cache_clear()
+        started = time.perf_counter()
+        for url in urls:
+            canonicalize(url)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    """Time each variant on each workload and print the per-URL cost."""
+    args = parse_args()
+    for name, urls in load_urls(args.input, args.copies):
+        mismatches = sum(canonicalize_url_before(url) != canonicalize_url(url) for url in urls)
+        print(f"{name}: {len(urls)} URLs ({mismatches} canonicalized differently)")
+        baseline = best_time(canonicalize_url_before, urls, args.repeat) / len(urls)
+        print(f"  before:   {baseline * 1e6:6.2f} µs/URL")
+        per_url = best_time(canonicalize_url, urls, args.repeat, clear_cache=True) / len(urls)
+        print(f"  uncached: {per_url * 1e6:6.2f} µs/URL ({baseline / per_url:.2f}x)")
+
+        # As many URLs as the cache holds, all just canonicalized
+        recent = urls[:canonicalize_url.cache_info().maxsize]
+        for url in recent:
+            canonicalize_url(url)
+        per_url = best_time(canonicalize_url, recent, args.repeat) / len(recent)
+        print(f"  cached:   {per_url * 1e6:6.2f} µs/URL ({baseline / per_url:.2f}x)")
+
+if __name__ == "__main__":
+    sys.exit(main())
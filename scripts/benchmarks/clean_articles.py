@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataCleaner.clean_articles on a large batch, inline and on the cleaning pool.
+Usage: python scripts/benchmarks/clean_articles.py --copies 15000 --workers 1 2 4
+The articles of the bundled articles.json are replicated with distinct ids, URLs and
+titles (half of them with extra markup), then cleaned with the original serial
+in-place loop ("before"), inline, and across a process pool of each --workers size.
+Pool speedups are only meaningful up to the number of usable CPUs, which is printed
+first; larger pools share those CPUs. A pool size of 1 is timed with
+CLEANING_WORKERS=1, which DataCleaner cleans inline.
+Duplicates are dropped by id only, as in the app; --duplicate-titles also drops
+repeated cleaned titles.
+Near-duplicate detection is off by default, as in the app. The replicas are near
+duplicates of each other, so with --near-duplicates (and --near-duplicate-threshold
+above 0) only one article per original is kept, and the cost of fingerprinting shows.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+from app.core.config import settings
+from app.core.data_cleaner import DataCleaner
+from app.models.article import Article
+
+# Extra markup so the tag and entity paths are exercised as in scraped content
+SAMPLE_MARKUP = ' <p class="lead">Officials&nbsp;said &quot;no&quot; &#8212; <a href="#">again</a></p>\n\n'
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark DataCleaner.clean_articles")
+    parser.add_argument("--input", default=str(ROOT_DIR / "articles.json"), help="Collected articles JSON file")
+    parser.add_argument("--copies", type=int, default=15000, help="Times each article is replicated")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[len(os.sched_getaffinity(0))],
+        help="Process pool sizes to time"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per variant (best is reported)")
+    parser.add_argument(
+        "--near-duplicates", action="store_true", default=settings.CLEANING_NEAR_DUPLICATES,
+        help="Also drop near duplicates while cleaning"
+    )
+    parser.add_argument(
+        "--near-duplicate-threshold", type=float, default=settings.NEAR_DUPLICATE_THRESHOLD,
+        help="MinHash similarity at which articles are dropped as near duplicates (0 = off)"
+    )
+    parser.add_argument(
+        "--duplicate-titles", action="store_true", default=settings.CLEANING_DUPLICATE_TITLES,
+        help="Also drop repeated cleaned titles"
+    )
+    return parser.parse_args()
+
+def load_articles(path: str, copies: int):
+    """Load the collected articles and replicate them as distinct Article objects."""
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    articles = []
+    for copy in range(copies):
+        markup = SAMPLE_MARKUP if copy % 2 else ""
+        for record in records:
+            articles.append(Article.model_validate({
+                **record,
+                "id": f"{record['id']}-{copy}",
+                "url": f"{record['url']}?copy={copy}",
+                "title": f"{record['title']} #{copy}{markup}",
+                "content": (record.get("content") or "") + markup,
+            }))
+    return articles
+
+def clean_articles_before(cleaner: DataCleaner, articles):
+    """The original clean_articles: serial, id-only dedup, mutating the articles in place."""
+    cleaned_articles = []
+    seen_ids = set()
+    for article in articles:
+        if article.id in seen_ids:
+            continue
+        cleaned_title = cleaner.clean_text(article.title)
+        cleaned_description = cleaner.clean_text(article.description or '')
+        cleaned_content = cleaner.clean_text(article.content or '')
+        if not cleaned_title:
+            continue
+        article.title = cleaned_title
+        article.description = cleaned_description
+        article.content = cleaned_content
+        cleaned_articles.append(article)
+        seen_ids.add(article.id)
+    return cleaned_articles
+
+def best_time(clean, make_input, repeat: int):
+    """Run a cleaning variant several times on fresh input and return (best seconds, kept count)."""
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        articles = make_input()
+        started = time.perf_counter()
+        count = len(clean(articles))
+        best = min(best, time.perf_counter() - started)
+    return best, count
+
+def main():
+    """Time each variant and print the per-article cost."""
+    args = parse_args()
+    articles = load_articles(args.input, args.copies)
+    cleaner = DataCleaner()
+    settings.CLEANING_NEAR_DUPLICATES = args.near_duplicates
+    settings.NEAR_DUPLICATE_THRESHOLD = args.near_duplicate_threshold
+    settings.CLEANING_DUPLICATE_TITLES = args.duplicate_titles
+    near_duplicates = f"threshold {args.near_duplicate_threshold}" if args.near_duplicates else "off"
+    print(
+        f"{len(articles)} articles, {len(os.sched_getaffinity(0))} usable CPUs, "
+        f"near-duplicate detection {near_duplicates}, duplicate titles {'on' if args.duplicate_titles else 'off'}"
+    )
+
+    # Both versions write the cleaned text back, so every run gets fresh copies
+    fresh = lambda: [article.model_copy() for article in articles]
+    seconds, count = best_time(lambda batch: clean_articles_before(cleaner, batch), fresh, args.repeat)
+    baseline = seconds / len(articles)
+    print(f"before:      {baseline * 1e6:6.2f} µs/article ({count} kept)")
+
+    variants = [("inline", "inline", 1)] + [(f"process x{workers}", "process", workers) for workers in args.workers]
+    for label, executor, workers in variants:
+        settings.CLEANING_EXECUTOR = executor
+        settings.CLEANING_WORKERS = workers
+        try:
+            if DataCleaner.get_executor() is not None:
+                # Start the workers outside the timed runs
+                list(DataCleaner.get_executor().map(abs, range(workers)))
+            seconds, count = best_time(cleaner.clean_articles, fresh, args.repeat)
+        finally:
+            DataCleaner.shutdown_executor()
+        per_article = seconds / len(articles)
+        print(f"{label + ':':12} {per_article * 1e6:6.2f} µs/article ({count} kept, {baseline / per_article:.2f}x)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark clean_text over the texts of the bundled articles.json.
+Usage: python scripts/benchmarks/clean_text.py --copies 2000
+Every title, description and content in the file (three calls per article, as in
+clean_articles) is cleaned with the original implementation ("before") and the
+module-level clean_text that clean_batch calls ("after"), once as collected and
+once with SAMPLE_MARKUP appended; the best of --repeat runs is reported per call.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+from app.core.data_cleaner import clean_text
+
+# Extra markup so the tag and entity paths are exercised as in scraped content
+SAMPLE_MARKUP = ' <p class="lead">Officials&nbsp;said &quot;no&quot; &#8212; <a href="#">again</a></p>\n\n'
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark clean_text")
+    parser.add_argument("--input", default=str(ROOT_DIR / "articles.json"), help="Collected articles JSON file")
+    parser.add_argument("--copies", type=int, default=2000, help="Times the texts are replicated")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported)")
+    return parser.parse_args()
+
+def clean_text_before(text: str) -> str:
+    """The original clean_text: uncompiled regexes, five replace passes, literal '\\s+' pattern."""
+    if not text:
+        return ""
+    text = re.sub(r'<.*?>', '', text)
+    text = text.replace('&amp;', '&')
+    text = text.replace('&lt;', '<')
+    text = text.replace('&gt;', '>')
+    text = text.replace('&quot;', '"')
+    text = text.replace('&#39;', "'")
+    text = re.sub(r'\\s+', ' ', text)
+    return text.strip()
+
+def load_texts(path: str, copies: int):
+    """Load title, description and content of every article, replicated `copies` times."""
+    with open(path, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    texts = [article.get(field) or "" for article in articles for field in ("title", "description", "content")]
+    return texts * copies
+
+def best_time(clean, texts, repeat: int) -> float:
+    """Return the best wall time of cleaning every text, over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            clean(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    """Time both implementations and print the per-call cost."""
+    args = parse_args()
+    texts = load_texts(args.input, args.copies)
+    print(f"{len(texts)} texts ({len(texts) // 3} articles)")
+
+    for label, sample in (("as collected", texts), ("with markup", [text + SAMPLE_MARKUP for text in texts])):
+        before = best_time(clean_text_before, sample, args.repeat) / len(sample)
+        after = best_time(clean_text, sample, args.repeat) / len(sample)
+        print(f"{label}: before {before * 1e6:6.2f} µs/call, after {after * 1e6:6.2f} µs/call ({before / after:.2f}x)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark NewsClient's multi-page fetch against a local NewsAPI stub server.
+Usage: python scripts/benchmarks/fetch_pages.py --total 1000 --page-size 100 --latency 0.2
+The stub serves /v2/everything and /v2/top-headlines with synthetic articles and a
+fixed per-request latency. All pages are fetched through
+NewsClient.iter_articles_by_topic with concurrency 1 and with --concurrency, and both
+timings and article counts are printed.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "backend"))
+
+from app.services.news_client import NewsClient
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent NewsAPI page fetching")
+    parser.add_argument("--total", type=int, default=1000, help="totalResults reported by the stub")
+    parser.add_argument("--page-size", type=int, default=100, help="Number of articles per page")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds the stub waits before each response")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent page requests")
+    return parser.parse_args()
+
+def make_stub_handler(total: int, latency: float):
+    """Build a request handler class serving `total` synthetic articles."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            query = parse_qs(parsed.query)
+            if parsed.path not in ("/v2/everything", "/v2/top-headlines"):
+                self.send_error(404)
+                return
+
+            page = int(query.get("page", ["1"])[0])
+            page_size = int(query.get("pageSize", ["100"])[0])
+            start = (page - 1) * page_size
+            articles = [
+                {
+                    "source": {"id": "stub", "name": "Stub News"},
+                    "author": "Stub Author",
+                    "title": f"Article {n}",
+                    "description": f"Description of article {n}",
+                    "url": f"https://stub.example.com/articles/{n}",
+                    "urlToImage": None,
+                    "publishedAt": "2025-04-20T05:56:56Z",
+                    "content": f"Content of article {n}"
+                }
+                for n in range(start, min(start + page_size, total))
+            ]
+
+            time.sleep(latency)
+            body = json.dumps({"status": "ok", "totalResults": total, "articles": articles}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+async def fetch_all(client: NewsClient, page_size: int, concurrency: int) -> int:
+    """Fetch every page through the paginated API and count the articles."""
+    count = 0
+    async for _article in client.iter_articles_by_topic(
+        "benchmark", page_size=page_size, max_concurrency=concurrency
+    ):
+        count += 1
+    return count
+
+def main():
+    """Start the stub server and compare sequential and concurrent fetching."""
+    args = parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_stub_handler(args.total, args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # Without the response cache, so the concurrent run requests every page again instead of reading cached ones
+    client = NewsClient(
+        api_key="stub", base_url=f"http://127.0.0.1:{server.server_address[1]}/v2", use_cache=False
+    )
+    pages = -(-args.total // args.page_size)
+
+    try:
+        started = time.perf_counter()
+        # Concurrency 1 fetches one page at a time, as callers had to before
+        sequential_count = asyncio.run(fetch_all(client, args.page_size, 1))
+        sequential_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        concurrent_count = asyncio.run(fetch_all(client, args.page_size, args.concurrency))
+        concurrent_time = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    print(f"{pages} pages of {args.page_size}, {args.latency:.3f}s latency per request")
+    print(f"sequential: {sequential_count} articles in {sequential_time:.3f}s")
+    print(f"concurrent: {concurrent_count} articles in {concurrent_time:.3f}s (concurrency {args.concurrency})")
+    if sequential_count != args.total or concurrent_count != args.total:
+        print(f"❌ Expected {args.total} articles")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
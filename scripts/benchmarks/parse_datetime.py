@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark app.core.datetimes.parse_datetime against the parser it replaced.
+Usage: python scripts/benchmarks/parse_datetime.py --copies 2000
+The publishedAt strings of the bundled articles.json are parsed --copies times
+each (the repetition a batch of pages sees), then a mix of other shapes
+(fractional seconds, offsets, dates, RFC 2822) that the original only reached
+after several failed strptime formats. Each is timed with the original
+endpoint parser ("before"), the new parser with its cache cleared per run
+("uncached"), and the new parser as used ("cached").
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "backend"))
+
+from app.core.datetimes import _parse_string, parse_datetime
+
+# Shapes seen from other feeds and hand-written imports
+MIXED_SHAPES = [
+    "2024-04-20T05:56:56Z",
+    "2024-04-20T05:56:56.123Z",
+    "2024-04-20T05:56:56.123456+00:00",
+    "2024-04-20T07:56:56+02:00",
+    "2024-04-20 05:56:56",
+    "2024-04-20",
+    "Sat, 20 Apr 2024 05:56:56 GMT",
+    "Sat, 20 Apr 2024 01:56:56 -0400",
+    "20 Apr 2024 05:56:56 GMT",
+]
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark parse_datetime")
+    parser.add_argument("--input", default=str(ROOT_DIR / "articles.json"), help="Collected articles JSON file")
+    parser.add_argument("--copies", type=int, default=2000, help="Times each timestamp is parsed")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant (best is reported)")
+    return parser.parse_args()
+
+def parse_datetime_before(date_str: str) -> datetime:
+    """The original articles.py parser: strptime over a list of formats, then fromisoformat."""
+    if not date_str:
+        return datetime.utcnow()
+    formats = [
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S.%f",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d",
+    ]
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    try:
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1] + '+00:00'
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    return datetime.utcnow()
+
+def load_timestamps(path: str):
+    """Load the publishedAt strings of the collected articles."""
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    return [record["published_at"] for record in records if record.get("published_at")]
+
+def best_time(parse, values, repeat: int, clear_cache: bool = False) -> float:
+    """Parse every value several times and return the best run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if clear_cache:
+            _parse_string.cache_clear()
+        started = time.perf_counter()
+        for value in values:
+            parse(value)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    """Time each variant on each workload and print the per-call cost."""
+    args = parse_args()
+    # Uncached runs see every distinct value once, as a stream of fresh timestamps would
+    workloads = (
+        ("collected", load_timestamps(args.input)),
+        ("mixed", MIXED_SHAPES),
+    )
+    for name, distinct in workloads:
+        values = distinct * args.copies
+        print(f"{name}: {len(distinct)} distinct timestamps x {args.copies}")
+        baseline = best_time(parse_datetime_before, values, args.repeat) / len(values)
+        print(f"  before:   {baseline * 1e6:6.2f} µs/call")
+        seconds = best_time(parse_datetime, distinct, args.repeat * 50, clear_cache=True)
+        per_call = seconds / len(distinct)
+        print(f"  uncached: {per_call * 1e6:6.2f} µs/call ({baseline / per_call:.2f}x)")
+        per_call = best_time(parse_datetime, values, args.repeat) / len(values)
+        print(f"  cached:   {per_call * 1e6:6.2f} µs/call ({baseline / per_call:.2f}x)")
+
+if __name__ == "__main__":
+    sys.exit(main())
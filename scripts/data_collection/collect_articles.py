@@ -2,24 +2,32 @@
 """
 Script to collect news articles on political topics and save them to a file.
 Usage: python collect_articles.py --topic "healthcare reform" --output articles.json
+       python collect_articles.py --topic "healthcare reform" --output articles.json --incremental
+With --incremental, the newest published_at collected per topic is kept in a state
+file; later runs only request newer articles (all pages) and append them to the output.
+A run that leaves articles out (--max-results, NewsAPI's result limit or a failed page)
+keeps the watermark, and the next runs fetch what is still missing.
+With --format jsonl (optionally --gzip or a .gz output), each article is written as one
+line as soon as it is converted; read such files back with app.core.article_files.iter_records.
 Entry point of the app -> main script for collecting news articles
 """
 import argparse
+import asyncio
 import json
 import logging
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
-from pydantic import HttpUrl
+from typing import Optional
 
 # # Add the backend directory to sys.path to import the app modules
 # root_path = str(Path(__file__).resolve().parent.parent.parent)
 # sys.path.insert(0, root_path)
 
-from backend.app.services.news_client import NewsClient
-from backend.app.models.article import Article
-from backend.app.core.config import settings
+from backend.app.core.article_files import JsonlWriter, article_to_record, is_gzip_path, open_text
+from backend.app.core.datetimes import to_naive_utc
+from backend.app.services.news_client import FetchReport, NewsClient
 
 # Configure logging
 logging.basicConfig(
@@ -40,8 +48,169 @@ def parse_args():
     parser.add_argument("--headlines", action="store_true", help="Get top headlines instead of searching by topic")
     parser.add_argument("--category", default="politics", help="Category for top headlines")
     parser.add_argument("--country", default="us", help="Country code for top headlines")
+    parser.add_argument("--format", choices=["json", "jsonl"], default="json", help="Output format: JSON array or streamed JSON Lines")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the output (implied by a .gz output path)")
+    parser.add_argument("--incremental", action="store_true", help="Only collect articles newer than the last run and append them")
+    parser.add_argument("--state-file", help="Watermark state file for --incremental (default: <output>.state.json)")
+    parser.add_argument("--max-results", type=int, help="Maximum number of results per run with --incremental")
     return parser.parse_args()
 
+def source_key(args) -> str:
+    """Key of the collected topic or headline category in the state file."""
+    if args.headlines:
+        return f"category:{args.category}:{args.country}"
+    return f"topic:{args.topic}"
+
+def load_state(path: Path) -> dict:
+    """
+    Load the watermark state file, or an empty state.
+
+    Each source maps to {"published_at", "ids"}: the watermark and the ids
+    collected at it. After an incomplete run the entry also has "newest" (the
+    same for the newest article seen), "collected" (ids written above the
+    watermark) and, for topics, "until" (the newest time still missing).
+    """
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_state(path: Path, state: dict):
+    """Write the watermark state file atomically."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+def is_new(article, watermark: datetime, seen_ids: set) -> bool:
+    """Whether an article is newer than the watermark (or at it but not yet collected)."""
+    return article.published_at > watermark or (
+        article.published_at == watermark and article.id not in seen_ids
+    )
+
+def watermark_entry(entry: Optional[dict]) -> Optional[dict]:
+    """The {"published_at", "ids"} watermark of a state entry, or None before the first complete run."""
+    if not entry or not entry.get("published_at"):
+        return None
+    return {"published_at": entry["published_at"], "ids": entry["ids"]}
+
+def advance_watermark(entry: dict, article) -> dict:
+    """Return the state entry after collecting one more article (newer than entry's watermark)."""
+    if entry:
+        watermark = datetime.fromisoformat(entry["published_at"])
+        if article.published_at < watermark:
+            return entry
+        if article.published_at == watermark:
+            return {"published_at": entry["published_at"], "ids": entry["ids"] + [article.id]}
+    return {"published_at": article.published_at.isoformat(), "ids": [article.id]}
+
+async def collect_since(client, args, entry, sink) -> dict:
+    """
+    Pass every article newer than the state entry's watermark to `sink` as pages arrive.
+
+    Requests all pages from the watermark onwards, newest first (from
+    --days-back ago on the first run), and returns the next state entry. Only
+    a complete fetch advances the watermark, to the newest article seen. When
+    --max-results, NewsAPI's result limit or a failed page leave articles
+    out, the watermark is kept and the entry records the newest article seen
+    and the ids already written, so the next run does not append them again.
+    A truncated topic fetch also records the oldest article fetched as
+    "until": topics are fetched newest first, so the next run only requests
+    the older articles still missing.
+    """
+    watermark = datetime.fromisoformat(entry["published_at"]) if watermark_entry(entry) else None
+    seen_ids = set(entry["ids"]) if watermark else set()
+    until = datetime.fromisoformat(entry["until"]) if entry and entry.get("until") else None
+    collected = set(entry.get("collected", [])) if entry else set()
+    newest = (entry or {}).get("newest") or watermark_entry(entry)
+    report = FetchReport()
+    if args.headlines:
+        articles = client.iter_top_headlines(
+            category=args.category,
+            country=args.country,
+            page_size=args.page_size,
+            max_results=args.max_results,
+            report=report
+        )
+    else:
+        since = watermark or datetime.now(UTC) - timedelta(days=args.days_back)
+        articles = client.iter_articles_by_topic(
+            topic=args.topic,
+            language=args.language,
+            page_size=args.page_size,
+            max_results=args.max_results,
+            since=to_naive_utc(since),
+            until=to_naive_utc(until) if until else None,
+            report=report
+        )
+
+    oldest = None
+    async for article in articles:
+        if watermark is not None and not is_new(article, watermark, seen_ids):
+            continue
+        if (until is not None and article.published_at > until) or article.id in collected:
+            continue
+        sink(article)
+        collected.add(article.id)
+        newest = advance_watermark(newest, article)
+        oldest = article.published_at if oldest is None else min(oldest, article.published_at)
+
+    if report.complete:
+        return newest
+
+    if report.truncated and not report.failed_pages and not args.headlines and oldest is not None:
+        until = oldest
+    logger.warning(
+        f"Incomplete fetch (truncated={report.truncated}, failed pages={report.failed_pages}); "
+        "keeping the watermark, run again to collect the rest"
+    )
+    kept = watermark_entry(entry) or {"published_at": None, "ids": []}
+    return {
+        **kept,
+        "until": until.isoformat() if until else None,
+        "newest": newest,
+        "collected": sorted(collected),
+    }
+
+def append_json_array(path: Path, articles_data: list):
+    """
+    Append items to the JSON array in `path` without reading or rewriting the existing items.
+
+    Seeks back over the closing bracket and writes the new items after the last one.
+    """
+    with open(path, "rb+") as f:
+        # Find the closing bracket, skipping trailing whitespace
+        position = f.seek(0, os.SEEK_END)
+        char = b""
+        while position > 0:
+            position -= 1
+            f.seek(position)
+            char = f.read(1)
+            if not char.isspace():
+                break
+        if char != b"]":
+            raise ValueError(f"{path} does not contain a JSON array")
+
+        # Check whether the array is empty
+        before = position
+        previous = b""
+        while before > 0:
+            before -= 1
+            f.seek(before)
+            previous = f.read(1)
+            if not previous.isspace():
+                break
+        empty = previous == b"["
+
+        body = ",\n".join(
+            "  " + json.dumps(article, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            for article in articles_data
+        )
+        # Overwrite from just after the last item (or the opening bracket)
+        f.seek(before + 1)
+        f.truncate()
+        f.write((("\n" if empty else ",\n") + body + "\n]").encode("utf-8"))
+
 def main():
     """Main entry point for the script."""
     args = parse_args()
@@ -53,6 +222,16 @@ def main():
         logger.error(f"Error creating News API client: {e}")
         return 1
     
+    output_path = Path(args.output)
+    jsonl = args.format == "jsonl"
+    compress = args.gzip or is_gzip_path(output_path)
+    
+    # Create directory if it doesn't exist
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if args.incremental:
+        return collect_incremental(client, args, output_path, jsonl, compress)
+    
     # Get articles
     if args.headlines:
         logger.info(f"Getting top headlines in {args.category} for {args.country}")
@@ -76,33 +255,63 @@ def main():
         logger.warning("No articles found")
         return 0
     
-    # Save articles to output file
-    output_path = Path(args.output)
-    
-    # Create directory if it doesn't exist
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if jsonl:
+        # The single requested page is already in memory; records are converted one line at a time
+        with JsonlWriter(output_path, compress=compress) as writer:
+            writer.write_all(articles)
+    else:
+        # model_dump(mode="json") converts datetime and HttpUrl objects to strings in the same pass
+        # (JSON can't natively serialize them)
+        with open_text(output_path, "w", compress) as f:
+            json.dump([article_to_record(article) for article in articles], f, ensure_ascii=False, indent=2)
     
-    #pydantic v2: model_dump() -> converts Pydantic model to a dictionary (replaces older .dict() method)
-    articles_data = [article.model_dump() for article in articles]
+    logger.info(f"Saved {len(articles)} articles to {output_path}")
+    return 0
+
+def collect_incremental(client, args, output_path: Path, jsonl: bool, compress: bool) -> int:
+    """Collect articles newer than the last run, append them to the output and advance the watermark."""
+    state_path = Path(args.state_file or f"{args.output}.state.json")
+    state = load_state(state_path)
+    entry = state.get(source_key(args))
+    logger.info(
+        f"Collecting articles for {source_key(args)} published since "
+        f"{entry['published_at'] if entry else f'{args.days_back} days ago'}"
+    )
     
-    # Convert datetime and HttpUrl objects -> converting all model fields/keys to strings(their basic Python types)
-    # This converts special types to strings because:
-    # JSON can't natively serialize datetime or HttpUrl objects
-    # We need plain strings for JSON storage
-    for article in articles_data:
-        if isinstance(article["published_at"], datetime):
-            article["published_at"] = article["published_at"].isoformat()
-        if isinstance(article["url"], HttpUrl):
-            article["url"] = str(article["url"])
-        if article["url_to_image"] and isinstance(article["url_to_image"], HttpUrl):
-            article["url_to_image"] = str(article["url_to_image"])
+    if jsonl:
+        # Stream each new article straight into the file as its page arrives
+        with JsonlWriter(output_path, append=True, compress=compress) as writer:
+            new_entry = asyncio.run(collect_since(client, args, entry, writer.write))
+            count = writer.count
+    else:
+        articles = []
+        new_entry = asyncio.run(collect_since(client, args, entry, articles.append))
+        count = len(articles)
+        if articles:
+            articles_data = [article_to_record(article) for article in articles]
+            if output_path.exists() and output_path.stat().st_size > 0 and not compress:
+                append_json_array(output_path, articles_data)
+            elif output_path.exists() and output_path.stat().st_size > 0:
+                # A compressed array cannot be appended in place; rewrite it
+                with open_text(output_path, "r", compress) as f:
+                    articles_data = json.load(f) + articles_data
+                with open_text(output_path, "w", compress) as f:
+                    json.dump(articles_data, f, ensure_ascii=False, indent=2)
+            else:
+                with open_text(output_path, "w", compress) as f:
+                    json.dump(articles_data, f, ensure_ascii=False, indent=2)
     
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(articles_data, f, ensure_ascii=False, indent=2)
+    if count:
+        logger.info(f"Appended {count} new articles to {output_path}")
+    else:
+        logger.warning("No new articles found")
     
-    logger.info(f"Saved {len(articles)} articles to {output_path}")
+    # Record the watermark only once the articles are written (a run that only
+    # finds a gap empty still advances it)
+    if new_entry and new_entry != entry:
+        state[source_key(args)] = new_entry
+        save_state(state_path, state)
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Script to bulk import collected article files into the database.
+Usage: python scripts/data_collection/import_articles.py articles.json archive/*.jsonl.gz --batch-size 5000
+Reads JSON arrays and JSON Lines files (optionally gzip-compressed) as streams and
+loads them with PostgreSQL COPY (batched executemany on other databases), skipping
+articles whose URL is already stored, then fingerprints the new articles for
+near-duplicate detection. Uses DATABASE_URL like the API server.
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add the backend directory to sys.path to import the app modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "backend"))
+
+from app.core.article_files import iter_records
+from app.core.config import settings
+from app.db.init_db import init_db
+from app.db.session import SessionLocal
+from app.services.article_import import ArticleImporter
+from app.services.article_service import ArticleService
+
+try:
+    # Raised directly by the COPY path, which uses the raw psycopg connection
+    from psycopg import Error as DriverError
+except ImportError:  # PostgreSQL driver not installed (e.g. SQLite databases)
+    DriverError = SQLAlchemyError
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Bulk import collected articles into the database")
+    parser.add_argument("files", nargs="+", help="Article files (.json, .jsonl, optionally .gz)")
+    parser.add_argument("--batch-size", type=int, default=ArticleImporter.BATCH_SIZE, help="Articles per COPY batch and commit")
+    parser.add_argument("--skip-fingerprints", action="store_true", help="Do not compute near-duplicate signatures after importing")
+    return parser.parse_args()
+
+def main():
+    """Main entry point for the script."""
+    args = parse_args()
+    try:
+        init_db()
+    except SQLAlchemyError as e:
+        logger.error(f"Could not initialize the database: {e}")
+        return 1
+
+    totals = {"saved": 0, "skipped": 0, "errored": 0}
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        for path in args.files:
+            logger.info(f"Importing {path}")
+            file_started = time.perf_counter()
+
+            def report(progress):
+                processed = sum(progress.values())
+                rate = processed / max(time.perf_counter() - file_started, 1e-9)
+                logger.info(
+                    f"{path}: {processed} processed ({progress['saved']} saved, {progress['skipped']} skipped, "
+                    f"{progress['errored']} errored), {rate:.0f} articles/s"
+                )
+
+            result = ArticleImporter.import_records(db, iter_records(path), args.batch_size, on_batch=report)
+            for status in totals:
+                totals[status] += result[status]
+
+        if settings.NEAR_DUPLICATE_THRESHOLD > 0 and not args.skip_fingerprints:
+            logger.info("Fingerprinting imported articles for near-duplicate detection")
+            fingerprinted = ArticleService.index_near_duplicates(db)
+            logger.info(f"Fingerprinted {fingerprinted} articles")
+    except (OSError, ValueError) as e:
+        logger.error(f"Import failed: {e}")
+        return 1
+    except (SQLAlchemyError, DriverError) as e:
+        logger.error(f"Import failed with a database error: {e}")
+        return 1
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Imported {sum(totals.values())} articles in {elapsed:.1f}s: "
+        f"{totals['saved']} saved, {totals['skipped']} skipped, {totals['errored']} errored"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Script to run the background ingestion scheduler outside the API server.
+Usage: python scripts/data_collection/run_ingestion.py --topics "healthcare reform,tariffs" --categories politics
+       python scripts/data_collection/run_ingestion.py --once
+Polls each topic and category on an interval (INGESTION_* settings by default),
+saving only articles newer than each source's watermark. Use this instead of
+INGESTION_ENABLED when the API runs with several worker processes.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add the backend directory to sys.path to import the app modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "backend"))
+
+from app.core.config import settings
+from app.db.init_db import init_db
+from app.services.ingestion import IngestionScheduler, IngestionSource
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Continuously ingest news articles into the database")
+    parser.add_argument("--topics", default=settings.INGESTION_TOPICS, help="Comma-separated topics to search for")
+    parser.add_argument("--categories", default=settings.INGESTION_CATEGORIES, help="Comma-separated headline categories")
+    parser.add_argument("--country", default=settings.INGESTION_COUNTRY, help="Country code for top headlines")
+    parser.add_argument("--interval", type=float, default=settings.INGESTION_INTERVAL, help="Seconds between polls of each source")
+    parser.add_argument("--max-results", type=int, default=settings.INGESTION_MAX_RESULTS, help="Maximum results per poll")
+    parser.add_argument("--once", action="store_true", help="Poll every source once and exit")
+    return parser.parse_args()
+
+async def run(scheduler: IngestionScheduler, once: bool):
+    """Run the scheduler once or until interrupted."""
+    if once:
+        stats = await scheduler.run_once()
+        print(json.dumps(stats, indent=2))
+        return
+
+    scheduler.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await scheduler.stop()
+
+def main():
+    """Main function to run the ingestion scheduler."""
+    args = parse_args()
+    sources = [IngestionSource("topic", topic.strip()) for topic in args.topics.split(",") if topic.strip()]
+    sources += [
+        IngestionSource("category", category.strip(), args.country or None)
+        for category in args.categories.split(",") if category.strip()
+    ]
+    if not sources:
+        logger.error("No topics or categories to ingest")
+        return 1
+
+    init_db()
+    scheduler = IngestionScheduler(sources, interval=args.interval, max_results=args.max_results)
+    try:
+        asyncio.run(run(scheduler, args.once))
+    except KeyboardInterrupt:
+        logger.info("Interrupted")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())